@@ -0,0 +1,169 @@
+import random
+import time
+import numpy as np
+from sudoku_evaluador import EvaluadorIncremental, contar_conflictos
+from sudoku_propagacion import Propagador
+from sudoku_tabu_search import SudokuTabu, SUDOKU_EJEMPLO
+
+# Tablero relleno al azar y lista de movimientos fijos para ambos evaluadores
+def preparar_sudoku(semilla, iteraciones, vecinos=50):
+    rng = np.random.default_rng(semilla)
+    tablero = np.array(SUDOKU_EJEMPLO)
+    vacias = [(i, j) for i in range(9) for j in range(9) if tablero[i, j] == 0]
+    for (i, j) in vacias:
+        tablero[i, j] = rng.integers(1, 10)
+    muestras = [
+        [[vacias[k] for k in rng.choice(len(vacias), 2, replace=False)] for _ in range(vecinos)]
+        for _ in range(iteraciones)
+    ]
+    return tablero, muestras
+
+# Esquema anterior: copia del tablero y recuento completo por vecino
+def iterar_recuento(tablero, muestras):
+    tablero = tablero.copy()
+    for pares in muestras:
+        vecinos = []
+        for (i1, j1), (i2, j2) in pares:
+            vecino = tablero.copy()
+            vecino[i1, j1], vecino[i2, j2] = vecino[i2, j2], vecino[i1, j1]
+            vecinos.append((vecino, contar_conflictos(vecino)))
+        tablero = min(vecinos, key=lambda x: x[1])[0]
+    return contar_conflictos(tablero)
+
+# Esquema incremental: delta O(1) por vecino y un único intercambio aplicado
+def iterar_incremental(tablero, muestras):
+    evaluador = EvaluadorIncremental(tablero.copy())
+    for pares in muestras:
+        candidatos = [
+            ((i1, j1, i2, j2), evaluador.delta_intercambio(i1, j1, i2, j2))
+            for (i1, j1), (i2, j2) in pares
+        ]
+        evaluador.aplicar_intercambio(*min(candidatos, key=lambda x: x[1])[0])
+    return evaluador.conflictos
+
+def medir(funcion, *args):
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return resultado, time.perf_counter() - inicio
+
+def benchmark_evaluador(iteraciones=200, semilla=0):
+    tablero, muestras = preparar_sudoku(semilla, iteraciones)
+    conf_recuento, t_recuento = medir(iterar_recuento, tablero, muestras)
+    conf_incremental, t_incremental = medir(iterar_incremental, tablero, muestras)
+    # Ambos esquemas deben recorrer la misma trayectoria
+    if conf_recuento != conf_incremental:
+        raise RuntimeError(f"Trayectorias distintas: {conf_recuento} != {conf_incremental}")
+    print(f"Sudoku, {iteraciones} iteraciones x 50 vecinos")
+    print(f"  recuento completo: {iteraciones / t_recuento:10.1f} it/s")
+    print(f"  incremental:       {iteraciones / t_incremental:10.1f} it/s")
+    print(f"  aceleración:       {t_recuento / t_incremental:10.1f}x")
+
+# Costo por iteración de la evaluación escalar frente a la evaluación por lotes
+def benchmark_lotes(iteraciones=300, semilla=0, tamanos=(50, 500, 2000)):
+    print(f"Sudoku, costo por iteración de búsqueda tabú ({iteraciones} iteraciones)")
+    configuraciones = [("incremental", 50)] + [("lotes", k) for k in tamanos]
+    for modo, vecinos in configuraciones:
+        juego = SudokuTabu(SUDOKU_EJEMPLO, modo=modo, vecinos=vecinos, semilla=semilla)
+        juego.max_iteraciones = iteraciones
+        _, segundos = medir(juego.resolver)
+        print(f"  {modo:<11} K={vecinos:<5} {1e6 * segundos / max(juego.iteracion_actual, 1):8.1f} us/it"
+              f"  conflictos={juego.mejor_conflictos}")
+
+# Iteraciones hasta resolver y tiempo por modelo de inicialización y movimiento
+def benchmark_modelos(semillas=range(10), max_iteraciones=2000):
+    print(f"Sudoku, modelos de movimiento ({len(semillas)} semillas, máx. {max_iteraciones} iteraciones)")
+    for modelo in ("libre", "filas", "cajas"):
+        resueltos, iteraciones, segundos = 0, [], 0.0
+        for semilla in semillas:
+            juego = SudokuTabu(SUDOKU_EJEMPLO, modelo=modelo, semilla=semilla)
+            juego.max_iteraciones = max_iteraciones
+            resuelto, t = medir(juego.resolver)
+            segundos += t
+            if resuelto:
+                resueltos += 1
+                iteraciones.append(juego.iteracion_actual)
+        media = f"{np.mean(iteraciones):8.1f}" if iteraciones else "       -"
+        print(f"  {modelo:<6} resueltos {resueltos}/{len(semillas)}  iteraciones medias {media}"
+              f"  tiempo medio {1000 * segundos / len(semillas):8.1f} ms")
+
+# Sudoku N²×N² resuelto (patrón base con filas, columnas y dígitos permutados)
+# del que se conservan `pistas` celdas al azar
+def generar_sudoku(tam_caja=3, pistas=None, semilla=0):
+    rng = random.Random(semilla)
+    n = tam_caja * tam_caja
+    def permutar_grupos():
+        grupos = rng.sample(range(tam_caja), tam_caja)
+        return [g * tam_caja + k for g in grupos for k in rng.sample(range(tam_caja), tam_caja)]
+    filas, columnas = permutar_grupos(), permutar_grupos()
+    digitos = rng.sample(range(1, n + 1), n)
+    patron = lambda r, c: (tam_caja * (r % tam_caja) + r // tam_caja + c) % n
+    tablero = [[digitos[patron(r, c)] for c in columnas] for r in filas]
+    pistas = n * n // 2 if pistas is None else pistas
+    for celda in rng.sample(range(n * n), n * n - pistas):
+        tablero[celda // n][celda % n] = 0
+    return tablero
+
+# Memoria por tablero y costo por iteración según el tamaño del Sudoku
+def benchmark_tamanos(iteraciones=200, semilla=0):
+    print(f"Sudoku N²×N², modelo por filas ({iteraciones} iteraciones)")
+    for tam_caja in (3, 4, 5):
+        n = tam_caja * tam_caja
+        juego = SudokuTabu(generar_sudoku(tam_caja, pistas=n * n * 2 // 5, semilla=semilla), modelo="filas",
+                           semilla=semilla)
+        juego.max_iteraciones = iteraciones
+        _, segundos = medir(juego.resolver)
+        print(f"  {n:2d}×{n:<2d} {juego.tablero.nbytes:5d} bytes/tablero ({juego.tablero.dtype})"
+              f"  {1e6 * segundos / max(juego.iteracion_actual, 1):8.1f} us/it"
+              f"  conflictos={juego.mejor_conflictos}")
+
+SUDOKUS_DIFICILES = [
+    "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......",
+    "52...6.........7.13...........4..8..6......5...........418.........3..2...87.....",
+    "..3.2.6..9..3.5..1..18.64....81.29..7.......8..67.82....26.95..8..2.3..9..5.1.3..",
+    "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..",
+]
+
+# Relleno anterior: barrido de únicos desnudos con es_valido para cada dígito
+def rellenar_barrido(tablero):
+    tablero = tablero.copy()
+    def es_valido(i, j, num):
+        f, c = 3 * (i // 3), 3 * (j // 3)
+        return not (num in tablero[i] or num in tablero[:, j] or num in tablero[f:f+3, c:c+3])
+    vacias = [(i, j) for i in range(9) for j in range(9) if tablero[i, j] == 0]
+    progreso = True
+    while progreso:
+        progreso = False
+        for (i, j) in vacias:
+            if tablero[i, j] == 0:
+                posibles = [n for n in range(1, 10) if es_valido(i, j, n)]
+                if len(posibles) == 1:
+                    tablero[i, j] = posibles[0]
+                    progreso = True
+    return tablero
+
+def rellenar_propagacion(tablero):
+    tablero = tablero.copy()
+    for celda, num in Propagador(tablero).propagar():
+        tablero[divmod(celda, 9)] = num
+    return tablero
+
+# Celdas que quedan vacías tras el relleno lógico y su costo
+def benchmark_propagacion():
+    print("Relleno lógico: celdas vacías restantes y tiempo")
+    tableros = [np.array(SUDOKU_EJEMPLO)] + [
+        np.array([0 if c == "." else int(c) for c in texto]).reshape(9, 9) for texto in SUDOKUS_DIFICILES
+    ]
+    for k, tablero in enumerate(tableros):
+        vacias = int((tablero == 0).sum())
+        fila = f"  #{k} ({vacias} vacías)"
+        for nombre, funcion in (("barrido", rellenar_barrido), ("propagación", rellenar_propagacion)):
+            resultado, segundos = medir(funcion, tablero)
+            fila += f"  {nombre}: {int((resultado == 0).sum()):2d} en {1000 * segundos:6.2f} ms"
+        print(fila)
+
+if __name__ == "__main__":
+    benchmark_evaluador()
+    benchmark_lotes()
+    benchmark_propagacion()
+    benchmark_modelos()
+    benchmark_tamanos()
@@ -0,0 +1,208 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import numpy as np
+from benchmark import generar_sudoku
+from horarios_modelo import generar_instancia
+from horarios_tabu import busqueda_tabu as busqueda_horario
+from laberinto_motor import Rejilla, generar_laberinto_con_camino
+from laberinto_rutas import buscar_ruta
+from sudoku_tabu_search import SudokuTabu
+from tabu_reactivo import TabuReactivo
+
+# Banco de pruebas de los tres resolvedores: cada caso genera instancias con
+# semillas fijas, las resuelve sin interfaz y resume iteraciones/s,
+# evaluaciones/s, tiempo hasta la primera solución factible, tasa de éxito y
+# memoria pico. El resultado se guarda en JSON y dos corridas se comparan con
+# --comparar.
+
+# Cada preparador genera la instancia (fuera de la medición) y devuelve una
+# función sin argumentos que la resuelve y devuelve resuelto, iteraciones y
+# evaluaciones de vecinos
+
+def preparar_sudoku(semilla, tam_caja=3, pistas=None, modelo="filas", modo="incremental", vecinos=50,
+                    max_iteraciones=2000, reactivo=False):
+    tablero = generar_sudoku(tam_caja, pistas, semilla)
+
+    def ejecutar():
+        juego = SudokuTabu(tablero, modelo=modelo, modo=modo, vecinos=vecinos, semilla=semilla,
+                           reactivo=TabuReactivo() if reactivo else None)
+        juego.max_iteraciones = max_iteraciones
+        resuelto = juego.resolver()
+        return resuelto, juego.iteracion_actual, juego.evaluaciones
+    return ejecutar
+
+def preparar_horario(semilla, eventos=2000, profesores=200, salones=60, tiempos=40, tabu_tam=10,
+                     candidatos=32, iteraciones=5000):
+    instancia = generar_instancia(eventos, profesores, salones, tiempos, semilla=semilla)
+
+    def ejecutar():
+        _, conflictos, historial = busqueda_horario(iteraciones=iteraciones, tabu_tam=tabu_tam, instancia=instancia,
+                                                    semilla=semilla, parar_en_cero=True, candidatos=candidatos)
+        return conflictos == 0, len(historial), len(historial) * 2 * candidatos
+    return ejecutar
+
+def preparar_laberinto(semilla, filas=500, columnas=500, densidad=0.25, motor="tabu"):
+    laberinto, inicio, meta = generar_laberinto_con_camino(filas, columnas, semilla=semilla, densidad=densidad,
+                                                           arreglo=True)
+
+    def ejecutar():
+        resultado = buscar_ruta(Rejilla(laberinto), inicio, meta, motor)
+        return resultado["camino"] is not None, resultado["expandidos"], resultado["expandidos"]
+    return ejecutar
+
+PREPARADORES = {
+    "sudoku": preparar_sudoku,
+    "horario": preparar_horario,
+    "laberinto": preparar_laberinto,
+}
+
+# (nombre, problema, parámetros del generador y del resolvedor)
+SUITE = [
+    ("sudoku_9x9_filas", "sudoku", {"tam_caja": 3, "pistas": 30, "modelo": "filas"}),
+    ("sudoku_9x9_lotes", "sudoku", {"tam_caja": 3, "pistas": 30, "modelo": "filas", "modo": "lotes", "vecinos": 200}),
+    ("sudoku_9x9_dificil_filas", "sudoku", {"tam_caja": 3, "pistas": 24, "modelo": "filas"}),
+    ("sudoku_9x9_dificil_reactivo", "sudoku", {"tam_caja": 3, "pistas": 24, "modelo": "filas", "reactivo": True}),
+    ("sudoku_16x16_filas", "sudoku", {"tam_caja": 4, "pistas": 100, "modelo": "filas"}),
+    ("horario_2000_eventos", "horario", {"eventos": 2000, "profesores": 200, "salones": 60, "tiempos": 40}),
+    ("laberinto_500_tabu", "laberinto", {"filas": 500, "columnas": 500, "motor": "tabu"}),
+    ("laberinto_500_a_estrella", "laberinto", {"filas": 500, "columnas": 500, "motor": "a_estrella"}),
+    ("laberinto_500_bfs_bidireccional", "laberinto", {"filas": 500, "columnas": 500, "motor": "bfs_bidireccional"}),
+    ("laberinto_500_jps", "laberinto", {"filas": 500, "columnas": 500, "motor": "jps"}),
+]
+
+def memoria_pico(ejecutar):
+    tracemalloc.start()
+    try:
+        ejecutar()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+# Corre un caso sobre las semillas dadas; de las repeticiones de cada semilla
+# se toma el menor tiempo. La memoria se mide en una pasada aparte con
+# tracemalloc para no inflar los tiempos.
+def ejecutar_caso(problema, parametros, semillas, medir_memoria=True, repeticiones=1):
+    preparar = PREPARADORES[problema]
+    exitos, iteraciones, evaluaciones, segundos, factibles, picos = 0, 0, 0, 0.0, [], []
+    for semilla in semillas:
+        t = float("inf")
+        for _ in range(repeticiones):
+            ejecutar = preparar(semilla, **parametros)
+            inicio = time.perf_counter()
+            resuelto, it, ev = ejecutar()
+            t = min(t, time.perf_counter() - inicio)
+        # Los resolvedores terminan en la primera solución factible
+        if resuelto:
+            exitos += 1
+            factibles.append(t)
+        iteraciones += it
+        evaluaciones += ev
+        segundos += t
+        if medir_memoria:
+            picos.append(memoria_pico(preparar(semilla, **parametros)))
+    return {
+        "problema": problema,
+        "parametros": parametros,
+        "semillas": list(semillas),
+        "repeticiones": repeticiones,
+        "exitos": exitos,
+        "tasa_exito": exitos / len(semillas),
+        "iteraciones_s": iteraciones / segundos if segundos else None,
+        "evaluaciones_s": evaluaciones / segundos if segundos else None,
+        "tiempo_factible_s": statistics.median(factibles) if factibles else None,
+        "tiempo_medio_s": segundos / len(semillas),
+        "memoria_pico_kb": max(picos) / 1024 if picos else None,
+    }
+
+def ejecutar_suite(casos=None, semillas=range(5), medir_memoria=True, repeticiones=1):
+    resultados = {}
+    for nombre, problema, parametros in SUITE:
+        if casos and nombre not in casos:
+            continue
+        resultados[nombre] = r = ejecutar_caso(problema, parametros, semillas, medir_memoria, repeticiones)
+        print(f"{nombre:<32} éxito {r['exitos']}/{len(r['semillas'])}  {_formato(r['iteraciones_s'])} it/s"
+              f"  {_formato(r['evaluaciones_s'])} ev/s  factible {_formato(r['tiempo_factible_s'], 's')}"
+              f"  pico {_formato(r['memoria_pico_kb'], 'KiB')}", file=sys.stderr)
+    return {
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "maquina": platform.machine(),
+        "casos": resultados,
+    }
+
+def _formato(valor, unidad=""):
+    if valor is None:
+        return "-"
+    return f"{valor:.4g}{' ' + unidad if unidad else ''}"
+
+# Métricas comparables: True si más es mejor
+METRICAS = {
+    "iteraciones_s": True,
+    "evaluaciones_s": True,
+    "tasa_exito": True,
+    "tiempo_factible_s": False,
+    "memoria_pico_kb": False,
+}
+
+# Compara dos corridas caso por caso; devuelve las regresiones que superan el umbral
+def comparar(base, nuevo, umbral=0.1):
+    regresiones = []
+    for nombre, caso in nuevo["casos"].items():
+        anterior = base["casos"].get(nombre)
+        if anterior is None:
+            print(f"{nombre:<32} (nuevo)")
+            continue
+        partes = []
+        for metrica, mas_es_mejor in METRICAS.items():
+            a, b = anterior.get(metrica), caso.get(metrica)
+            if not a or b is None:
+                continue
+            cambio = (b - a) / a
+            empeora = -cambio if mas_es_mejor else cambio
+            marca = ""
+            if empeora > umbral:
+                marca = " !"
+                regresiones.append((nombre, metrica, a, b))
+            partes.append(f"{metrica} {cambio:+.1%}{marca}")
+        print(f"{nombre:<32} " + "  ".join(partes))
+    return regresiones
+
+def main():
+    parser = argparse.ArgumentParser(description="Banco de pruebas de los resolvedores tabú")
+    parser.add_argument("-o", "--salida", help="archivo JSON de resultados (por defecto, la salida estándar)")
+    parser.add_argument("--semillas", type=int, default=5)
+    parser.add_argument("--casos", nargs="*", choices=[nombre for nombre, _, _ in SUITE])
+    parser.add_argument("--repeticiones", type=int, default=3, help="corridas por semilla (se toma la más rápida)")
+    parser.add_argument("--sin-memoria", action="store_true", help="no medir la memoria pico")
+    parser.add_argument("--comparar", nargs=2, metavar=("BASE", "NUEVO"),
+                        help="comparar dos archivos de resultados en lugar de correr la suite")
+    parser.add_argument("--umbral", type=float, default=0.1, help="empeoramiento relativo que cuenta como regresión")
+    args = parser.parse_args()
+
+    if args.comparar:
+        with open(args.comparar[0], encoding="utf-8") as f:
+            base = json.load(f)
+        with open(args.comparar[1], encoding="utf-8") as f:
+            nuevo = json.load(f)
+        regresiones = comparar(base, nuevo, args.umbral)
+        if regresiones:
+            print(f"{len(regresiones)} regresiones por encima de {args.umbral:.0%}")
+            sys.exit(1)
+        return
+
+    resultados = ejecutar_suite(args.casos, range(args.semillas), not args.sin_memoria, args.repeticiones)
+    texto = json.dumps(resultados, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+    else:
+        print(texto)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+# Despachador de eventos de paso de los motores de búsqueda.
+# Un observador es cualquier función observador(tipo, datos); el visualizador
+# de pygame es solo uno de ellos. Sin observadores, el motor no construye
+# ningún evento y corre a velocidad completa.
+class Eventos:
+    def __init__(self, *observadores):
+        self.observadores = [o for o in observadores if o is not None]
+
+    def suscribir(self, observador):
+        self.observadores.append(observador)
+        return observador
+
+    def desuscribir(self, observador):
+        self.observadores.remove(observador)
+
+    def __bool__(self):
+        return bool(self.observadores)
+
+    def emitir(self, tipo, **datos):
+        for observador in self.observadores:
+            observador(tipo, datos)
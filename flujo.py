@@ -0,0 +1,33 @@
+import contextlib
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Procesamiento en flujo compartido por los modos por lotes (sudoku_lote,
+# laberinto_almacen): las tareas se reparten en un pool de procesos y los
+# resultados salen en el orden de las tareas, con a lo sumo `en_vuelo`
+# pendientes, así que la memoria no crece con el tamaño de la entrada.
+
+# tareas es un iterable de tuplas de argumentos de funcion, que devuelve una
+# lista de resultados por tarea (un bloque, para amortizar la comunicación)
+def ejecutar_en_flujo(tareas, funcion, procesos=None, en_vuelo=None):
+    procesos = procesos or os.cpu_count()
+    en_vuelo = en_vuelo or 2 * procesos
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        pendientes = deque()
+        for argumentos in tareas:
+            if len(pendientes) >= en_vuelo:
+                yield from pendientes.popleft().result()
+            pendientes.append(ejecutor.submit(funcion, *argumentos))
+        while pendientes:
+            yield from pendientes.popleft().result()
+
+# Archivo de texto de la CLI; "-" es stdin o stdout según el modo y no se cierra
+@contextlib.contextmanager
+def abrir_archivo(ruta, modo="r"):
+    if ruta == "-":
+        yield sys.stdin if "r" in modo else sys.stdout
+        return
+    with open(ruta, modo, encoding="utf-8") as archivo:
+        yield archivo
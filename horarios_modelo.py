@@ -0,0 +1,214 @@
+import csv
+import json
+import numpy as np
+from tabu_memoria import Zobrist
+
+# Instancia de horarios: eventos (curso, profesor) que hay que ubicar en
+# franjas (tiempo, salón). Los nombres se codifican como enteros.
+class InstanciaHorario:
+    def __init__(self, tiempos, salones, eventos):
+        self.tiempos = list(tiempos)
+        self.salones = list(salones)
+        self.cursos = sorted({curso for curso, _ in eventos})
+        self.profesores = sorted({profe for _, profe in eventos})
+        indice_curso = {c: k for k, c in enumerate(self.cursos)}
+        indice_profe = {p: k for k, p in enumerate(self.profesores)}
+        self.ev_curso = np.array([indice_curso[c] for c, _ in eventos], dtype=np.int32)
+        self.ev_profe = np.array([indice_profe[p] for _, p in eventos], dtype=np.int32)
+
+    def __len__(self):
+        return len(self.ev_curso)
+
+# JSON: {"tiempos": [...], "salones": [...], "eventos": [{"curso": ..., "profesor": ...}, ...]}
+# (cada evento también puede ser un par [curso, profesor])
+def cargar_instancia(ruta, **opciones_csv):
+    if str(ruta).endswith(".csv"):
+        return cargar_instancia_csv(ruta, **opciones_csv)
+    with open(ruta, encoding="utf-8") as archivo:
+        datos = json.load(archivo)
+    eventos = [
+        (e["curso"], e["profesor"]) if isinstance(e, dict) else tuple(e)
+        for e in datos["eventos"]
+    ]
+    return InstanciaHorario(datos["tiempos"], datos["salones"], eventos)
+
+# CSV de eventos con columnas curso,profesor. Los tiempos y salones se pasan
+# como listas o como cantidades; si faltan, se toman de las columnas
+# opcionales tiempo y salon del propio archivo.
+def cargar_instancia_csv(ruta, tiempos=None, salones=None):
+    eventos, tiempos_csv, salones_csv = [], {}, {}
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        for fila in csv.DictReader(archivo):
+            eventos.append((fila["curso"], fila["profesor"]))
+            if fila.get("tiempo"):
+                tiempos_csv[fila["tiempo"]] = None
+            if fila.get("salon"):
+                salones_csv[fila["salon"]] = None
+    tiempos = tiempos if tiempos is not None else list(tiempos_csv)
+    salones = salones if salones is not None else list(salones_csv)
+    faltan = [nombre for nombre, valor in (("tiempo", tiempos), ("salon", salones)) if not valor]
+    if faltan:
+        raise ValueError(f"{ruta}: sin tiempos o salones; añade las columnas {', '.join(faltan)} o pásalos como argumento")
+    if isinstance(tiempos, int):
+        tiempos = [f"T{k}" for k in range(tiempos)]
+    if isinstance(salones, int):
+        salones = [f"S{k}" for k in range(salones)]
+    return InstanciaHorario(tiempos, salones, eventos)
+
+# Instancia sintética con cursos y profesores al azar
+def generar_instancia(eventos, profesores, salones, tiempos, cursos=None, semilla=None):
+    rng = np.random.default_rng(semilla)
+    cursos = cursos or max(1, eventos // 2)
+    nombres_curso = [f"Curso {k}" for k in range(cursos)]
+    nombres_profe = [f"Profe {k}" for k in range(profesores)]
+    lista = list(zip(
+        [nombres_curso[k] for k in rng.integers(0, cursos, eventos).tolist()],
+        [nombres_profe[k] for k in rng.integers(0, profesores, eventos).tolist()],
+    ))
+    return InstanciaHorario([f"T{k}" for k in range(tiempos)], [f"S{k}" for k in range(salones)], lista)
+
+
+# Asignación de cada evento a un (tiempo, salón) con contadores de ocupación
+# por (tiempo, profesor) y (tiempo, salón). Los conflictos son las repeticiones
+# en esos contadores, y tanto intercambiar dos eventos como mover uno a otra
+# franja se evalúan en O(1).
+class ModeloHorario:
+    def __init__(self, instancia, tiempo, salon, semilla=None):
+        self.instancia = instancia
+        self.tiempo = np.asarray(tiempo, dtype=np.int32).copy()
+        self.salon = np.asarray(salon, dtype=np.int32).copy()
+        self.profe = instancia.ev_profe
+        self.zobrist = Zobrist(None if semilla is None else int(np.random.default_rng(semilla).integers(2**63)))
+        self.recalcular()
+
+    # Cada evento en una franja distinta mientras alcancen; si no, al azar
+    @classmethod
+    def aleatorio(cls, instancia, semilla=None):
+        rng = np.random.default_rng(semilla)
+        franjas = len(instancia.tiempos) * len(instancia.salones)
+        if len(instancia) <= franjas:
+            elegidas = rng.permutation(franjas)[:len(instancia)]
+        else:
+            elegidas = rng.integers(0, franjas, len(instancia))
+        tiempo, salon = np.divmod(elegidas, len(instancia.salones))
+        return cls(instancia, tiempo, salon, semilla=rng)
+
+    # Desde el formato de lista [(tiempo, salón, curso, profesor), ...]
+    @classmethod
+    def desde_filas(cls, filas, tiempos=None, salones=None, semilla=None):
+        tiempos = tiempos or list(dict.fromkeys(f[0] for f in filas))
+        salones = salones or list(dict.fromkeys(f[1] for f in filas))
+        instancia = InstanciaHorario(tiempos, salones, [(f[2], f[3]) for f in filas])
+        indice_t = {t: k for k, t in enumerate(instancia.tiempos)}
+        indice_s = {s: k for k, s in enumerate(instancia.salones)}
+        return cls(instancia, [indice_t[f[0]] for f in filas], [indice_s[f[1]] for f in filas], semilla=semilla)
+
+    def recalcular(self):
+        instancia = self.instancia
+        n_t, n_s = len(instancia.tiempos), len(instancia.salones)
+        self.ocupa_profe = np.zeros((n_t, len(instancia.profesores)), dtype=np.int32)
+        self.ocupa_salon = np.zeros((n_t, n_s), dtype=np.int32)
+        np.add.at(self.ocupa_profe, (self.tiempo, self.profe), 1)
+        np.add.at(self.ocupa_salon, (self.tiempo, self.salon), 1)
+        self.conflictos = int(np.clip(self.ocupa_profe - 1, 0, None).sum()
+                              + np.clip(self.ocupa_salon - 1, 0, None).sum())
+        self.hash = 0
+        for e in range(len(instancia)):
+            self.hash ^= self.zobrist.valor(e, self._franja(e))
+        return self.conflictos
+
+    def _franja(self, e):
+        return int(self.tiempo[e]) * len(self.instancia.salones) + int(self.salon[e])
+
+    # Intercambiar las franjas de dos eventos: la ocupación de salones no cambia
+    def delta_intercambio(self, e1, e2):
+        t1, t2 = int(self.tiempo[e1]), int(self.tiempo[e2])
+        p1, p2 = int(self.profe[e1]), int(self.profe[e2])
+        if t1 == t2 or p1 == p2:
+            return 0
+        ocupa = self.ocupa_profe
+        return (int(ocupa[t2, p1] >= 1) - int(ocupa[t1, p1] >= 2)
+                + int(ocupa[t1, p2] >= 1) - int(ocupa[t2, p2] >= 2))
+
+    def aplicar_intercambio(self, e1, e2):
+        delta = self.delta_intercambio(e1, e2)
+        f1, f2 = self._franja(e1), self._franja(e2)
+        t1, t2 = int(self.tiempo[e1]), int(self.tiempo[e2])
+        p1, p2 = int(self.profe[e1]), int(self.profe[e2])
+        self.ocupa_profe[t1, p1] -= 1
+        self.ocupa_profe[t2, p1] += 1
+        self.ocupa_profe[t2, p2] -= 1
+        self.ocupa_profe[t1, p2] += 1
+        self.tiempo[e1], self.tiempo[e2] = t2, t1
+        self.salon[e1], self.salon[e2] = self.salon[e2], self.salon[e1]
+        self.hash = self.zobrist.intercambiar(self.hash, e1, f1, e2, f2)
+        self.conflictos += delta
+        return self.conflictos
+
+    # Mover un evento a la franja (t, s)
+    def delta_mover(self, e, t, s):
+        te, se, p = int(self.tiempo[e]), int(self.salon[e]), int(self.profe[e])
+        delta = 0
+        if t != te:
+            delta += int(self.ocupa_profe[t, p] >= 1) - int(self.ocupa_profe[te, p] >= 2)
+        if (t, s) != (te, se):
+            delta += int(self.ocupa_salon[t, s] >= 1) - int(self.ocupa_salon[te, se] >= 2)
+        return delta
+
+    def aplicar_mover(self, e, t, s):
+        delta = self.delta_mover(e, t, s)
+        te, se, p = int(self.tiempo[e]), int(self.salon[e]), int(self.profe[e])
+        anterior = self._franja(e)
+        self.ocupa_profe[te, p] -= 1
+        self.ocupa_profe[t, p] += 1
+        self.ocupa_salon[te, se] -= 1
+        self.ocupa_salon[t, s] += 1
+        self.tiempo[e], self.salon[e] = t, s
+        self.hash = self.zobrist.actualizar(self.hash, e, anterior, self._franja(e))
+        self.conflictos += delta
+        return self.conflictos
+
+    # Eventos que comparten franja con otro del mismo profesor o salón
+    def eventos_en_conflicto(self):
+        return np.flatnonzero((self.ocupa_profe[self.tiempo, self.profe] >= 2)
+                              | (self.ocupa_salon[self.tiempo, self.salon] >= 2))
+
+    # Deltas de K intercambios a la vez; e1 y e2 son arreglos de eventos
+    def delta_intercambio_lote(self, e1, e2):
+        t1, t2 = self.tiempo[e1], self.tiempo[e2]
+        p1, p2 = self.profe[e1], self.profe[e2]
+        ocupa = self.ocupa_profe
+        delta = ((ocupa[t2, p1] >= 1).astype(np.int32) - (ocupa[t1, p1] >= 2)
+                 + (ocupa[t1, p2] >= 1) - (ocupa[t2, p2] >= 2))
+        return np.where((t1 != t2) & (p1 != p2), delta, 0)
+
+    # Deltas de K movimientos de eventos e a franjas (t, s)
+    def delta_mover_lote(self, e, t, s):
+        te, se, p = self.tiempo[e], self.salon[e], self.profe[e]
+        profe = (self.ocupa_profe[t, p] >= 1).astype(np.int32) - (self.ocupa_profe[te, p] >= 2)
+        salon = (self.ocupa_salon[t, s] >= 1).astype(np.int32) - (self.ocupa_salon[te, se] >= 2)
+        return np.where(t != te, profe, 0) + np.where((t != te) | (s != se), salon, 0)
+
+    def copiar_asignacion(self):
+        return self.tiempo.copy(), self.salon.copy()
+
+    # Recuento completo, para verificar el valor incremental
+    def contar_conflictos(self):
+        conflictos = 0
+        vistos = set()
+        for t, s, p in zip(self.tiempo.tolist(), self.salon.tolist(), self.profe.tolist()):
+            conflictos += ("p", t, p) in vistos
+            conflictos += ("s", t, s) in vistos
+            vistos.add(("p", t, p))
+            vistos.add(("s", t, s))
+        return conflictos
+
+    # Formato de lista [(tiempo, salón, curso, profesor), ...] para informes y gráficas
+    def a_filas(self, tiempo=None, salon=None):
+        tiempo = self.tiempo if tiempo is None else tiempo
+        salon = self.salon if salon is None else salon
+        instancia = self.instancia
+        return [
+            (instancia.tiempos[t], instancia.salones[s], instancia.cursos[c], instancia.profesores[p])
+            for t, s, c, p in zip(tiempo.tolist(), salon.tolist(), instancia.ev_curso.tolist(), self.profe.tolist())
+        ]
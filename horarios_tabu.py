@@ -0,0 +1,362 @@
+import argparse
+import os
+import time
+import numpy as np
+import puntos_control
+from horarios_modelo import InstanciaHorario, ModeloHorario
+from tabu_memoria import MemoriaTabu
+from traza import SerieAcotada
+
+# Parámetros del problema
+profesores = ["Profe A", "Profe B", "Profe C"]
+cursos = ["Matemáticas", "Historia", "Ciencia"]
+salones = ["Aula 1", "Aula 2", "Aula 3"]
+tiempos = ["Lun AM", "Lun PM", "Mar AM", "Mar PM", "Mié AM"]
+
+# Crear una solución inicial aleatoria (horario); rng es un numpy.random.Generator
+# o una semilla, y todos los sorteos se hacen de una vez
+def crear_horario(rng=None):
+    rng = np.random.default_rng(rng)
+    n = len(tiempos) * len(salones)
+    elecciones_curso = rng.integers(0, len(cursos), n).tolist()
+    elecciones_profe = rng.integers(0, len(profesores), n).tolist()
+    horario = []
+    for tiempo in tiempos:
+        for salon in salones:
+            curso = cursos[elecciones_curso[len(horario)]]
+            profe = profesores[elecciones_profe[len(horario)]]
+            horario.append((tiempo, salon, curso, profe))
+    return horario
+
+# Búsqueda tabú sobre ModeloHorario (sin instancia, el ejemplo del módulo):
+# cada iteración evalúa en lote `candidatos` intercambios y movimientos de
+# eventos en conflicto y aplica el mejor no tabú; volver a la franja que se
+# deja es tabú durante tabu_tam movimientos, salvo aspiración. Opcionales:
+# parada, límites, puntos de control (al reanudar, iteraciones es el total),
+# traza, instrumentacion y reactivo (sustituye a tabu_tam).
+def busqueda_tabu(iteraciones=100, tabu_tam=10, inicial=None, parada=None, parar_en_cero=False,
+                  semilla=None, instancia=None, candidatos=32, instrumentacion=None, limite_ms=None,
+                  limite_evaluaciones=None, desde_punto=None, guardar_en=None, cada_iteraciones=1000,
+                  traza=None, max_historial=10000, reactivo=None):
+    instr = instrumentacion
+    plazo = None if limite_ms is None else time.perf_counter() + limite_ms / 1000
+    if desde_punto is not None:
+        if isinstance(desde_punto, (str, os.PathLike)):
+            desde_punto = cargar_punto(desde_punto)
+        rng, modelo, mejor, mejor_conf, tabu_tam, claves_tabu, iteracion, historial = desde_punto
+    else:
+        rng = np.random.default_rng(semilla)
+        if instancia is not None and inicial is None:
+            modelo = ModeloHorario.aleatorio(instancia, rng)
+        else:
+            inicial = crear_horario(rng) if inicial is None else inicial
+            modelo = ModeloHorario.desde_filas(inicial, tiempos, salones, semilla=rng)
+        mejor = modelo.copiar_asignacion()
+        mejor_conf = modelo.conflictos
+        claves_tabu, iteracion, historial = [], 0, SerieAcotada(max_historial)
+        if traza:
+            traza.mejora(iteracion, mejor_conf, np.concatenate(mejor))
+    n_eventos = len(modelo.instancia)
+    n_tiempos, n_salones = len(modelo.instancia.tiempos), len(modelo.instancia.salones)
+    # La lista tabú guarda atributos (evento, franja abandonada), no horarios completos
+    if reactivo is not None and desde_punto is None:
+        tabu_tam = reactivo.tenencia
+    lista_tabu = MemoriaTabu(tabu_tam, aspiracion=lambda atributo, conf: conf < mejor_conf)
+    for clave in claves_tabu:
+        lista_tabu.agregar(clave)
+    evaluaciones = 0
+    frecuencia = np.zeros(n_eventos, dtype=np.int64) if reactivo is not None else None
+
+    while iteracion < iteraciones:
+        if parada is not None and parada.is_set():
+            break
+        if parar_en_cero and mejor_conf == 0:
+            break
+        if ((plazo is not None and time.perf_counter() >= plazo)
+                or (limite_evaluaciones is not None and evaluaciones >= limite_evaluaciones)):
+            break
+        if instr:
+            reloj = instr.inicio()
+        en_conflicto = modelo.eventos_en_conflicto()
+        if len(en_conflicto) == 0 or n_eventos < 2:
+            break
+
+        # Intercambios (e, otro) y movimientos (e, t, s) desde eventos en conflicto
+        e = rng.choice(en_conflicto, 2 * candidatos)
+        e_int, e_mov = e[:candidatos], e[candidatos:]
+        otro = rng.integers(0, n_eventos - 1, candidatos)
+        otro += otro >= e_int  # Eventos distintos
+        t = rng.integers(0, n_tiempos, candidatos)
+        s = rng.integers(0, n_salones, candidatos)
+        if instr:
+            reloj = instr.fin("candidatos", reloj)
+        deltas = np.concatenate([modelo.delta_intercambio_lote(e_int, otro),
+                                 modelo.delta_mover_lote(e_mov, t, s)])
+        evaluaciones += 2 * candidatos
+        if instr:
+            reloj = instr.fin("evaluacion", reloj)
+            instr.contar("vecinos", 2 * candidatos)
+            instr.contar("evaluaciones", 2 * candidatos)
+
+        # En orden de delta, el primer movimiento no tabú es el mejor admisible
+        elegido = None
+        for rechazos, k in enumerate(np.argsort(deltas, kind="stable").tolist()):
+            conf = modelo.conflictos + int(deltas[k])
+            if k < candidatos:
+                e1, e2 = int(e_int[k]), int(otro[k])
+                f1 = int(modelo.tiempo[e1]) * n_salones + int(modelo.salon[e1])
+                f2 = int(modelo.tiempo[e2]) * n_salones + int(modelo.salon[e2])
+                if f1 == f2 or lista_tabu.es_tabu((e1, f2), conf) or lista_tabu.es_tabu((e2, f1), conf):
+                    continue
+                elegido = k
+                modelo.aplicar_intercambio(e1, e2)
+                lista_tabu.agregar((e1, f1))
+                lista_tabu.agregar((e2, f2))
+            else:
+                j = k - candidatos
+                e1, t1, s1 = int(e_mov[j]), int(t[j]), int(s[j])
+                f1 = int(modelo.tiempo[e1]) * n_salones + int(modelo.salon[e1])
+                if f1 == t1 * n_salones + s1 or lista_tabu.es_tabu((e1, t1 * n_salones + s1), conf):
+                    continue
+                elegido = k
+                modelo.aplicar_mover(e1, t1, s1)
+                lista_tabu.agregar((e1, f1))
+            break
+        if instr:
+            reloj = instr.fin("seleccion", reloj)
+            instr.contar("iteraciones")
+            instr.contar("rechazos_tabu", 2 * candidatos if elegido is None else rechazos)
+
+        if reactivo is not None:
+            if elegido is not None:
+                frecuencia[e1] += 1
+                if elegido < candidatos:
+                    frecuencia[e2] += 1
+            tenencia = reactivo.observar(modelo.hash, iteracion)
+            if tenencia != lista_tabu.tenencia:
+                lista_tabu.redimensionar(tenencia)
+            accion = reactivo.progreso(modelo.conflictos, iteracion)
+            if accion is not None:
+                _escapar(modelo, accion, reactivo.tamano_escape(n_eventos), mejor, lista_tabu, frecuencia, rng)
+                if instr:
+                    instr.contar("reinicios" if accion == "reiniciar" else "diversificaciones")
+
+        if modelo.conflictos < mejor_conf:
+            mejor = modelo.copiar_asignacion()
+            mejor_conf = modelo.conflictos
+            if instr:
+                instr.fin("copia", reloj)
+                instr.contar("mejoras")
+            if traza:
+                traza.mejora(iteracion, mejor_conf, np.concatenate(mejor))
+        historial.append(mejor_conf)
+        if traza:
+            traza.iteracion(iteracion, modelo.conflictos, mejor_conf)
+        iteracion += 1
+        if guardar_en is not None and iteracion % cada_iteraciones == 0:
+            guardar_punto(guardar_en, rng, modelo, mejor, mejor_conf, lista_tabu, iteracion, historial)
+
+    if guardar_en is not None:
+        guardar_punto(guardar_en, rng, modelo, mejor, mejor_conf, lista_tabu, iteracion, historial)
+    return modelo.a_filas(*mejor), mejor_conf, historial
+
+# Escape del programador reactivo: "reiniciar" vuelve al mejor horario con la
+# memoria tabú vacía; en ambos casos, de 4k eventos al azar se mueven a una
+# franja al azar los k que menos se han movido
+def _escapar(modelo, accion, k, mejor, lista_tabu, frecuencia, rng):
+    if accion == "reiniciar":
+        modelo.tiempo[:], modelo.salon[:] = mejor
+        modelo.recalcular()
+        lista_tabu.limpiar()
+    n_salones = len(modelo.instancia.salones)
+    e = rng.integers(0, len(modelo.instancia), 4 * k)
+    e = e[np.argsort(frecuencia[e], kind="stable")[:k]]
+    t = rng.integers(0, len(modelo.instancia.tiempos), k)
+    s = rng.integers(0, n_salones, k)
+    for e1, t1, s1 in zip(e.tolist(), t.tolist(), s.tolist()):
+        lista_tabu.agregar((e1, int(modelo.tiempo[e1]) * n_salones + int(modelo.salon[e1])))
+        modelo.aplicar_mover(e1, t1, s1)
+        frecuencia[e1] += 1
+
+# Punto de control de busqueda_tabu: la instancia va por nombres en el JSON y
+# las asignaciones, la memoria tabú y el historial como arreglos
+def guardar_punto(ruta, rng, modelo, mejor, mejor_conf, lista_tabu, iteracion, historial):
+    instancia = modelo.instancia
+    puntos_control.guardar(
+        ruta, "horario",
+        {
+            "tiempos": instancia.tiempos, "salones": instancia.salones,
+            "cursos": instancia.cursos, "profesores": instancia.profesores,
+            "mejor_conf": int(mejor_conf), "tenencia": lista_tabu.tenencia, "iteracion": iteracion,
+            "rng": puntos_control.estado_rng(rng),
+            "historial": {"maximo": historial.maximo, "paso": historial.paso, "total": historial.total},
+        },
+        ev_curso=instancia.ev_curso, ev_profe=instancia.ev_profe,
+        tiempo=modelo.tiempo, salon=modelo.salon, mejor_tiempo=mejor[0], mejor_salon=mejor[1],
+        tabu=np.array(list(lista_tabu), dtype=np.int64).reshape(-1, 2),
+        historial=np.array(historial.valores, dtype=np.int64),
+    )
+
+def cargar_punto(ruta):
+    meta, arreglos = puntos_control.cargar(ruta, "horario")
+    eventos = [(meta["cursos"][c], meta["profesores"][p])
+               for c, p in zip(arreglos["ev_curso"].tolist(), arreglos["ev_profe"].tolist())]
+    instancia = InstanciaHorario(meta["tiempos"], meta["salones"], eventos)
+    modelo = ModeloHorario(instancia, arreglos["tiempo"], arreglos["salon"])
+    mejor = (arreglos["mejor_tiempo"].copy(), arreglos["mejor_salon"].copy())
+    claves_tabu = [tuple(clave) for clave in arreglos["tabu"].tolist()]
+    return (puntos_control.rng_desde_estado(meta["rng"]), modelo, mejor, meta["mejor_conf"], meta["tenencia"],
+            claves_tabu, meta["iteracion"], SerieAcotada(valores=arreglos["historial"].tolist(), **meta["historial"]))
+
+# pandas y matplotlib solo se cargan al informar o graficar; con archivo se
+# usa el backend Agg y la figura se guarda en vez de abrir una ventana
+def _pyplot(archivo=None):
+    import matplotlib
+    if archivo is not None:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+def _mostrar(plt, archivo=None):
+    if archivo is None:
+        plt.show()
+    else:
+        plt.savefig(archivo)
+        plt.close()
+
+def tabla_horario(horario):
+    import pandas as pd
+    df = pd.DataFrame(horario, columns=["Tiempo", "Salón", "Curso", "Profesor"])
+    return df.sort_values(by=["Tiempo", "Salón"]).reset_index(drop=True)
+
+# Graficar evolución de conflictos
+def graficar_historial(historial, archivo=None):
+    plt = _pyplot(archivo)
+    plt.figure(figsize=(8, 4))
+    x = historial.iteraciones() if isinstance(historial, SerieAcotada) else range(len(historial))
+    plt.plot(x, list(historial), marker='o', linestyle='-', color='blue')
+    plt.title("Reducción de conflictos por iteración")
+    plt.xlabel("Iteración")
+    plt.ylabel("Conflictos")
+    plt.grid(True)
+    plt.tight_layout()
+    _mostrar(plt, archivo)
+
+# Graficar el horario óptimo local
+def graficar_horario(horario, archivo=None, tiempos=tiempos, salones=salones):
+    plt = _pyplot(archivo)
+    df = tabla_horario(horario)
+    
+    tiempo_indices = {t: i for i, t in enumerate(tiempos)}
+    salon_indices = {s: i for i, s in enumerate(salones)}
+
+    fig, ax = plt.subplots(figsize=(10, 5))
+
+    colores = {
+        "Matemáticas": "#FF9999",
+        "Historia": "#99CCFF",
+        "Ciencia": "#99FF99"
+    }
+
+    for _, row in df.iterrows():
+        t = tiempo_indices[row["Tiempo"]]
+        s = salon_indices[row["Salón"]]
+        curso = row["Curso"]
+        profe = row["Profesor"]
+        ax.barh(s, 0.8, left=t, color=colores.get(curso, "gray"), edgecolor="black")
+        ax.text(t + 0.1, s, f"{curso}\n{profe}", va="center", ha="left", fontsize=8)
+
+    ax.set_yticks(list(salon_indices.values()))
+    ax.set_yticklabels(salones)
+    ax.set_xticks(range(len(tiempos)))
+    ax.set_xticklabels(tiempos, rotation=45)
+    ax.set_xlabel("Tiempo")
+    ax.set_title("Horario óptimo local (por salón y tiempo)")
+    plt.grid(True, axis='x', linestyle='--', alpha=0.5)
+    plt.tight_layout()
+    _mostrar(plt, archivo)
+
+def _cantidad_o_lista(texto):
+    return int(texto) if texto.isdigit() else [nombre.strip() for nombre in texto.split(",") if nombre.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description="Búsqueda tabú de horarios")
+    parser.add_argument("--instancia", help="archivo JSON o CSV de eventos (por defecto, el ejemplo)")
+    parser.add_argument("--tiempos", type=_cantidad_o_lista, metavar="N|A,B,...",
+                        help="franjas de tiempo de una instancia CSV: cantidad o nombres separados por comas")
+    parser.add_argument("--salones", type=_cantidad_o_lista, metavar="N|A,B,...",
+                        help="salones de una instancia CSV: cantidad o nombres separados por comas")
+    parser.add_argument("--iteraciones", type=int, default=100)
+    parser.add_argument("--tabu", type=int, default=10)
+    parser.add_argument("--candidatos", type=int, default=32)
+    parser.add_argument("--semilla", type=int, default=None)
+    parser.add_argument("--sin-graficos", action="store_true", help="no informar ni graficar")
+    parser.add_argument("--guardar", metavar="PREFIJO",
+                        help="guardar las figuras en PREFIJO_*.png sin abrir ventanas")
+    parser.add_argument("--perfil", metavar="ARCHIVO",
+                        help="guardar tiempos por fase y contadores (JSON, o traza de Chrome si es *.trace.json)")
+    parser.add_argument("--limite-ms", type=float, default=None,
+                        help="tiempo máximo de búsqueda; al agotarse se devuelve el mejor horario")
+    parser.add_argument("--punto", metavar="ARCHIVO", help="guardar puntos de control (.npz) durante la búsqueda")
+    parser.add_argument("--reanudar", metavar="ARCHIVO", help="continuar la búsqueda desde un punto de control")
+    parser.add_argument("--traza", metavar="ARCHIVO",
+                        help="escribir iteraciones y mejoras (JSONL si es *.jsonl, si no binario)")
+    parser.add_argument("--traza-cada", type=int, default=1, help="registrar una de cada N iteraciones")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.semilla)
+    instancia = None
+    inicial = None
+    ejes = {}
+    punto = None
+    if args.reanudar:
+        punto = cargar_punto(args.reanudar)
+        instancia_guardada = punto[1].instancia
+        ejes = {"tiempos": instancia_guardada.tiempos, "salones": instancia_guardada.salones}
+    elif args.instancia:
+        from horarios_modelo import cargar_instancia
+        opciones_csv = {clave: valor for clave, valor in (("tiempos", args.tiempos), ("salones", args.salones))
+                        if valor is not None}
+        try:
+            instancia = cargar_instancia(args.instancia, **opciones_csv)
+        except ValueError as error:
+            parser.error(str(error))
+        ejes = {"tiempos": instancia.tiempos, "salones": instancia.salones}
+    else:
+        inicial = crear_horario(rng)
+    graficos = not args.sin_graficos
+    archivo = (lambda nombre: f"{args.guardar}_{nombre}.png") if args.guardar else (lambda nombre: None)
+
+    if graficos and inicial is not None:
+        graficar_horario(inicial, archivo("inicial"), **ejes)
+        print("\nHorario inicial:")
+        print(tabla_horario(inicial))
+
+    instr = None
+    if args.perfil:
+        from instrumentacion import Instrumentacion
+        instr = Instrumentacion(trazar=".trace" in args.perfil)
+    traza = None
+    if args.traza:
+        from traza import abrir_traza
+        traza = abrir_traza(args.traza, args.traza_cada)
+    try:
+        mejor_horario, conflictos, historial = busqueda_tabu(
+            iteraciones=args.iteraciones, tabu_tam=args.tabu, inicial=inicial, semilla=rng,
+            instancia=instancia, candidatos=args.candidatos, instrumentacion=instr, limite_ms=args.limite_ms,
+            desde_punto=punto, guardar_en=args.punto, traza=traza)
+    finally:
+        if traza:
+            traza.cerrar()
+    if instr:
+        instr.guardar(args.perfil)
+
+    print("Conflictos encontrados en el mejor horario:", conflictos)
+    if graficos:
+        print("\nHorario óptimo local:")
+        print(tabla_horario(mejor_horario))
+        graficar_historial(historial, archivo("historial"))
+        graficar_horario(mejor_horario, archivo("horario"), **ejes)
+
+if __name__ == "__main__":
+    main()
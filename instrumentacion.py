@@ -0,0 +1,92 @@
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+# Temporizadores por fase y contadores para los tres resolvedores. Los
+# resolvedores reciben instrumentacion=None por defecto y comprueban
+# `if instr:` antes de medir, así que desactivada no cuesta nada más que esa
+# comprobación. Con trazar=True además se guarda cada intervalo para
+# exportarlo como traza de Chrome (chrome://tracing o Perfetto).
+class Instrumentacion:
+    def __init__(self, trazar=False, max_intervalos=200000):
+        self.trazar = trazar
+        self.max_intervalos = max_intervalos
+        self.tiempos = defaultdict(int)  # fase -> nanosegundos acumulados
+        self.llamadas = defaultdict(int)
+        self.contadores = defaultdict(int)
+        self.intervalos = []  # (fase, inicio_ns, duración_ns)
+        self.descartados = 0
+        self._origen = time.perf_counter_ns()
+
+    @staticmethod
+    def inicio():
+        return time.perf_counter_ns()
+
+    # Cierra un intervalo abierto con inicio(); devuelve el instante de cierre
+    # para encadenar fases consecutivas
+    def fin(self, fase, t0):
+        t1 = time.perf_counter_ns()
+        self.tiempos[fase] += t1 - t0
+        self.llamadas[fase] += 1
+        if self.trazar:
+            if len(self.intervalos) < self.max_intervalos:
+                self.intervalos.append((fase, t0, t1 - t0))
+            else:
+                self.descartados += 1
+        return t1
+
+    @contextmanager
+    def fase(self, nombre):
+        t0 = self.inicio()
+        try:
+            yield
+        finally:
+            self.fin(nombre, t0)
+
+    def contar(self, nombre, n=1):
+        self.contadores[nombre] += n
+
+    def limpiar(self):
+        self.tiempos.clear()
+        self.llamadas.clear()
+        self.contadores.clear()
+        self.intervalos = []
+        self.descartados = 0
+        self._origen = time.perf_counter_ns()
+
+    def resumen(self):
+        return {
+            "fases": {
+                fase: {"ms": ns / 1e6, "llamadas": self.llamadas[fase], "us_por_llamada": ns / 1e3 / self.llamadas[fase]}
+                for fase, ns in sorted(self.tiempos.items(), key=lambda x: -x[1])
+            },
+            "contadores": dict(self.contadores),
+            "intervalos_descartados": self.descartados,
+        }
+
+    def guardar_json(self, ruta):
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(self.resumen(), archivo, indent=2, ensure_ascii=False)
+
+    # Formato Trace Event: un evento "X" por intervalo y los contadores al final
+    def guardar_chrome(self, ruta):
+        pid = os.getpid()
+        eventos = [
+            {"name": fase, "cat": "fase", "ph": "X", "pid": pid, "tid": 0,
+             "ts": (t0 - self._origen) / 1e3, "dur": duracion / 1e3}
+            for fase, t0, duracion in self.intervalos
+        ]
+        fin = max((e["ts"] + e["dur"] for e in eventos), default=0)
+        eventos.append({"name": "contadores", "ph": "C", "pid": pid, "tid": 0, "ts": fin,
+                        "args": dict(self.contadores)})
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump({"traceEvents": eventos, "displayTimeUnit": "ms"}, archivo)
+
+    # .json con "trace" en el nombre (p. ej. perfil.trace.json) va al formato de Chrome
+    def guardar(self, ruta):
+        if ".trace" in os.path.basename(ruta):
+            self.guardar_chrome(ruta)
+        else:
+            self.guardar_json(ruta)
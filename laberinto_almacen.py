@@ -0,0 +1,182 @@
+import argparse
+import json
+import struct
+import sys
+import time
+import numpy as np
+from flujo import abrir_archivo, ejecutar_en_flujo
+from laberinto_motor import INICIO, META, OBSTACULO, VACIO, tallar_camino
+
+# Corpus de laberintos en un solo archivo binario mapeado en memoria: una
+# cabecera, las celdas uint8 de cada laberinto una detrás de otra y al final
+# un índice de registros fijos (offset, filas, columnas, inicio, meta). Los
+# lectores abren el archivo con np.memmap y cada laberinto es una vista sin
+# copia, así que se pueden recorrer corpus de varios GB sin cargarlos en RAM.
+
+MAGICO = b"LABS"
+VERSION = 1
+CABECERA = struct.Struct("<4sIQQ")  # mágico, versión, cantidad, offset del índice
+ENTRADA = np.dtype([("offset", "<u8"), ("filas", "<u4"), ("columnas", "<u4"),
+                    ("inicio", "<u4", 2), ("meta", "<u4", 2)])
+
+# Genera `cantidad` laberintos de una vez: obstáculos como una sola máscara
+# (cantidad, filas, columnas), inicio y meta al azar y un camino tallado entre
+# ellos, así que todos tienen solución
+def generar_lote(cantidad, filas, columnas, densidad=0.3, semilla=None):
+    rng = np.random.default_rng(semilla)
+    obstaculos = rng.random((cantidad, filas, columnas), dtype=np.float32) < densidad
+    inicios = rng.integers(0, (filas, columnas), (cantidad, 2))
+    metas = rng.integers(0, (filas, columnas), (cantidad, 2))
+    iguales = (inicios == metas).all(axis=1)
+    metas[iguales, 1] = (metas[iguales, 1] + 1) % columnas
+    for k in range(cantidad):
+        tallar_camino(obstaculos[k], inicios[k], metas[k], rng)
+    celdas = np.where(obstaculos, np.uint8(OBSTACULO), np.uint8(VACIO))
+    todos = np.arange(cantidad)
+    celdas[todos, inicios[:, 0], inicios[:, 1]] = INICIO
+    celdas[todos, metas[:, 0], metas[:, 1]] = META
+    return celdas, inicios, metas
+
+
+# Escritura secuencial: las celdas van directamente al archivo y en memoria
+# solo queda el índice (32 bytes por laberinto) hasta cerrar
+class EscritorLaberintos:
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.archivo = open(ruta, "wb")
+        self.archivo.write(CABECERA.pack(MAGICO, VERSION, 0, 0))
+        self._indice = []
+
+    def agregar(self, laberinto, inicio, meta):
+        celdas = np.asarray(laberinto, dtype=np.uint8)
+        self.agregar_lote(celdas[None], np.array([inicio]), np.array([meta]))
+
+    def agregar_lote(self, celdas, inicios, metas):
+        celdas = np.ascontiguousarray(celdas, dtype=np.uint8)
+        cantidad, filas, columnas = celdas.shape
+        entradas = np.zeros(cantidad, dtype=ENTRADA)
+        entradas["offset"] = self.archivo.tell() + np.arange(cantidad, dtype=np.uint64) * (filas * columnas)
+        entradas["filas"], entradas["columnas"] = filas, columnas
+        entradas["inicio"], entradas["meta"] = inicios, metas
+        celdas.tofile(self.archivo)
+        self._indice.append(entradas)
+
+    def cerrar(self):
+        indice = np.concatenate(self._indice) if self._indice else np.zeros(0, dtype=ENTRADA)
+        # Índice alineado a 8 bytes
+        self.archivo.write(b"\0" * (-self.archivo.tell() % 8))
+        offset = self.archivo.tell()
+        indice.tofile(self.archivo)
+        self.archivo.seek(0)
+        self.archivo.write(CABECERA.pack(MAGICO, VERSION, len(indice), offset))
+        self.archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+class LectorLaberintos:
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.datos = np.memmap(ruta, dtype=np.uint8, mode="r")
+        magico, version, cantidad, offset = CABECERA.unpack(self.datos[:CABECERA.size].tobytes())
+        if magico != MAGICO:
+            raise ValueError(f"{ruta} no es un archivo de laberintos")
+        if version != VERSION:
+            raise ValueError(f"Versión de archivo de laberintos no soportada: {version}")
+        self.indice = self.datos[offset:offset + cantidad * ENTRADA.itemsize].view(ENTRADA)
+
+    def __len__(self):
+        return len(self.indice)
+
+    # (celdas, inicio, meta); celdas es una vista de solo lectura sobre el archivo
+    def __getitem__(self, k):
+        entrada = self.indice[k]
+        offset, filas, columnas = int(entrada["offset"]), int(entrada["filas"]), int(entrada["columnas"])
+        celdas = self.datos[offset:offset + filas * columnas].reshape(filas, columnas)
+        return celdas, tuple(entrada["inicio"].tolist()), tuple(entrada["meta"].tolist())
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
+
+    def resumen(self):
+        return {
+            "laberintos": len(self),
+            "bytes": int(self.datos.size),
+            "tamanos": sorted({(int(f), int(c)) for f, c in zip(self.indice["filas"], self.indice["columnas"])}),
+        }
+
+# Escribe `cantidad` laberintos generados por lotes; cada lote ocupa a lo sumo
+# unos `memoria_mb` MB durante la generación. El pico de generar_lote es de 5
+# bytes por celda: el sorteo float32 junto a la máscara booleana (después
+# quedan la máscara y las celdas uint8)
+def generar_almacen(ruta, cantidad, filas, columnas, densidad=0.3, semilla=None, memoria_mb=64):
+    rng = np.random.default_rng(semilla)
+    por_lote = max(1, (memoria_mb << 20) // (5 * filas * columnas))
+    with EscritorLaberintos(ruta) as escritor:
+        for inicio in range(0, cantidad, por_lote):
+            escritor.agregar_lote(*generar_lote(min(por_lote, cantidad - inicio), filas, columnas, densidad, rng))
+
+# Tarea de trabajador: cada proceso abre el archivo por su cuenta y resuelve
+# un rango de laberintos sin copiarlos
+def resolver_rango(ruta, desde, hasta, motor="a_estrella"):
+    from laberinto_rutas import buscar_ruta
+    lector = LectorLaberintos(ruta)
+    resultados = []
+    for k in range(desde, hasta):
+        celdas, inicio, meta = lector[k]
+        r = buscar_ruta(celdas, inicio, meta, motor)
+        resultados.append({"indice": k, "motor": motor, "longitud": r["longitud"], "expandidos": r["expandidos"],
+                           "tiempo_ms": round(1000 * r["tiempo"], 3)})
+    return resultados
+
+# Resultados en orden de índice con a lo sumo `en_vuelo` rangos pendientes
+def resolver_almacen(ruta, motor="a_estrella", procesos=None, bloque=64, en_vuelo=None, desde=0, hasta=None):
+    hasta = len(LectorLaberintos(ruta)) if hasta is None else hasta
+    tareas = ((ruta, k, min(k + bloque, hasta), motor) for k in range(desde, hasta, bloque))
+    return ejecutar_en_flujo(tareas, resolver_rango, procesos, en_vuelo)
+
+def main():
+    from laberinto_rutas import MOTORES
+    parser = argparse.ArgumentParser(description="Corpus de laberintos en un archivo mapeado en memoria")
+    ordenes = parser.add_subparsers(dest="orden", required=True)
+    generar = ordenes.add_parser("generar", help="generar laberintos con camino garantizado")
+    generar.add_argument("archivo")
+    generar.add_argument("-n", "--cantidad", type=int, default=1000)
+    generar.add_argument("--filas", type=int, default=200)
+    generar.add_argument("--columnas", type=int, default=200)
+    generar.add_argument("--densidad", type=float, default=0.3)
+    generar.add_argument("--semilla", type=int, default=None)
+    info = ordenes.add_parser("info", help="resumen del archivo")
+    info.add_argument("archivo")
+    resolver = ordenes.add_parser("resolver", help="resolver todos los laberintos y escribir JSONL")
+    resolver.add_argument("archivo")
+    resolver.add_argument("--motor", choices=sorted(MOTORES), default="a_estrella")
+    resolver.add_argument("-p", "--procesos", type=int, default=None)
+    resolver.add_argument("--bloque", type=int, default=64, help="laberintos por tarea")
+    resolver.add_argument("-o", "--salida", default="-", help="archivo JSONL de resultados; '-' para stdout")
+    args = parser.parse_args()
+
+    if args.orden == "generar":
+        inicio = time.perf_counter()
+        generar_almacen(args.archivo, args.cantidad, args.filas, args.columnas, args.densidad, args.semilla)
+        print(f"{args.cantidad} laberintos en {time.perf_counter() - inicio:.2f}s", file=sys.stderr)
+    elif args.orden == "info":
+        print(json.dumps(LectorLaberintos(args.archivo).resumen()))
+    else:
+        total = sin_camino = 0
+        inicio = time.perf_counter()
+        with abrir_archivo(args.salida, "w") as salida:
+            for resultado in resolver_almacen(args.archivo, args.motor, args.procesos, args.bloque):
+                salida.write(json.dumps(resultado) + "\n")
+                total += 1
+                sin_camino += resultado["longitud"] is None
+        print(f"{total} laberintos ({sin_camino} sin camino) en {time.perf_counter() - inicio:.2f}s",
+              file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
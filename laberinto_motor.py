@@ -0,0 +1,240 @@
+import numpy as np
+from eventos import Eventos
+from tabu_memoria import MemoriaTabu
+
+# Constantes
+VACIO = 0
+OBSTACULO = 1
+INICIO = 2
+META = 3
+CAMINO = 4
+TABU = 5
+VISITADO = 6
+
+FILAS = 20
+COLUMNAS = 30
+
+# semilla (entero o numpy.random.Generator) hace reproducible el laberinto;
+# los obstáculos se sortean como máscaras completas en lugar de celda a celda.
+# densidad es la proporción de obstáculos fuera del rectángulo inicio-meta.
+# Siempre hay camino: se talla una escalera al azar de inicio a meta.
+# Con arreglo=True devuelve el uint8 de NumPy en vez de una lista de listas.
+def generar_laberinto_con_camino(filas=FILAS, columnas=COLUMNAS, semilla=None, arreglo=False, densidad=0.3):
+    rng = np.random.default_rng(semilla)
+
+    # Colocar inicio y meta cercanos (pero no adyacentes)
+    fi, ci, df, dc = rng.integers([0, 0, 3, 3], [filas//2 + 1, columnas//2 + 1, filas//3 + 1, columnas//3 + 1]).tolist()
+    inicio = (fi, ci)
+    meta = (min(fi + df, filas-1), min(ci + dc, columnas-1))
+
+    # Asegurar un camino directo (con algunos obstáculos) y añadir obstáculos
+    # aleatorios en el resto del laberinto
+    obstaculos = rng.random((filas, columnas)) < densidad
+    f0, f1 = min(inicio[0], meta[0]), max(inicio[0], meta[0]) + 1
+    c0, c1 = min(inicio[1], meta[1]), max(inicio[1], meta[1]) + 1
+    obstaculos[f0:f1, c0:c1] |= rng.random((f1 - f0, c1 - c0)) < 0.2  # Menos obstáculos en el camino probable
+    tallar_camino(obstaculos, inicio, meta, rng)
+
+    laberinto = np.where(obstaculos, OBSTACULO, VACIO).astype(np.uint8)
+    laberinto[inicio] = INICIO
+    laberinto[meta] = META
+    if not arreglo:
+        laberinto = laberinto.tolist()
+
+    return laberinto, inicio, meta
+
+# Quita los obstáculos de un camino monótono al azar entre dos celdas: los
+# pasos verticales y horizontales necesarios, barajados y acumulados de una vez
+def tallar_camino(obstaculos, inicio, meta, rng):
+    df, dc = meta[0] - inicio[0], meta[1] - inicio[1]
+    pasos = np.zeros((abs(df) + abs(dc) + 1, 2), dtype=np.int64)
+    pasos[0] = inicio
+    verticales = rng.permutation(abs(df) + abs(dc)) < abs(df)
+    pasos[1:, 0] = np.where(verticales, np.sign(df), 0)
+    pasos[1:, 1] = np.where(verticales, 0, np.sign(dc))
+    camino = np.cumsum(pasos, axis=0)
+    obstaculos[camino[:, 0], camino[:, 1]] = False
+    return camino
+
+# Laberinto como arreglo uint8 con tablas de vecinos transitables precalculadas:
+# una tabla rellena (n, 4) con -1 donde no hay vecino y su versión CSR
+# (indptr, indices). Las celdas se numeran en orden de fila, k = i * columnas + j.
+DIRECCIONES = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+class Rejilla:
+    def __init__(self, laberinto):
+        self.celdas = np.asarray(laberinto, dtype=np.uint8)
+        self.filas, self.columnas = self.celdas.shape
+        self.n = self.filas * self.columnas
+        libre = self.celdas != OBSTACULO
+        indices = np.arange(self.n, dtype=np.int32).reshape(self.filas, self.columnas)
+        self.vecinos = np.full((self.filas, self.columnas, 4), -1, dtype=np.int32)
+        for d, (df, dc) in enumerate(DIRECCIONES):
+            # Origen y destino de cada desplazamiento, recortados al borde
+            origen = (slice(max(0, -df), self.filas - max(0, df)), slice(max(0, -dc), self.columnas - max(0, dc)))
+            destino = (slice(max(0, df), self.filas - max(0, -df)), slice(max(0, dc), self.columnas - max(0, -dc)))
+            self.vecinos[origen + (d,)] = np.where(libre[origen] & libre[destino], indices[destino], -1)
+        self.vecinos[~libre] = -1
+        self.vecinos = self.vecinos.reshape(self.n, 4)
+        validos = self.vecinos >= 0
+        self.indptr = np.concatenate(([0], np.cumsum(validos.sum(axis=1)))).astype(np.int64)
+        self.indices = self.vecinos[validos]
+
+    def indice(self, pos):
+        return pos[0] * self.columnas + pos[1]
+
+    def posicion(self, k):
+        return divmod(int(k), self.columnas)
+
+    def vecinos_de(self, k):
+        return self.indices[self.indptr[k]:self.indptr[k + 1]]
+
+    # Distancia en pasos desde cada celda hasta meta (-1 si no se alcanza),
+    # con un BFS que expande toda la frontera de una vez
+    def distancias(self, meta):
+        distancia = np.full(self.n, -1, dtype=np.int32)
+        frontera = np.array([self.indice(meta)], dtype=np.int32)
+        if self.celdas.flat[frontera[0]] == OBSTACULO:
+            return distancia
+        d = 0
+        while frontera.size:
+            distancia[frontera] = d
+            siguientes = self.vecinos[frontera].ravel()
+            siguientes = siguientes[siguientes >= 0]
+            frontera = np.unique(siguientes[distancia[siguientes] < 0])
+            d += 1
+        return distancia
+
+# Búsqueda tabú sin dependencias gráficas. Devuelve el camino de inicio a meta,
+# o None si no se encontró. Cada paso se publica como evento "paso".
+# max_pasos acota la búsqueda cuando el recorrido oscila sin llegar a la meta.
+# laberinto puede ser una lista de listas, un arreglo o una Rejilla ya armada.
+# El recorrido avanza al vecino no tabú más cercano a la meta según el mapa de
+# distancias; el camino actual se mantiene como pila, y al volver a una celda
+# del camino se borra el bucle, así que al llegar ya es el camino final.
+# instrumentacion (una Instrumentacion) mide las fases y cuenta los pasos.
+# reactivo (un tabu_reactivo.TabuReactivo) sustituye a tabu_tam y ajusta la
+# tenencia según las celdas repetidas.
+def busqueda_tabu(laberinto, inicio, meta, observador=None, max_pasos=None, tabu_tam=20, instrumentacion=None,
+                  reactivo=None):
+    instr = instrumentacion
+    if instr:
+        reloj = instr.inicio()
+    rejilla = laberinto if isinstance(laberinto, Rejilla) else Rejilla(laberinto)
+    eventos = Eventos(observador)
+    if max_pasos is None:
+        max_pasos = 10 * rejilla.n
+    pasos = 0
+
+    if instr:
+        reloj = instr.fin("rejilla", reloj)
+    distancia = rejilla.distancias(meta)
+    if instr:
+        reloj = instr.fin("distancias", reloj)
+    k_inicio, k_meta = rejilla.indice(inicio), rejilla.indice(meta)
+    if distancia[k_inicio] < 0:
+        # Sin conexión entre inicio y meta
+        if eventos:
+            eventos.emitir("fin", camino=None)
+        return None
+
+    # Estado inicial
+    actual = k_inicio
+    camino = [actual]
+    en_camino = {actual: 0}  # celda -> posición en el camino
+    visitado = np.zeros(rejilla.n, dtype=bool)
+    visitado[actual] = True
+    lista_tabu = MemoriaTabu(reactivo.tenencia if reactivo else tabu_tam)  # tamaño pequeño para mejor visualización
+    indptr, indices = rejilla.indptr, rejilla.indices
+
+    while actual != k_meta:
+        if pasos >= max_pasos:
+            if instr:
+                instr.fin("recorrido", reloj)
+            if eventos:
+                eventos.emitir("fin", camino=None)
+            return None
+        pasos += 1
+
+        # Vecino no tabú más cercano a la meta (el primero en caso de empate)
+        siguiente = -1
+        mejor = -1
+        for vecino in indices[indptr[actual]:indptr[actual + 1]].tolist():
+            d = int(distancia[vecino])
+            if d >= 0 and vecino not in lista_tabu and (siguiente < 0 or d < mejor):
+                siguiente, mejor = vecino, d
+            elif instr and d >= 0 and vecino in lista_tabu:
+                instr.contar("rechazos_tabu")
+        if instr:
+            instr.contar("pasos")
+            instr.contar("vecinos", int(indptr[actual + 1] - indptr[actual]))
+
+        if siguiente < 0:
+            # No hay vecinos válidos - retroceder
+            if len(camino) > 1:
+                if instr:
+                    instr.contar("retrocesos")
+                lista_tabu.append(actual)  # Añadir a lista tabú para no volver
+                del en_camino[camino.pop()]
+                actual = camino[-1]
+            else:
+                if instr:
+                    instr.fin("recorrido", reloj)
+                if eventos:
+                    eventos.emitir("fin", camino=None)
+                return None
+        else:
+            if siguiente in en_camino:
+                # Borrar el bucle que se cierra en siguiente
+                if instr:
+                    instr.contar("bucles_borrados")
+                for celda in camino[en_camino[siguiente] + 1:]:
+                    del en_camino[celda]
+                del camino[en_camino[siguiente] + 1:]
+            else:
+                en_camino[siguiente] = len(camino)
+                camino.append(siguiente)
+            actual = siguiente
+            visitado[actual] = True
+
+            # Añadir a lista tabú para no volver inmediatamente
+            lista_tabu.append(actual)
+
+        if reactivo is not None:
+            # El estado es la celda actual; el valor, su distancia a la meta
+            tenencia = reactivo.observar(actual, pasos)
+            if tenencia != lista_tabu.tenencia:
+                lista_tabu.redimensionar(tenencia)
+            accion = reactivo.progreso(int(distancia[actual]), pasos)
+            if accion is not None:
+                # Escape: volver a la celda del camino más cercana a la meta. Al
+                # diversificar, el tramo abandonado queda tabú; al reiniciar se
+                # vacía la memoria tabú
+                elite = min(range(len(camino)), key=lambda k: distancia[camino[k]])
+                for celda in camino[elite + 1:]:
+                    del en_camino[celda]
+                    if accion == "diversificar":
+                        lista_tabu.append(celda)
+                del camino[elite + 1:]
+                actual = camino[-1]
+                if accion == "reiniciar":
+                    lista_tabu.limpiar()
+                if instr:
+                    instr.contar("reinicios" if accion == "reiniciar" else "diversificaciones")
+
+        if eventos:
+            eventos.emitir("paso", actual=rejilla.posicion(actual), camino=camino, visitado=visitado,
+                           lista_tabu=lista_tabu, columnas=rejilla.columnas)
+
+    camino = [divmod(k, rejilla.columnas) for k in camino]
+    if instr:
+        instr.fin("recorrido", reloj)
+    if eventos:
+        eventos.emitir("fin", camino=camino)
+    return camino
+
+# Marcar el camino encontrado sobre el laberinto
+def marcar_camino(laberinto, camino):
+    for (i, j) in camino:
+        if laberinto[i][j] not in (INICIO, META):
+            laberinto[i][j] = CAMINO
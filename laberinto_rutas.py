@@ -0,0 +1,250 @@
+import argparse
+import heapq
+import time
+import numpy as np
+from laberinto_motor import OBSTACULO, Rejilla, busqueda_tabu, generar_laberinto_con_camino
+
+# Motores de búsqueda de rutas sobre la misma Rejilla que el recorrido tabú.
+# Todos reciben (rejilla, inicio, meta) y devuelven (camino, expandidos), con
+# el camino como lista de posiciones (i, j) o None si la meta no se alcanza.
+
+def _reconstruir(padre, k, columnas):
+    camino = []
+    while k >= 0:
+        camino.append(divmod(k, columnas))
+        k = int(padre[k])
+    camino.reverse()
+    return camino
+
+# A* con montículo y distancia Manhattan (admisible y consistente en 4 direcciones)
+def a_estrella(rejilla, inicio, meta):
+    columnas = rejilla.columnas
+    k_inicio, k_meta = rejilla.indice(inicio), rejilla.indice(meta)
+    if rejilla.celdas.flat[k_inicio] == OBSTACULO or rejilla.celdas.flat[k_meta] == OBSTACULO:
+        return None, 0
+    mi, mj = meta
+    indptr, indices = rejilla.indptr, rejilla.indices
+    g = np.full(rejilla.n, -1, dtype=np.int32)
+    padre = np.full(rejilla.n, -1, dtype=np.int32)
+    cerrado = np.zeros(rejilla.n, dtype=bool)
+    g[k_inicio] = 0
+    # En empate de f se prefiere el de mayor g, que está más cerca de la meta
+    abiertos = [(abs(mi - inicio[0]) + abs(mj - inicio[1]), 0, k_inicio)]
+    expandidos = 0
+    while abiertos:
+        _, menos_g, k = heapq.heappop(abiertos)
+        if cerrado[k]:
+            continue
+        cerrado[k] = True
+        expandidos += 1
+        if k == k_meta:
+            return _reconstruir(padre, k, columnas), expandidos
+        nuevo_g = 1 - menos_g
+        for v in indices[indptr[k]:indptr[k + 1]].tolist():
+            if cerrado[v] or 0 <= g[v] <= nuevo_g:
+                continue
+            g[v] = nuevo_g
+            padre[v] = k
+            i, j = divmod(v, columnas)
+            heapq.heappush(abiertos, (nuevo_g + abs(mi - i) + abs(mj - j), -nuevo_g, v))
+    return None, expandidos
+
+# BFS bidireccional: se expande por capas completas la frontera más pequeña.
+# Al expandir una capa se toman todos los contactos con el otro lado y se
+# queda el más corto, así que el camino es mínimo.
+def bfs_bidireccional(rejilla, inicio, meta):
+    columnas = rejilla.columnas
+    k_inicio, k_meta = rejilla.indice(inicio), rejilla.indice(meta)
+    if rejilla.celdas.flat[k_inicio] == OBSTACULO or rejilla.celdas.flat[k_meta] == OBSTACULO:
+        return None, 0
+    if k_inicio == k_meta:
+        return [inicio], 0
+    lado = np.zeros(rejilla.n, dtype=np.int8)  # 0 sin visitar, 1 desde inicio, 2 desde meta
+    distancia = np.full(rejilla.n, -1, dtype=np.int32)
+    padre = np.full(rejilla.n, -1, dtype=np.int32)
+    fronteras = {1: np.array([k_inicio], dtype=np.int32), 2: np.array([k_meta], dtype=np.int32)}
+    for s, k in ((1, k_inicio), (2, k_meta)):
+        lado[k] = s
+        distancia[k] = 0
+    expandidos = 0
+    while fronteras[1].size and fronteras[2].size:
+        s = 1 if fronteras[1].size <= fronteras[2].size else 2
+        otro = 3 - s
+        frontera = fronteras[s]
+        expandidos += frontera.size
+        vecinos = rejilla.vecinos[frontera]
+        origen = np.repeat(frontera, 4)
+        vecinos = vecinos.ravel()
+        validos = vecinos >= 0
+        origen, vecinos = origen[validos], vecinos[validos]
+
+        contacto = lado[vecinos] == otro
+        if contacto.any():
+            u, v = origen[contacto], vecinos[contacto]
+            mejor = int(np.argmin(distancia[u] + distancia[v]))
+            u, v = int(u[mejor]), int(v[mejor])
+            if s == 2:
+                u, v = v, u
+            # u pertenece al lado del inicio y v al de la meta
+            camino = _reconstruir(padre, u, columnas)
+            camino += reversed(_reconstruir(padre, v, columnas))
+            return camino, expandidos
+
+        nuevos = lado[vecinos] == 0
+        vecinos, primeros = np.unique(vecinos[nuevos], return_index=True)
+        lado[vecinos] = s
+        padre[vecinos] = origen[nuevos][primeros]
+        distancia[vecinos] = distancia[frontera[0]] + 1
+        fronteras[s] = vecinos
+    return None, expandidos
+
+# Jump point search en 4 direcciones: los desplazamientos horizontales saltan
+# hasta la meta o hasta una celda con vecino forzado; los verticales además se
+# detienen donde un salto horizontal encuentra un punto de salto. El A* solo
+# expande puntos de salto y el camino se rellena entre ellos en línea recta.
+def jps(rejilla, inicio, meta):
+    filas, columnas = rejilla.filas, rejilla.columnas
+    libres = (rejilla.celdas != OBSTACULO).tobytes()
+    mi, mj = meta
+    if not libres[inicio[0] * columnas + inicio[1]] or not libres[mi * columnas + mj]:
+        return None, 0
+
+    def libre(i, j):
+        return 0 <= i < filas and 0 <= j < columnas and libres[i * columnas + j]
+
+    def saltar_horizontal(i, j, dj):
+        while True:
+            j += dj
+            if not libre(i, j):
+                return None
+            if (i, j) == meta:
+                return i, j
+            if ((libre(i - 1, j) and not libre(i - 1, j - dj))
+                    or (libre(i + 1, j) and not libre(i + 1, j - dj))):
+                return i, j
+
+    def saltar_vertical(i, j, di):
+        while True:
+            i += di
+            if not libre(i, j):
+                return None
+            if (i, j) == meta:
+                return i, j
+            if ((libre(i, j - 1) and not libre(i - di, j - 1))
+                    or (libre(i, j + 1) and not libre(i - di, j + 1))):
+                return i, j
+            if saltar_horizontal(i, j, 1) or saltar_horizontal(i, j, -1):
+                return i, j
+
+    def saltar(i, j, di, dj):
+        return saltar_vertical(i, j, di) if di else saltar_horizontal(i, j, dj)
+
+    # Direcciones a explorar desde un punto según cómo se llegó a él
+    def direcciones(i, j, padre):
+        if padre is None:
+            return ((-1, 0), (1, 0), (0, -1), (0, 1))
+        di = (i > padre[0]) - (i < padre[0])
+        dj = (j > padre[1]) - (j < padre[1])
+        if dj:
+            return ((0, dj), (-1, 0), (1, 0))
+        return ((di, 0), (0, -1), (0, 1))
+
+    g = {inicio: 0}
+    padres = {inicio: None}
+    cerrados = set()
+    abiertos = [(abs(mi - inicio[0]) + abs(mj - inicio[1]), 0, inicio)]
+    expandidos = 0
+    while abiertos:
+        _, menos_g, punto = heapq.heappop(abiertos)
+        if punto in cerrados:
+            continue
+        cerrados.add(punto)
+        expandidos += 1
+        if punto == meta:
+            return _rellenar(punto, padres), expandidos
+        i, j = punto
+        for di, dj in direcciones(i, j, padres[punto]):
+            if not libre(i + di, j + dj):
+                continue
+            salto = saltar(i, j, di, dj)
+            if salto is None or salto in cerrados:
+                continue
+            nuevo_g = -menos_g + abs(salto[0] - i) + abs(salto[1] - j)
+            if nuevo_g < g.get(salto, nuevo_g + 1):
+                g[salto] = nuevo_g
+                padres[salto] = punto
+                heapq.heappush(abiertos, (nuevo_g + abs(mi - salto[0]) + abs(mj - salto[1]), -nuevo_g, salto))
+    return None, expandidos
+
+# Camino celda a celda a partir de los puntos de salto
+def _rellenar(punto, padres):
+    puntos = []
+    while punto is not None:
+        puntos.append(punto)
+        punto = padres[punto]
+    puntos.reverse()
+    camino = [puntos[0]]
+    for (i0, j0), (i1, j1) in zip(puntos, puntos[1:]):
+        di = (i1 > i0) - (i1 < i0)
+        dj = (j1 > j0) - (j1 < j0)
+        i, j = i0, j0
+        while (i, j) != (i1, j1):
+            i, j = i + di, j + dj
+            camino.append((i, j))
+    return camino
+
+# El recorrido tabú con la misma interfaz; expandidos cuenta sus pasos
+def tabu(rejilla, inicio, meta):
+    pasos = 0
+
+    def contar(tipo, datos):
+        nonlocal pasos
+        pasos += tipo == "paso"
+
+    return busqueda_tabu(rejilla, inicio, meta, observador=contar), pasos
+
+MOTORES = {
+    "tabu": tabu,
+    "a_estrella": a_estrella,
+    "bfs_bidireccional": bfs_bidireccional,
+    "jps": jps,
+}
+
+# Interfaz común: resultado con camino, longitud (en pasos), nodos expandidos
+# y tiempo de pared en segundos. La Rejilla se arma una vez y se reutiliza.
+# inicio y meta se pasan a tuplas de int de Python (pueden venir de NumPy).
+def buscar_ruta(laberinto, inicio, meta, motor="a_estrella"):
+    rejilla = laberinto if isinstance(laberinto, Rejilla) else Rejilla(laberinto)
+    inicio = tuple(int(x) for x in inicio)
+    meta = tuple(int(x) for x in meta)
+    inicio_t = time.perf_counter()
+    camino, expandidos = MOTORES[motor](rejilla, inicio, meta)
+    return {
+        "motor": motor,
+        "camino": camino,
+        "longitud": None if camino is None else len(camino) - 1,
+        "expandidos": expandidos,
+        "tiempo": time.perf_counter() - inicio_t,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Comparación de motores de rutas en laberintos")
+    parser.add_argument("--filas", type=int, default=200)
+    parser.add_argument("--columnas", type=int, default=200)
+    parser.add_argument("--densidad", type=float, default=0.3)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--motores", nargs="*", choices=sorted(MOTORES), default=list(MOTORES))
+    args = parser.parse_args()
+
+    laberinto, inicio, meta = generar_laberinto_con_camino(args.filas, args.columnas, semilla=args.semilla,
+                                                           densidad=args.densidad, arreglo=True)
+    rejilla = Rejilla(laberinto)
+    print(f"Laberinto {args.filas}×{args.columnas}, inicio={inicio}, meta={meta}")
+    for motor in args.motores:
+        r = buscar_ruta(rejilla, inicio, meta, motor)
+        longitud = "sin camino" if r["longitud"] is None else r["longitud"]
+        print(f"{motor:<18} longitud={longitud!s:<11} expandidos={r['expandidos']:<9} "
+              f"tiempo={r['tiempo'] * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import argparse
+import itertools
+import multiprocessing as mp
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from sudoku_tabu_search import SudokuTabu, SUDOKU_EJEMPLO
+
+# Portafolio de búsquedas tabú independientes: N instancias con semillas
+# (y opcionalmente tenencias y vecindarios) distintas repartidas en un
+# ProcessPoolExecutor. La primera que llega a cero conflictos detiene al resto.
+
+_parada = None
+
+def _iniciar_trabajador(parada):
+    global _parada
+    _parada = parada
+
+# El pool pasa las tareas a su cola interna antes de que empiecen, así que
+# cancel() casi nunca llega a tiempo: una tarea que arranca con la parada ya
+# dada vuelve enseguida, sin armar el resolvedor
+def _cancelada(semilla):
+    if _parada is None or not _parada.is_set():
+        return None
+    return {"semilla": semilla, "pid": os.getpid(), "cancelado": True}
+
+# Tarea de trabajador: una búsqueda tabú de Sudoku
+def resolver_sudoku(semilla, tablero=SUDOKU_EJEMPLO, tabu_tamano=100, vecinos=50,
+                    modo="incremental", modelo="libre", max_iteraciones=100):
+    cancelada = _cancelada(semilla)
+    if cancelada:
+        return cancelada
+    inicio = time.perf_counter()
+    juego = SudokuTabu(tablero, tabu_tamano=tabu_tamano, modo=modo, vecinos=vecinos, modelo=modelo,
+                       semilla=semilla)
+    juego.max_iteraciones = max_iteraciones
+    juego.resolver(parada=_parada)
+    return {
+        "semilla": semilla,
+        "pid": os.getpid(),
+        "tabu_tamano": tabu_tamano,
+        "vecinos": vecinos,
+        "conflictos": int(juego.mejor_conflictos),
+        "iteraciones": juego.iteracion_actual,
+        "tiempo": time.perf_counter() - inicio,
+        "detenido": _parada is not None and _parada.is_set() and juego.mejor_conflictos > 0,
+        "solucion": juego.mejor_solucion.tolist(),
+    }
+
+# Tarea de trabajador: una búsqueda tabú de horarios
+def resolver_horario(semilla, tabu_tam=10, iteraciones=100, candidatos=32):
+    cancelada = _cancelada(semilla)
+    if cancelada:
+        return cancelada
+    from horarios_tabu import busqueda_tabu
+    inicio = time.perf_counter()
+    mejor, conflictos, historial = busqueda_tabu(iteraciones=iteraciones, tabu_tam=tabu_tam,
+                                                 parada=_parada, parar_en_cero=True, semilla=semilla,
+                                                 candidatos=candidatos)
+    return {
+        "semilla": semilla,
+        "pid": os.getpid(),
+        "tabu_tam": tabu_tam,
+        "candidatos": candidatos,
+        "conflictos": conflictos,
+        "iteraciones": len(historial),
+        "tiempo": time.perf_counter() - inicio,
+        "detenido": _parada is not None and _parada.is_set() and conflictos > 0,
+        "solucion": mejor,
+    }
+
+TAREAS = {
+    "sudoku": resolver_sudoku,
+    "horario": resolver_horario,
+}
+
+# n configuraciones con semillas consecutivas; cada parámetro con una lista
+# de valores se reparte en rotación entre los trabajadores
+def configuraciones_portafolio(n, semilla_base=0, **variantes):
+    ciclos = {clave: itertools.cycle(valores) for clave, valores in variantes.items() if valores}
+    return [
+        dict({"semilla": semilla_base + k}, **{clave: next(ciclo) for clave, ciclo in ciclos.items()})
+        for k in range(n)
+    ]
+
+# Ejecuta el portafolio y devuelve (mejor resultado, resultados por trabajador);
+# las configuraciones que no llegaron a empezar no tienen resultado
+def ejecutar_portafolio(tarea, configuraciones, procesos=None, detener_al_resolver=True, **comunes):
+    procesos = procesos or os.cpu_count()
+    contexto = mp.get_context()
+    parada = contexto.Event()
+    resultados = []
+    ganador = None
+    with ProcessPoolExecutor(max_workers=procesos, mp_context=contexto,
+                             initializer=_iniciar_trabajador, initargs=(parada,)) as ejecutor:
+        pendientes = {ejecutor.submit(tarea, **dict(comunes, **conf)) for conf in configuraciones}
+        while pendientes:
+            hechos, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+            for futuro in hechos:
+                if futuro.cancelled():
+                    continue
+                resultado = futuro.result()
+                if resultado.get("cancelado"):
+                    continue
+                resultados.append(resultado)
+                if ganador is None and resultado["conflictos"] == 0:
+                    ganador = resultado
+                    if detener_al_resolver:
+                        # Los que esperan se cancelan o vuelven al empezar; los que corren ven la señal de parada
+                        parada.set()
+                        for pendiente in pendientes:
+                            pendiente.cancel()
+    mejor = ganador or min(resultados, key=lambda r: r["conflictos"])
+    return mejor, resultados
+
+def main():
+    parser = argparse.ArgumentParser(description="Portafolio de búsquedas tabú en paralelo")
+    parser.add_argument("problema", choices=sorted(TAREAS))
+    parser.add_argument("-n", "--instancias", type=int, default=os.cpu_count())
+    parser.add_argument("-p", "--procesos", type=int, default=None)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--tenencias", type=int, nargs="*", default=None)
+    parser.add_argument("--vecinos", type=int, nargs="*", default=None)
+    parser.add_argument("--iteraciones", type=int, default=100)
+    parser.add_argument("--modelo", choices=("libre", "filas", "cajas"), default="libre")
+    args = parser.parse_args()
+
+    if args.problema == "sudoku":
+        variantes = {"tabu_tamano": args.tenencias, "vecinos": args.vecinos}
+        comunes = {"max_iteraciones": args.iteraciones, "modelo": args.modelo}
+    else:
+        variantes = {"tabu_tam": args.tenencias, "candidatos": args.vecinos}
+        comunes = {"iteraciones": args.iteraciones}
+    configuraciones = configuraciones_portafolio(args.instancias, args.semilla, **variantes)
+
+    inicio = time.perf_counter()
+    mejor, resultados = ejecutar_portafolio(TAREAS[args.problema], configuraciones,
+                                            procesos=args.procesos, **comunes)
+    total = time.perf_counter() - inicio
+
+    for r in sorted(resultados, key=lambda r: r["semilla"]):
+        estado = "detenido" if r["detenido"] else ""
+        print(f"semilla={r['semilla']:<5} pid={r['pid']:<7} conflictos={r['conflictos']:<4} "
+              f"iteraciones={r['iteraciones']:<7} tiempo={r['tiempo']:.3f}s {estado}")
+    print(f"Cancelados antes de empezar: {len(configuraciones) - len(resultados)}")
+    print(f"Mejor: semilla={mejor['semilla']} conflictos={mejor['conflictos']} ({total:.3f}s en total)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import json
+import os
+import numpy as np
+
+# Puntos de control compactos: los arreglos se guardan con np.savez_compressed
+# y el resto del estado (parámetros, estado del generador, listas de nombres)
+# como un JSON dentro del mismo archivo. La escritura pasa por un archivo
+# temporal y un reemplazo atómico, así que una interrupción a mitad de
+# guardado no deja un punto de control corrupto.
+
+VERSION = 1
+
+def guardar(ruta, tipo, meta, **arreglos):
+    meta = dict(meta, tipo=tipo, version=VERSION)
+    temporal = f"{ruta}.tmp"
+    with open(temporal, "wb") as archivo:
+        np.savez_compressed(archivo, _meta=np.array(json.dumps(meta)), **arreglos)
+    os.replace(temporal, ruta)
+
+def cargar(ruta, tipo):
+    with np.load(ruta, allow_pickle=False) as datos:
+        meta = json.loads(str(datos["_meta"]))
+        arreglos = {clave: datos[clave] for clave in datos.files if clave != "_meta"}
+    if meta.get("tipo") != tipo:
+        raise ValueError(f"{ruta} es un punto de control de {meta.get('tipo')!r}, no de {tipo!r}")
+    if meta.get("version") != VERSION:
+        raise ValueError(f"Versión de punto de control no soportada: {meta.get('version')}")
+    return meta, arreglos
+
+# Estado del generador de NumPy, serializable en JSON
+def estado_rng(rng):
+    return rng.bit_generator.state
+
+def rng_desde_estado(estado):
+    bit_generator = getattr(np.random, estado["bit_generator"])()
+    bit_generator.state = estado
+    return np.random.Generator(bit_generator)
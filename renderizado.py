@@ -0,0 +1,178 @@
+import time
+from collections import OrderedDict
+import numpy as np
+import pygame
+from laberinto_motor import INICIO, META, CAMINO, TABU, VISITADO
+
+# Capa de dibujo incremental para los visualizadores de pygame: superficies
+# pre-renderizadas, solo se redibujan las celdas cuyo estado cambió y la
+# pantalla se actualiza con pygame.display.update(rects) en lugar de flip().
+
+BLANCO = (255, 255, 255)
+NEGRO = (0, 0, 0)
+
+# Textos renderizados por (fuente, texto, color), con expulsión LRU, y
+# baldosas de color por tamaño
+class CacheSuperficies:
+    def __init__(self, maximo=512):
+        self.maximo = maximo
+        self._textos = OrderedDict()
+        self._baldosas = {}
+
+    def texto(self, font, texto, color):
+        clave = (id(font), texto, color)
+        superficie = self._textos.get(clave)
+        if superficie is None:
+            superficie = self._textos[clave] = font.render(texto, True, color)
+            if len(self._textos) > self.maximo:
+                self._textos.popitem(last=False)
+        else:
+            self._textos.move_to_end(clave)
+        return superficie
+
+    def baldosa(self, color, tamano):
+        clave = (color, tamano)
+        superficie = self._baldosas.get(clave)
+        if superficie is None:
+            superficie = pygame.Surface(tamano)
+            if pygame.display.get_surface() is not None:
+                superficie = superficie.convert()
+            superficie.fill(color)
+            self._baldosas[clave] = superficie
+        return superficie
+
+# Rectángulos sucios pendientes y límite de cuadros por segundo. toca() dice
+# si ya pasó un cuadro desde la última actualización, para saltar cuadros sin
+# frenar la búsqueda.
+class Refresco:
+    def __init__(self, fps=60):
+        self.fps = fps
+        self.sucios = []
+        self._ultimo = 0.0
+
+    def marcar(self, rect):
+        self.sucios.append(pygame.Rect(rect))
+
+    def toca(self):
+        return time.perf_counter() - self._ultimo >= 1 / self.fps
+
+    def actualizar(self):
+        if self.sucios:
+            pygame.display.update(self.sucios)
+            self.sucios = []
+        self._ultimo = time.perf_counter()
+
+
+# Tablero de Sudoku N²×N² que recuerda lo dibujado en cada celda
+# (dígito, si es dado, si está resaltada) y solo repinta las que cambian
+class RenderTablero:
+    def __init__(self, screen, font, tam_caja=3, origen=(10, 10), lado=360, cache=None, refresco=None):
+        self.screen = screen
+        self.font = font
+        self.tam_caja = tam_caja
+        self.n = tam_caja * tam_caja
+        self.tam_celda = lado // self.n
+        self.origen = origen
+        self.cache = cache or CacheSuperficies()
+        self.refresco = refresco or Refresco()
+        self.invalidar()
+
+    # Olvidar lo dibujado (p. ej. tras limpiar la pantalla entera)
+    def invalidar(self):
+        self.estado = [[None] * self.n for _ in range(self.n)]
+
+    def rect_celda(self, i, j):
+        x0, y0 = self.origen
+        return pygame.Rect(x0 + j * self.tam_celda, y0 + i * self.tam_celda, self.tam_celda, self.tam_celda)
+
+    def _ancho(self, k):
+        return 3 if k % self.tam_caja == 0 else 1
+
+    def dibujar(self, tablero, tablero_original, resaltadas=()):
+        resaltadas = set(resaltadas)
+        valores = tablero.tolist()
+        originales = tablero_original.tolist()
+        for i in range(self.n):
+            for j in range(self.n):
+                estado = (valores[i][j], originales[i][j] != 0, (i, j) in resaltadas)
+                if estado != self.estado[i][j]:
+                    self._dibujar_celda(i, j, *estado)
+                    self.estado[i][j] = estado
+
+    def _dibujar_celda(self, i, j, num, dada, resaltada):
+        screen = self.screen
+        rect = self.rect_celda(i, j)
+        screen.fill(BLANCO, rect)
+        # Bordes de la celda; los gruesos separan las cajas
+        x0, y0 = rect.topleft
+        x1, y1 = x0 + self.tam_celda, y0 + self.tam_celda
+        pygame.draw.line(screen, NEGRO, (x0, y0), (x1, y0), self._ancho(i))
+        pygame.draw.line(screen, NEGRO, (x0, y1), (x1, y1), self._ancho(i + 1))
+        pygame.draw.line(screen, NEGRO, (x0, y0), (x0, y1), self._ancho(j))
+        pygame.draw.line(screen, NEGRO, (x1, y0), (x1, y1), self._ancho(j + 1))
+        if num:
+            color = (0, 0, 255) if dada else (0, 128, 0)
+            texto = self.cache.texto(self.font, str(num), color)
+            screen.blit(texto, texto.get_rect(center=rect.center))
+        if resaltada:
+            pygame.draw.rect(screen, (255, 165, 0), rect, 3)  # Naranja
+        # Las líneas gruesas se salen un píxel de la celda
+        self.refresco.marcar(rect.inflate(4, 4))
+
+
+# Laberinto que compone el estado de cada celda (base, visitada, tabú,
+# camino) con NumPy, lo compara con lo ya dibujado y solo copia las baldosas
+# de las celdas distintas
+class RenderLaberinto:
+    # Con más celdas cambiadas que esto se actualiza el área completa de una vez
+    MAX_RECTS = 2000
+
+    def __init__(self, pantalla, laberinto, colores, tam_celda, cache=None, refresco=None):
+        self.pantalla = pantalla
+        self.colores = colores
+        self.tam_celda = tam_celda
+        self.cache = cache or CacheSuperficies()
+        self.refresco = refresco or Refresco()
+        self.fijar_base(laberinto)
+
+    # Tomar de nuevo las celdas de fondo (p. ej. tras marcar_camino)
+    def fijar_base(self, laberinto):
+        celdas = np.asarray(laberinto, dtype=np.uint8)
+        self.filas, self.columnas = celdas.shape
+        self.base = celdas.ravel().copy()
+        self._fijas = np.flatnonzero(np.isin(self.base, (INICIO, META)))
+        self.mostrado = np.full(self.base.size, 255, dtype=np.uint8)
+        self._baldosas = {
+            tipo: self.cache.baldosa(color, (self.tam_celda, self.tam_celda))
+            for tipo, color in self.colores.items()
+        }
+
+    # visitado es una máscara plana; lista_tabu y camino, índices planos de celda
+    def dibujar(self, visitado=None, lista_tabu=(), camino=()):
+        estado = self.base.copy()
+        if visitado is not None:
+            estado[visitado] = VISITADO
+        tabu = np.fromiter(lista_tabu, dtype=np.int64)
+        if tabu.size:
+            estado[tabu] = TABU
+        if len(camino):
+            estado[np.asarray(camino)] = CAMINO
+        # Inicio y meta siempre encima
+        estado[self._fijas] = self.base[self._fijas]
+
+        cambiadas = np.flatnonzero(estado != self.mostrado)
+        if not cambiadas.size:
+            return
+        tam = self.tam_celda
+        blit = self.pantalla.blit
+        baldosas = self._baldosas
+        for k, tipo in zip(cambiadas.tolist(), estado[cambiadas].tolist()):
+            i, j = divmod(k, self.columnas)
+            blit(baldosas[tipo], (j * tam, i * tam))
+        if cambiadas.size > self.MAX_RECTS:
+            self.refresco.marcar((0, 0, self.columnas * tam, self.filas * tam))
+        else:
+            for k in cambiadas.tolist():
+                i, j = divmod(k, self.columnas)
+                self.refresco.marcar((j * tam, i * tam, tam, tam))
+        self.mostrado = estado
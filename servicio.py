@@ -0,0 +1,357 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from sudoku_lote import resolver_uno, texto_a_tablero
+
+# Servicio de resolución: un proceso asyncio que recibe trabajos de Sudoku,
+# horarios y laberintos como JSON por líneas (stdin/stdout o un socket Unix),
+# los reparte a un pool de procesos con los resolvedores sin interfaz y
+# responde a medida que terminan, con el "id" de cada pedido.
+#
+#   {"id": 1, "tipo": "sudoku", "tablero": "53..7....", "limite_ms": 200}
+#   {"id": 2, "tipo": "horario", "generar": {"eventos": 200, "profesores": 20, "salones": 8, "tiempos": 30}}
+#   {"id": 3, "tipo": "laberinto", "generar": {"filas": 300, "columnas": 300, "semilla": 1}, "motor": "jps"}
+#   {"id": 4, "tipo": "estado"}
+#
+# Los sudokus se agrupan en lotes (hasta `lote` trabajos o `espera_ms` de
+# espera) para amortizar el paso entre procesos. Cada pedido tiene un plazo
+# (limite_ms): los resolvedores anytime reciben el tiempo que le queda y
+# devuelven la mejor solución al agotarse, y un pedido cuyo plazo vence en
+# cola se responde sin resolver. Con la cola llena se deja de leer la entrada
+# (la contrapresión llega al cliente por el pipe o el socket) o, con
+# rechazar=True, los pedidos nuevos se responden al momento con "ocupado". En
+# el pool hay a lo sumo una tarea por proceso: el resto espera en la cola,
+# donde se comprueba su plazo, así que la latencia no crece sin límite.
+
+# Tareas de trabajador. plazo es un instante de time.time() (común a todos
+# los procesos); cada trabajo recibe como límite lo que le queda hasta él.
+
+def _restante_ms(plazo):
+    return None if plazo is None else max(0.0, 1000 * (plazo - time.time()))
+
+# Un lote responde entero al terminar, así que cada sudoku recibe una parte
+# igual del tiempo que queda hasta el plazo más cercano de los pendientes
+def resolver_sudokus(trabajos):
+    resultados = []
+    for k, trabajo in enumerate(trabajos):
+        tablero = trabajo["tablero"]
+        if isinstance(tablero, str):
+            tablero = texto_a_tablero(tablero)
+        plazos = [t["plazo"] for t in trabajos[k:] if "plazo" in t]
+        limite_ms = _restante_ms(min(plazos)) / (len(trabajos) - k) if plazos else None
+        opciones = {
+            "max_iteraciones": trabajo.get("iteraciones", 1000),
+            "limite_ms": limite_ms,
+            "cache": trabajo.get("cache", 0),
+            "solver": {clave: trabajo[clave] for clave in ("modo", "vecinos", "modelo") if clave in trabajo},
+        }
+        resultados.append(resolver_uno(trabajo.get("id"), tablero, opciones, trabajo.get("semilla")))
+    return resultados
+
+def resolver_horario(trabajo):
+    from horarios_modelo import InstanciaHorario, generar_instancia
+    from horarios_tabu import busqueda_tabu
+    inicio = time.perf_counter()
+    if "generar" in trabajo:
+        instancia = generar_instancia(semilla=trabajo.get("semilla"), **trabajo["generar"])
+    else:
+        datos = trabajo["instancia"]
+        eventos = [(e["curso"], e["profesor"]) if isinstance(e, dict) else tuple(e) for e in datos["eventos"]]
+        instancia = InstanciaHorario(datos["tiempos"], datos["salones"], eventos)
+    mejor, conflictos, historial = busqueda_tabu(
+        iteraciones=trabajo.get("iteraciones", 1000), tabu_tam=trabajo.get("tabu", 10),
+        candidatos=trabajo.get("candidatos", 32), semilla=trabajo.get("semilla"), instancia=instancia,
+        parar_en_cero=True, limite_ms=_restante_ms(trabajo.get("plazo")))
+    return {
+        "id": trabajo.get("id"),
+        "conflictos": conflictos,
+        "iteraciones": len(historial),
+        "tiempo_ms": round(1000 * (time.perf_counter() - inicio), 3),
+        "horario": mejor,
+    }
+
+def resolver_laberinto(trabajo):
+    import numpy as np
+    from laberinto_motor import generar_laberinto_con_camino
+    from laberinto_rutas import buscar_ruta
+    if "generar" in trabajo:
+        laberinto, inicio, meta = generar_laberinto_con_camino(arreglo=True, **trabajo["generar"])
+    else:
+        laberinto = np.array(trabajo["laberinto"], dtype=np.uint8)
+        inicio, meta = trabajo["inicio"], trabajo["meta"]
+    resultado = buscar_ruta(laberinto, inicio, meta, trabajo.get("motor", "a_estrella"))
+    return {
+        "id": trabajo.get("id"),
+        "motor": resultado["motor"],
+        "inicio": list(inicio),
+        "meta": list(meta),
+        "longitud": resultado["longitud"],
+        "expandidos": resultado["expandidos"],
+        "tiempo_ms": round(1000 * resultado["tiempo"], 3),
+        "camino": None if resultado["camino"] is None else [list(celda) for celda in resultado["camino"]],
+    }
+
+TAREAS = {
+    "horario": resolver_horario,
+    "laberinto": resolver_laberinto,
+}
+
+# Importa los resolvedores en el trabajador, para que el primer pedido no
+# pague el arranque del proceso
+def _calentar(_):
+    import horarios_tabu, laberinto_rutas  # noqa: F401
+    return os.getpid()
+
+
+class Servicio:
+    def __init__(self, procesos=None, max_cola=256, lote=16, espera_ms=2.0, limite_ms=None, cache=0,
+                 rechazar=False):
+        self.procesos = procesos or os.cpu_count()
+        self.max_cola = max_cola
+        self.lote = lote
+        self.espera_ms = espera_ms
+        self.limite_ms = limite_ms  # Plazo por defecto de los pedidos que no traen limite_ms
+        self.cache = cache
+        self.rechazar = rechazar
+        self.cola = None
+        self._en_pool = None
+        self._pool = None
+        self._tareas = []
+        self._en_curso = set()  # Referencias a las tareas lanzadas, para que no se recojan
+        self.contadores = {"recibidos": 0, "respondidos": 0, "rechazados": 0, "vencidos": 0, "errores": 0, "lotes": 0}
+        self._latencias = deque(maxlen=10000)  # ms de los últimos pedidos respondidos
+
+    async def iniciar(self):
+        self._pool = ProcessPoolExecutor(max_workers=self.procesos)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _calentar, k) for k in range(self.procesos)))
+        self.cola = asyncio.Queue(self.max_cola)
+        self._en_pool = asyncio.Semaphore(self.procesos)
+        self._tareas = [asyncio.create_task(self._despachar())]
+
+    async def cerrar(self):
+        await self.cola.join()
+        for tarea in self._tareas:
+            tarea.cancel()
+        self._pool.shutdown()
+
+    # Recibe un pedido ya decodificado; responder(dict) se llama una vez con la
+    # respuesta. Con la cola llena espera a que haya sitio, salvo con rechazar.
+    async def enviar(self, pedido, responder):
+        self.contadores["recibidos"] += 1
+        recibido = time.perf_counter()
+        if pedido.get("tipo") == "estado":
+            # Se cuenta como respondido antes de la foto, así que en reposo cuadra
+            self.contadores["respondidos"] += 1
+            responder({"id": pedido.get("id"), "ok": True, "estado": self.estado()})
+            return
+        if pedido.get("tipo") not in ("sudoku", *TAREAS):
+            self._responder(responder, pedido, recibido, error=f"Tipo de pedido desconocido: {pedido.get('tipo')!r}")
+            return
+        limite_ms = pedido.get("limite_ms", self.limite_ms)
+        if limite_ms is not None:
+            pedido["plazo"] = time.time() + limite_ms / 1000
+        if self.cache and pedido["tipo"] == "sudoku":
+            pedido.setdefault("cache", self.cache)
+        if not self.rechazar:
+            await self.cola.put((pedido, responder, recibido))
+            return
+        try:
+            self.cola.put_nowait((pedido, responder, recibido))
+        except asyncio.QueueFull:
+            self.contadores["rechazados"] += 1
+            self.contadores["respondidos"] += 1
+            responder({"id": pedido.get("id"), "ok": False, "error": "ocupado"})
+
+    def _responder(self, responder, pedido, recibido, resultado=None, error=None):
+        latencia = 1000 * (time.perf_counter() - recibido)
+        self._latencias.append(latencia)
+        self.contadores["respondidos"] += 1
+        if error is None:
+            respuesta = {"id": pedido.get("id"), "ok": True, "resultado": resultado}
+        else:
+            self.contadores["errores"] += 1
+            respuesta = {"id": pedido.get("id"), "ok": False, "error": error}
+        respuesta["latencia_ms"] = round(latencia, 3)
+        responder(respuesta)
+
+    def _vencido(self, pedido):
+        return "plazo" in pedido and time.time() >= pedido["plazo"]
+
+    # Saca pedidos de la cola; los sudokus se juntan en un lote que se envía
+    # al llenarse, al pasar espera_ms o al llegar un pedido de otro tipo
+    async def _despachar(self):
+        loop = asyncio.get_running_loop()
+        lote, cierre = [], None
+        # La lectura pendiente se conserva entre vueltas: cancelarla al vencer la
+        # espera del lote podría perder un pedido ya sacado de la cola
+        siguiente = None
+        while True:
+            if siguiente is None:
+                siguiente = asyncio.ensure_future(self.cola.get())
+            listo, _ = await asyncio.wait({siguiente}, timeout=max(0.0, cierre - loop.time()) if lote else None)
+            vence = not listo
+            elemento = None
+            if listo:
+                elemento, siguiente = siguiente.result(), None
+            if elemento is not None:
+                pedido, responder, recibido = elemento
+                if self._vencido(pedido):
+                    self.contadores["vencidos"] += 1
+                    self._responder(responder, pedido, recibido, error="plazo vencido en cola")
+                    self.cola.task_done()
+                    elemento = None
+                elif pedido["tipo"] == "sudoku":
+                    if not lote:
+                        cierre = loop.time() + self.espera_ms / 1000
+                    lote.append(elemento)
+                    elemento = None
+            if lote and (vence or elemento is not None or len(lote) >= self.lote):
+                await self._en_pool.acquire()
+                self._lanzar(self._ejecutar_lote(lote))
+                lote = []
+            if elemento is not None:
+                await self._en_pool.acquire()
+                self._lanzar(self._ejecutar(*elemento))
+
+    def _lanzar(self, corrutina):
+        tarea = asyncio.create_task(corrutina)
+        self._en_curso.add(tarea)
+        tarea.add_done_callback(self._en_curso.discard)
+
+    async def _ejecutar_lote(self, lote):
+        self.contadores["lotes"] += 1
+        trabajos = [pedido for pedido, _, _ in lote]
+        try:
+            margenes = [self._margen(p) for p in trabajos]
+            espera = None if None in margenes else max(margenes)
+            resultados = await self._en_proceso(resolver_sudokus, trabajos, espera)
+            for (pedido, responder, recibido), resultado in zip(lote, resultados):
+                self._responder(responder, pedido, recibido, resultado)
+        except Exception as error:
+            for pedido, responder, recibido in lote:
+                self._responder(responder, pedido, recibido, error=_mensaje(error))
+        finally:
+            for _ in lote:
+                self.cola.task_done()
+
+    async def _ejecutar(self, pedido, responder, recibido):
+        try:
+            resultado = await self._en_proceso(TAREAS[pedido["tipo"]], pedido, self._margen(pedido))
+            self._responder(responder, pedido, recibido, resultado)
+        except Exception as error:
+            self._responder(responder, pedido, recibido, error=_mensaje(error))
+        finally:
+            self.cola.task_done()
+
+    # Espera máxima de una tarea: su plazo más un margen para la comunicación.
+    # El laberinto no es anytime, así que el margen es lo que le corta.
+    def _margen(self, pedido):
+        if "plazo" not in pedido:
+            return None
+        return max(0.0, pedido["plazo"] - time.time()) + 0.05
+
+    # El hueco del pool (tomado en _despachar) se devuelve cuando el trabajador
+    # termina de verdad, no cuando vence el plazo: si no, entrarían tareas nuevas
+    # a la cola interna del pool mientras el proceso sigue ocupado
+    async def _en_proceso(self, funcion, argumento, espera):
+        loop = asyncio.get_running_loop()
+        try:
+            tarea = self._pool.submit(funcion, argumento)
+        except Exception:
+            self._en_pool.release()
+            raise
+        tarea.add_done_callback(lambda _: loop.call_soon_threadsafe(self._en_pool.release))
+        futuro = asyncio.wrap_future(tarea)
+        if espera is None:
+            return await futuro
+        try:
+            return await asyncio.wait_for(asyncio.shield(futuro), espera)
+        except asyncio.TimeoutError:
+            # El trabajador sigue hasta terminar, pero el pedido ya se responde
+            raise TimeoutError("plazo vencido") from None
+
+    def estado(self):
+        latencias = sorted(self._latencias)
+
+        def percentil(p):
+            return round(latencias[min(len(latencias) - 1, int(p * len(latencias)))], 3) if latencias else None
+        return dict(self.contadores, en_cola=self.cola.qsize(), procesos=self.procesos,
+                    p50_ms=percentil(0.5), p99_ms=percentil(0.99))
+
+def _mensaje(error):
+    return str(error) or type(error).__name__
+
+# Decodifica una línea y la envía; las líneas mal formadas se responden con error
+async def _recibir(servicio, linea, responder):
+    linea = linea.strip()
+    if not linea:
+        return
+    try:
+        pedido = json.loads(linea)
+        if not isinstance(pedido, dict):
+            raise ValueError("Se esperaba un objeto JSON")
+    except ValueError as error:
+        responder({"id": None, "ok": False, "error": f"JSON inválido: {error}"})
+        return
+    await servicio.enviar(pedido, responder)
+
+# stdin se lee en un hilo: así sirve igual si es un pipe, un archivo o una terminal
+async def servir_stdio(servicio):
+    loop = asyncio.get_running_loop()
+
+    def responder(respuesta):
+        sys.stdout.write(json.dumps(respuesta, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+    while linea := await loop.run_in_executor(None, sys.stdin.readline):
+        await _recibir(servicio, linea, responder)
+
+async def servir_unix(servicio, ruta):
+    async def conexion(lector, escritor):
+        def responder(respuesta):
+            if not escritor.is_closing():
+                escritor.write((json.dumps(respuesta, ensure_ascii=False) + "\n").encode())
+
+        while linea := await lector.readline():
+            await _recibir(servicio, linea, responder)
+            await escritor.drain()
+        escritor.close()
+
+    servidor = await asyncio.start_unix_server(conexion, path=ruta)
+    async with servidor:
+        await servidor.serve_forever()
+
+async def _principal(args):
+    servicio = Servicio(args.procesos, args.cola, args.lote, args.espera_ms, args.limite_ms, args.cache,
+                        args.rechazar)
+    await servicio.iniciar()
+    try:
+        if args.socket:
+            await servir_unix(servicio, args.socket)
+        else:
+            await servir_stdio(servicio)
+    finally:
+        await servicio.cerrar()
+
+def main():
+    parser = argparse.ArgumentParser(description="Servicio de resolución por JSON en líneas (stdin/stdout o socket)")
+    parser.add_argument("--socket", metavar="RUTA", help="escuchar en un socket Unix en lugar de stdin/stdout")
+    parser.add_argument("-p", "--procesos", type=int, default=None)
+    parser.add_argument("--cola", type=int, default=256, help="pedidos en espera antes de rechazar")
+    parser.add_argument("--lote", type=int, default=16, help="sudokus por lote")
+    parser.add_argument("--espera-ms", type=float, default=2.0, help="espera máxima para completar un lote")
+    parser.add_argument("--limite-ms", type=float, default=None, help="plazo por defecto de cada pedido")
+    parser.add_argument("--cache", type=int, default=0, metavar="N", help="caché de sudokus por proceso")
+    parser.add_argument("--rechazar", action="store_true",
+                        help="con la cola llena, responder \"ocupado\" en lugar de dejar de leer")
+    args = parser.parse_args()
+    asyncio.run(_principal(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+import hashlib
+import itertools
+from collections import OrderedDict
+import numpy as np
+from sudoku_evaluador import tamano_caja, tipo_tablero
+from sudoku_tabu_search import SudokuTabu
+
+# Caché de soluciones delante de SudokuTabu. Cada tablero se lleva a una forma
+# canónica invariante frente a las simetrías del Sudoku (transponer, permutar
+# bandas y filas dentro de cada banda, pilas y columnas dentro de cada pila,
+# reetiquetar dígitos), así que un sudoku repetido y cualquiera de sus
+# variantes comparten entrada. La solución se guarda en el marco canónico y
+# se devuelve deshaciendo la transformación del tablero consultado.
+
+# Transformación: (transpuesto, orden de filas, orden de columnas, etiquetas),
+# donde etiquetas[d] es el dígito canónico de d (etiquetas[0] == 0)
+
+def aplicar_transformacion(tablero, transformacion):
+    transpuesto, filas, columnas, etiquetas = transformacion
+    tablero = np.asarray(tablero)
+    if transpuesto:
+        tablero = tablero.T
+    return etiquetas[tablero[np.ix_(filas, columnas)]]
+
+def deshacer_transformacion(tablero, transformacion):
+    transpuesto, filas, columnas, etiquetas = transformacion
+    inversa = np.empty_like(etiquetas)
+    inversa[etiquetas] = np.arange(len(etiquetas), dtype=etiquetas.dtype)
+    original = np.empty_like(tablero)
+    original[np.ix_(filas, columnas)] = inversa[tablero]
+    return original.T.copy() if transpuesto else original
+
+# Órdenes de filas compatibles con el tablero: bandas y filas se ordenan por
+# invariantes (pistas de la fila y cuántas pistas tienen sus columnas) y solo
+# se prueban las permutaciones de los empates, hasta `maximo` órdenes
+def _ordenes(dados, tam_caja, maximo):
+    por_columna = dados.sum(axis=0)
+    invariante = [(int(fila.sum()), tuple(sorted(por_columna[fila].tolist()))) for fila in dados]
+    bandas = [list(range(b * tam_caja, (b + 1) * tam_caja)) for b in range(tam_caja)]
+    inv_banda = [tuple(sorted(invariante[i] for i in banda)) for banda in bandas]
+    opciones_filas = [list(_permutaciones_empates(banda, invariante)) for banda in bandas]
+    ordenes = (
+        np.concatenate(filas)
+        for orden_bandas in _permutaciones_empates(range(tam_caja), inv_banda)
+        for filas in itertools.product(*(opciones_filas[b] for b in orden_bandas))
+    )
+    return list(itertools.islice(ordenes, maximo))
+
+# Permutaciones de elementos ordenados por clave que solo reordenan empates
+def _permutaciones_empates(elementos, clave):
+    grupos = [list(g) for _, g in itertools.groupby(sorted(elementos, key=lambda e: clave[e]), key=lambda e: clave[e])]
+    for combinacion in itertools.product(*(itertools.permutations(g) for g in grupos)):
+        yield [e for grupo in combinacion for e in grupo]
+
+# Etiquetas por candidato: los dígitos se numeran por orden de aparición
+# (lectura por filas); los ausentes van detrás, en orden numérico
+def _etiquetas(candidatos, n):
+    coincide = candidatos[:, :, None] == np.arange(1, n + 1)
+    primera = np.where(coincide.any(axis=1), coincide.argmax(axis=1), candidatos.shape[1])
+    orden = np.argsort(primera, axis=1, kind="stable")
+    etiquetas = np.zeros((len(candidatos), n + 1), dtype=candidatos.dtype)
+    nuevas = np.broadcast_to(np.arange(1, n + 1, dtype=candidatos.dtype), orden.shape)
+    np.put_along_axis(etiquetas[:, 1:], orden, nuevas, axis=1)
+    return etiquetas
+
+# Forma canónica: el menor (lexicográfico) de los tableros transformados que
+# se prueban. Devuelve (clave en bytes, transformación). Con muchos empates
+# (tableros muy simétricos) se prueban a lo sumo max_candidatos órdenes por
+# eje, y dos variantes podrían no coincidir: eso solo cuesta un fallo de caché.
+def forma_canonica(tablero, max_candidatos=32):
+    tablero = np.asarray(tablero)
+    n = len(tablero)
+    tam_caja = tamano_caja(tablero)
+    tablero = tablero.astype(tipo_tablero(n), copy=False)
+    mejor, transformacion = None, None
+    for transpuesto in (False, True):
+        orientado = tablero.T if transpuesto else tablero
+        dados = orientado != 0
+        filas = np.array(_ordenes(dados, tam_caja, max_candidatos))
+        columnas = np.array(_ordenes(dados.T, tam_caja, max_candidatos))
+        candidatos = orientado[filas[:, None, :, None], columnas[None, :, None, :]].reshape(-1, n * n)
+        etiquetas = _etiquetas(candidatos, n)
+        candidatos = np.take_along_axis(etiquetas, candidatos.astype(np.intp), axis=1)
+        k = np.lexsort(candidatos.T[::-1])[0]
+        clave = candidatos[k].tobytes()
+        if mejor is None or clave < mejor:
+            f, c = divmod(int(k), len(columnas))
+            mejor, transformacion = clave, (transpuesto, filas[f], columnas[c], etiquetas[k])
+    return mejor, transformacion
+
+
+# Caché LRU en memoria (clave canónica -> solución canónica en bytes), con un
+# almacén persistente opcional detrás. Solo se guardan soluciones completas.
+# Delante hay otra LRU por los bytes exactos del tablero, que responde a los
+# sudokus repetidos tal cual sin calcular la forma canónica.
+class CacheSudoku:
+    def __init__(self, maximo=10000, almacen=None, max_candidatos=32):
+        self.maximo = maximo
+        self.almacen = almacen
+        self.max_candidatos = max_candidatos
+        self._entradas = OrderedDict()
+        self._exactas = OrderedDict()  # bytes del tablero -> solución en su orientación
+        self.aciertos = 0
+        self.fallos = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def _obtener(self, clave):
+        solucion = self._entradas.get(clave)
+        if solucion is not None:
+            self._entradas.move_to_end(clave)
+        elif self.almacen is not None:
+            solucion = self.almacen.obtener(clave)
+            if solucion is not None:
+                self._poner(clave, solucion)
+        return solucion
+
+    def _poner(self, clave, solucion, tabla=None):
+        tabla = self._entradas if tabla is None else tabla
+        tabla[clave] = solucion
+        tabla.move_to_end(clave)
+        if len(tabla) > self.maximo:
+            tabla.popitem(last=False)
+
+    # Solución en la orientación del tablero consultado, o None
+    def buscar(self, tablero):
+        tablero = np.asarray(tablero)
+        crudo = tablero.astype(tipo_tablero(len(tablero)), copy=False).tobytes()
+        solucion = self._exactas.get(crudo)
+        if solucion is not None:
+            self._exactas.move_to_end(crudo)
+            self.aciertos += 1
+            return solucion.copy()
+        clave, transformacion = forma_canonica(tablero, self.max_candidatos)
+        guardada = self._obtener(clave)
+        if guardada is None:
+            self.fallos += 1
+            return None
+        self.aciertos += 1
+        n = len(tablero)
+        solucion = deshacer_transformacion(np.frombuffer(guardada, dtype=transformacion[3].dtype).reshape(n, n),
+                                           transformacion)
+        self._poner(crudo, solucion, self._exactas)
+        return solucion.copy()
+
+    def guardar(self, tablero, solucion):
+        tablero = np.asarray(tablero)
+        tipo = tipo_tablero(len(tablero))
+        solucion = np.asarray(solucion, dtype=tipo)
+        clave, transformacion = forma_canonica(tablero, self.max_candidatos)
+        valor = aplicar_transformacion(solucion, transformacion).astype(tipo).tobytes()
+        self._poner(clave, valor)
+        self._poner(tablero.astype(tipo, copy=False).tobytes(), solucion.copy(), self._exactas)
+        if self.almacen is not None:
+            self.almacen.poner(clave, valor)
+
+    # Consulta la caché y, si falla, resuelve con SudokuTabu(**opciones);
+    # devuelve (solución o mejor tablero, resuelto, desde_cache)
+    def resolver(self, tablero, max_iteraciones=None, **opciones):
+        solucion = self.buscar(tablero)
+        if solucion is not None:
+            return solucion, True, True
+        juego = SudokuTabu(tablero, **opciones)
+        if max_iteraciones is not None:
+            juego.max_iteraciones = max_iteraciones
+        resuelto = juego.resolver()
+        if resuelto:
+            self.guardar(tablero, juego.mejor_solucion)
+        return juego.mejor_solucion, resuelto, False
+
+    def estadisticas(self):
+        consultas = self.aciertos + self.fallos
+        return {"entradas": len(self), "aciertos": self.aciertos, "fallos": self.fallos,
+                "tasa_aciertos": self.aciertos / consultas if consultas else None}
+
+
+# Almacén persistente en un archivo mapeado en memoria: tabla hash de
+# direccionamiento abierto con sondeo lineal y registros de tamaño fijo
+# (ocupado, clave, solución). Sin redimensionado: si las `sondeo` posiciones
+# de una clave están ocupadas se sobrescribe la primera, como en una caché.
+# Pensado para un solo escritor; varios procesos pueden leer a la vez.
+class AlmacenMemmap:
+    MAGICO = b"SDKC"
+    CABECERA = 16  # mágico, n y capacidad (uint32)
+
+    def __init__(self, ruta, n=9, capacidad=1 << 16, sondeo=8):
+        self.ruta = ruta
+        self.sondeo = sondeo
+        try:
+            with open(ruta, "rb") as archivo:
+                cabecera = archivo.read(self.CABECERA)
+        except FileNotFoundError:
+            cabecera = b""
+        if cabecera:
+            if cabecera[:4] != self.MAGICO:
+                raise ValueError(f"{ruta} no es un almacén de soluciones")
+            n, capacidad, _ = np.frombuffer(cabecera[4:], dtype="<u4").tolist()
+        self.n = n
+        self.capacidad = capacidad
+        tamano_tablero = n * n * np.dtype(tipo_tablero(n)).itemsize
+        registro = np.dtype([("ocupado", "u1"), ("clave", f"V{tamano_tablero}"), ("solucion", f"V{tamano_tablero}")])
+        if not cabecera:
+            # Archivo nuevo: cabecera y tabla vacía (ceros, ninguna posición ocupada)
+            with open(ruta, "wb") as archivo:
+                archivo.write(self.MAGICO + np.array([n, capacidad, 0], dtype="<u4").tobytes())
+                archivo.truncate(self.CABECERA + capacidad * registro.itemsize)
+        self.tabla = np.memmap(ruta, dtype=registro, mode="r+", offset=self.CABECERA, shape=(capacidad,))
+
+    def _posiciones(self, clave):
+        inicio = int.from_bytes(hashlib.blake2b(clave, digest_size=8).digest(), "little") % self.capacidad
+        return [(inicio + k) % self.capacidad for k in range(self.sondeo)]
+
+    def obtener(self, clave):
+        for k in self._posiciones(clave):
+            registro = self.tabla[k]
+            if not registro["ocupado"]:
+                return None
+            if bytes(registro["clave"]) == clave:
+                return bytes(registro["solucion"])
+        return None
+
+    def poner(self, clave, solucion):
+        posiciones = self._posiciones(clave)
+        destino = posiciones[0]
+        for k in posiciones:
+            registro = self.tabla[k]
+            if not registro["ocupado"] or bytes(registro["clave"]) == clave:
+                destino = k
+                break
+        self.tabla[destino] = (1, clave, solucion)
+
+    def __len__(self):
+        return int(self.tabla["ocupado"].sum())
+
+    def sincronizar(self):
+        self.tabla.flush()
+
+    def cerrar(self):
+        self.tabla.flush()
+        del self.tabla
@@ -0,0 +1,126 @@
+import math
+from functools import lru_cache
+import numpy as np
+
+# Tamaño de caja de un tablero N²×N² (3 para 9×9, 4 para 16×16, 5 para 25×25)
+def tamano_caja(tablero):
+    n = len(tablero)
+    tam_caja = math.isqrt(n)
+    if tam_caja * tam_caja != n:
+        raise ValueError(f"Un tablero de {n}×{n} no tiene cajas cuadradas")
+    return tam_caja
+
+# Tipo compacto para los dígitos 0..n del tablero
+def tipo_tablero(n):
+    return np.uint8 if n < 256 else np.uint16
+
+# Índice de caja de cada celda, como lista de listas (escalar) y como arreglo (lotes)
+@lru_cache(maxsize=None)
+def tabla_cajas(tam_caja):
+    n = tam_caja * tam_caja
+    filas, columnas = np.indices((n, n))
+    cajas = (filas // tam_caja) * tam_caja + columnas // tam_caja
+    cajas.setflags(write=False)
+    return cajas.tolist(), cajas
+
+# Conteo completo de conflictos (3n conjuntos por tablero)
+def contar_conflictos(tablero, tam_caja=None):
+    tam_caja = tam_caja or tamano_caja(tablero)
+    n = tam_caja * tam_caja
+    conflictos = 0
+    for i in range(n):
+        conflictos += n - len(set(tablero[i, :]))
+        conflictos += n - len(set(tablero[:, i]))
+    for f in range(0, n, tam_caja):
+        for c in range(0, n, tam_caja):
+            subcuadro = tablero[f:f+tam_caja, c:c+tam_caja].flatten()
+            conflictos += n - len(set(subcuadro))
+    return conflictos
+
+
+# Evaluador incremental: tablas de conteo de dígitos por fila, columna y caja.
+# Un intercambio de dos celdas se evalúa en O(1) sin copiar el tablero.
+class EvaluadorIncremental:
+    def __init__(self, tablero, tam_caja=None):
+        self.tablero = tablero
+        self.tam_caja = tam_caja or tamano_caja(tablero)
+        self.n = self.tam_caja * self.tam_caja
+        self.caja_de, self._caja_de = tabla_cajas(self.tam_caja)
+        self.recalcular()
+
+    def recalcular(self):
+        c, n = self.tam_caja, self.n
+        # Codificación one-hot (n, n, n+1) del tablero; el 0 cuenta como un valor más
+        one_hot = self.tablero[:, :, None] == np.arange(n + 1)
+        self.conteos = np.stack([
+            one_hot.sum(axis=1),
+            one_hot.sum(axis=0),
+            one_hot.reshape(c, c, c, c, n + 1).sum(axis=(1, 3)).reshape(n, n + 1),
+        ]).astype(np.int16)
+        # Tablas en listas de Python para la evaluación escalar (más rápida que indexar NumPy)
+        self.filas, self.columnas, self.cajas = self.conteos.tolist()
+        # n - len(set(unidad)) equivale a sumar (conteo - 1) de cada dígito presente
+        self.conflictos = int(np.clip(self.conteos - 1, 0, None).sum())
+        return self.conflictos
+
+    @staticmethod
+    def _delta_unidad(unidad, sale, entra):
+        return (unidad[entra] >= 1) - (unidad[sale] >= 2)
+
+    def delta_intercambio(self, i1, j1, i2, j2):
+        a = int(self.tablero[i1, j1])
+        b = int(self.tablero[i2, j2])
+        if a == b:
+            return 0
+        delta = 0
+        # Las unidades compartidas por ambas celdas no cambian
+        if i1 != i2:
+            delta += self._delta_unidad(self.filas[i1], a, b) + self._delta_unidad(self.filas[i2], b, a)
+        if j1 != j2:
+            delta += self._delta_unidad(self.columnas[j1], a, b) + self._delta_unidad(self.columnas[j2], b, a)
+        k1, k2 = self.caja_de[i1][j1], self.caja_de[i2][j2]
+        if k1 != k2:
+            delta += self._delta_unidad(self.cajas[k1], a, b) + self._delta_unidad(self.cajas[k2], b, a)
+        return delta
+
+    def aplicar_intercambio(self, i1, j1, i2, j2):
+        delta = self.delta_intercambio(i1, j1, i2, j2)
+        a = int(self.tablero[i1, j1])
+        b = int(self.tablero[i2, j2])
+        if a != b:
+            k1, k2 = self.caja_de[i1][j1], self.caja_de[i2][j2]
+            for t, tabla, u1, u2 in ((0, self.filas, i1, i2), (1, self.columnas, j1, j2), (2, self.cajas, k1, k2)):
+                tabla[u1][a] -= 1
+                tabla[u1][b] += 1
+                tabla[u2][b] -= 1
+                tabla[u2][a] += 1
+                conteo = self.conteos[t]
+                conteo[u1, a] -= 1
+                conteo[u1, b] += 1
+                conteo[u2, b] -= 1
+                conteo[u2, a] += 1
+            self.tablero[i1, j1], self.tablero[i2, j2] = b, a
+        self.conflictos += delta
+        return self.conflictos
+
+    # Deltas de K intercambios a la vez; i1, j1, i2, j2 son arreglos de índices
+    def delta_lote(self, i1, j1, i2, j2):
+        a = self.tablero[i1, j1]
+        b = self.tablero[i2, j2]
+        delta = np.zeros(len(a), dtype=np.int16)
+        k1, k2 = self._caja_de[i1, j1], self._caja_de[i2, j2]
+        for conteo, u1, u2 in zip(self.conteos, (i1, j1, k1), (i2, j2, k2)):
+            # Con 0/1 se consulta si el dígito entrante ya estaba y si el saliente estaba repetido
+            d = (np.clip(conteo[u1, b], 0, 1) - np.clip(conteo[u1, a] - 1, 0, 1)
+                 + np.clip(conteo[u2, a], 0, 1) - np.clip(conteo[u2, b] - 1, 0, 1))
+            delta += np.where(u1 != u2, d, 0).astype(np.int16)
+        return np.where(a != b, delta, 0)
+
+    # Modo de verificación: compara el valor incremental con el recuento completo
+    def verificar(self):
+        completo = contar_conflictos(self.tablero, self.tam_caja)
+        if completo != self.conflictos or self.conteos.tolist() != [self.filas, self.columnas, self.cajas]:
+            raise RuntimeError(
+                f"Evaluador incremental desincronizado: {self.conflictos} != {completo}"
+            )
+        return completo
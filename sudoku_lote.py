@@ -0,0 +1,161 @@
+import argparse
+import itertools
+import json
+import sys
+import time
+import zlib
+from flujo import abrir_archivo, ejecutar_en_flujo
+from sudoku_tabu_search import SudokuTabu
+
+# Resolución por lotes: lee sudokus de un archivo línea a línea (formato de
+# 81 caracteres o JSONL), los reparte en bloques entre un pool de procesos y
+# escribe los resultados en orden como JSONL. Solo hay un número acotado de
+# bloques en vuelo, así que la memoria no crece con el tamaño de la entrada.
+
+# Una línea de 81 caracteres ("." o "0" para las vacías) o un objeto JSON con
+# "tablero" (texto de 81 caracteres o lista de filas) e "id" opcional
+def leer_sudoku(linea, numero):
+    linea = linea.strip()
+    if not linea or linea.startswith("#"):
+        return None
+    if linea.startswith("{"):
+        datos = json.loads(linea)
+        identificador = datos.get("id", numero)
+        tablero = datos["tablero"]
+        if isinstance(tablero, str):
+            tablero = texto_a_tablero(tablero)
+        return identificador, tablero
+    return numero, texto_a_tablero(linea)
+
+def texto_a_tablero(texto):
+    if len(texto) != 81:
+        raise ValueError(f"Se esperaban 81 caracteres y hay {len(texto)}")
+    invalidos = set(texto) - set(".0123456789")
+    if invalidos:
+        raise ValueError(f"Caracteres no válidos: {''.join(sorted(invalidos))!r}")
+    valores = [0 if c == "." else int(c) for c in texto]
+    return [valores[k:k+9] for k in range(0, 81, 9)]
+
+def tablero_a_texto(tablero):
+    return "".join(str(int(v)) for fila in tablero for v in fila)
+
+# Una línea que no se puede leer no detiene el lote: se pasa como
+# (número de línea, ValueError) y su resultado es un registro con "error"
+def leer_sudokus(archivo):
+    for numero, linea in enumerate(archivo, 1):
+        try:
+            sudoku = leer_sudoku(linea, numero)
+        except (ValueError, KeyError, TypeError) as error:
+            mensaje = f"falta {error}" if isinstance(error, KeyError) else str(error)
+            sudoku = numero, ValueError(mensaje)
+        if sudoku is not None:
+            yield sudoku
+
+# Caché de soluciones de cada proceso trabajador, creada en el primer uso
+_cache = None
+
+def resolver_uno(identificador, tablero, opciones, semilla=None):
+    global _cache
+    inicio = time.perf_counter()
+    if opciones.get("cache"):
+        if _cache is None:
+            from sudoku_cache import CacheSudoku
+            _cache = CacheSudoku(opciones["cache"])
+        solucion = _cache.buscar(tablero)
+        if solucion is not None:
+            return {
+                "id": identificador,
+                "resuelto": True,
+                "conflictos": 0,
+                "iteraciones": 0,
+                "limite_alcanzado": False,
+                "cache": True,
+                "tiempo_ms": round(1000 * (time.perf_counter() - inicio), 3),
+                "solucion": tablero_a_texto(solucion) if len(solucion) == 9 else solucion.tolist(),
+            }
+    juego = SudokuTabu(tablero, semilla=semilla, **opciones.get("solver", {}))
+    juego.max_iteraciones = opciones.get("max_iteraciones", juego.max_iteraciones)
+    resuelto = juego.resolver(limite_ms=opciones.get("limite_ms"))
+    if resuelto and _cache is not None:
+        _cache.guardar(tablero, juego.mejor_solucion)
+    return {
+        "id": identificador,
+        "resuelto": bool(resuelto),
+        "conflictos": int(juego.mejor_conflictos),
+        "iteraciones": juego.iteracion_actual,
+        "limite_alcanzado": juego.limite_alcanzado,
+        "cache": False,
+        "tiempo_ms": round(1000 * (time.perf_counter() - inicio), 3),
+        # Los tableros mayores que 9×9 no caben en un carácter por celda
+        "solucion": tablero_a_texto(juego.mejor_solucion) if juego.n == 9 else juego.mejor_solucion.tolist(),
+    }
+
+# Tarea de trabajador: un bloque de sudokus, para amortizar la comunicación entre procesos
+def resolver_bloque(bloque, opciones):
+    semilla = opciones.get("semilla")
+    resultados = []
+    for identificador, tablero in bloque:
+        if isinstance(tablero, Exception):
+            resultados.append({"id": identificador, "error": str(tablero)})
+            continue
+        # La semilla de cada sudoku depende solo de su id, no del trabajador que lo resuelve
+        semilla_sudoku = None if semilla is None else [semilla, zlib.crc32(str(identificador).encode())]
+        try:
+            resultados.append(resolver_uno(identificador, tablero, opciones, semilla_sudoku))
+        except Exception as error:
+            # Un tablero mal formado (p. ej. en JSON) tampoco tira el bloque entero
+            resultados.append({"id": identificador, "error": str(error) or type(error).__name__})
+    return resultados
+
+def bloques(iterable, tamano):
+    iterador = iter(iterable)
+    while True:
+        bloque = list(itertools.islice(iterador, tamano))
+        if not bloque:
+            return
+        yield bloque
+
+# Genera los resultados en el orden de entrada con a lo sumo `en_vuelo` bloques pendientes
+def resolver_flujo(sudokus, opciones=None, procesos=None, tamano_bloque=64, en_vuelo=None):
+    opciones = opciones or {}
+    tareas = ((bloque, opciones) for bloque in bloques(sudokus, tamano_bloque))
+    return ejecutar_en_flujo(tareas, resolver_bloque, procesos, en_vuelo)
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolución de sudokus por lotes")
+    parser.add_argument("entrada", help="archivo de sudokus (81 caracteres o JSONL); '-' para stdin")
+    parser.add_argument("-o", "--salida", default="-", help="archivo JSONL de resultados; '-' para stdout")
+    parser.add_argument("-p", "--procesos", type=int, default=None)
+    parser.add_argument("--bloque", type=int, default=64, help="sudokus por tarea")
+    parser.add_argument("--iteraciones", type=int, default=100)
+    parser.add_argument("--modo", choices=("incremental", "lotes"), default="incremental")
+    parser.add_argument("--vecinos", type=int, default=50)
+    parser.add_argument("--modelo", choices=("libre", "filas", "cajas"), default="libre")
+    parser.add_argument("--semilla", type=int, default=None)
+    parser.add_argument("--limite-ms", type=float, default=None,
+                        help="tiempo máximo por sudoku; al agotarse se devuelve la mejor solución")
+    parser.add_argument("--cache", type=int, default=0, metavar="N",
+                        help="recordar hasta N soluciones por proceso (también de variantes simétricas)")
+    args = parser.parse_args()
+
+    opciones = {
+        "max_iteraciones": args.iteraciones,
+        "limite_ms": args.limite_ms,
+        "cache": args.cache,
+        "semilla": args.semilla,
+        "solver": {"modo": args.modo, "vecinos": args.vecinos, "modelo": args.modelo},
+    }
+    total = resueltos = errores = 0
+    inicio = time.perf_counter()
+    with abrir_archivo(args.entrada) as entrada, abrir_archivo(args.salida, "w") as salida:
+        for resultado in resolver_flujo(leer_sudokus(entrada), opciones, args.procesos, args.bloque):
+            salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+            total += 1
+            resueltos += resultado.get("resuelto", False)
+            errores += "error" in resultado
+    segundos = time.perf_counter() - inicio
+    print(f"{resueltos}/{total} resueltos ({errores} con error) en {segundos:.2f}s "
+          f"({3600 * total / max(segundos, 1e-9):.0f} sudokus/hora)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
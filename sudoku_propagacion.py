@@ -0,0 +1,137 @@
+from collections import deque
+from functools import lru_cache
+
+class Contradiccion(Exception):
+    pass
+
+# Unidades (filas, columnas, cajas) y vecinos de cada celda, por tamaño de caja
+@lru_cache(maxsize=None)
+def tablas_unidades(tam_caja=3):
+    n = tam_caja * tam_caja
+    filas = [[i * n + j for j in range(n)] for i in range(n)]
+    columnas = [[i * n + j for i in range(n)] for j in range(n)]
+    cajas = [
+        [(f + i) * n + (c + j) for i in range(tam_caja) for j in range(tam_caja)]
+        for f in range(0, n, tam_caja) for c in range(0, n, tam_caja)
+    ]
+    unidades = filas + columnas + cajas
+    unidades_de = [[] for _ in range(n * n)]
+    for unidad in unidades:
+        for celda in unidad:
+            unidades_de[celda].append(unidad)
+    vecinos = [
+        tuple(sorted({p for unidad in unidades_de[celda] for p in unidad} - {celda}))
+        for celda in range(n * n)
+    ]
+    return unidades, vecinos
+
+# Propagación de restricciones con máscaras de candidatos de n bits por celda.
+# Cada asignación quita el dígito de los vecinos de forma incremental; además
+# se aplican únicos ocultos y pares desnudos hasta llegar a un punto fijo.
+class Propagador:
+    def __init__(self, tablero, tam_caja=3):
+        self.n = tam_caja * tam_caja
+        self.unidades, self.vecinos = tablas_unidades(tam_caja)
+        self.todos = (1 << self.n) - 1
+        self.valores = [0] * (self.n * self.n)
+        self.candidatos = [self.todos] * (self.n * self.n)
+        self.cola = deque()
+        self.asignaciones = []  # (celda, valor) deducidas, en orden
+        for celda, valor in enumerate(int(v) for fila in tablero for v in fila):
+            if valor:
+                self.cola.append((celda, valor))
+        self._dadas = len(self.cola)
+
+    def _asignar(self, celda, valor):
+        bit = 1 << (valor - 1)
+        if self.valores[celda]:
+            if self.valores[celda] != valor:
+                raise Contradiccion(f"Celda {divmod(celda, self.n)} ya tiene {self.valores[celda]}")
+            return
+        if not self.candidatos[celda] & bit:
+            raise Contradiccion(f"{valor} no es candidato en {divmod(celda, self.n)}")
+        self.valores[celda] = valor
+        self.candidatos[celda] = bit
+        for vecino in self.vecinos[celda]:
+            self._eliminar(vecino, bit)
+
+    def _eliminar(self, celda, bits):
+        mascara = self.candidatos[celda]
+        if not mascara & bits:
+            return False
+        mascara &= ~bits
+        self.candidatos[celda] = mascara
+        if not mascara:
+            raise Contradiccion(f"Sin candidatos en {divmod(celda, self.n)}")
+        if not self.valores[celda] and mascara.bit_count() == 1:
+            # Único desnudo
+            self.cola.append((celda, mascara.bit_length()))
+        return True
+
+    def _vaciar_cola(self):
+        while self.cola:
+            celda, valor = self.cola.popleft()
+            ya_asignada = self.valores[celda]
+            self._asignar(celda, valor)
+            if self._dadas:
+                self._dadas -= 1
+            elif not ya_asignada:
+                self.asignaciones.append((celda, valor))
+
+    # Un dígito que solo cabe en una celda de la unidad va en esa celda
+    def _unicos_ocultos(self):
+        encontrados = False
+        for unidad in self.unidades:
+            una_vez = 0
+            varias = 0
+            colocados = 0
+            for celda in unidad:
+                if self.valores[celda]:
+                    colocados |= self.candidatos[celda]
+                    continue
+                mascara = self.candidatos[celda]
+                varias |= una_vez & mascara
+                una_vez |= mascara
+            faltantes = self.todos & ~colocados
+            if faltantes & ~una_vez:
+                raise Contradiccion("Un dígito no cabe en ninguna celda de la unidad")
+            unicos = una_vez & ~varias & faltantes
+            while unicos:
+                bit = unicos & -unicos
+                unicos ^= bit
+                for celda in unidad:
+                    if not self.valores[celda] and self.candidatos[celda] & bit:
+                        self.cola.append((celda, bit.bit_length()))
+                        encontrados = True
+                        break
+        return encontrados
+
+    # Dos celdas de una unidad con los mismos dos candidatos los excluyen del resto
+    def _pares_desnudos(self):
+        cambios = False
+        for unidad in self.unidades:
+            vistos = {}
+            for celda in unidad:
+                mascara = self.candidatos[celda]
+                if self.valores[celda] or mascara.bit_count() != 2:
+                    continue
+                if mascara not in vistos:
+                    vistos[mascara] = celda
+                    continue
+                pareja = vistos[mascara]
+                for otra in unidad:
+                    if otra != celda and otra != pareja and not self.valores[otra]:
+                        cambios |= self._eliminar(otra, mascara)
+        return cambios
+
+    def propagar(self):
+        while True:
+            self._vaciar_cola()
+            if self._unicos_ocultos():
+                continue
+            if self._pares_desnudos() or self.cola:
+                continue
+            return self.asignaciones
+
+    def resuelto(self):
+        return all(self.valores)
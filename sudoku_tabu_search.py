@@ -1,267 +1,421 @@
-import numpy as np
-import pygame
-import random
 import time
+import numpy as np
+import puntos_control
+from eventos import Eventos
+from sudoku_evaluador import EvaluadorIncremental, contar_conflictos, tamano_caja, tipo_tablero
+from sudoku_propagacion import Contradiccion, Propagador
+from tabu_memoria import MemoriaTabu, Zobrist
+from traza import HistorialAcotado
 
+SUDOKU_EJEMPLO = [
+    [5, 0, 7, 6, 0, 0, 0, 3, 4],
+    [0, 0, 9, 0, 0, 4, 0, 0, 0],
+    [3, 0, 6, 2, 0, 5, 0, 9, 0],
+    [6, 0, 2, 0, 0, 0, 0, 1, 0],
+    [0, 3, 8, 0, 0, 6, 0, 4, 7],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 9, 0, 0, 0, 0, 0, 7, 8],
+    [7, 0, 3, 4, 0, 0, 5, 6, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0],
+]
+
+# Motor de búsqueda tabú para Sudoku, sin dependencias gráficas.
+# El progreso se publica como eventos de paso a los observadores suscritos.
 class SudokuTabu:
-    def __init__(self, tablero_inicial, velocidad_ms=500):
-        self.tablero = np.array(tablero_inicial)
+    # modo: "incremental" (deltas O(1) vecino a vecino) o "lotes" (NumPy).
+    # modelo: "libre" intercambia dos celdas cualesquiera; "filas" o "cajas",
+    # solo dentro de esa unidad, que así nunca tiene conflictos. Tableros N²×N².
+    # semilla fija la aleatoriedad; instrumentacion, traza y reactivo son opcionales.
+    def __init__(self, tablero_inicial, velocidad_ms=500, verificar=False, observador=None,
+                 tabu_tamano=100, modo="incremental", vecinos=50, modelo="libre", tam_caja=None,
+                 semilla=None, instrumentacion=None, traza=None, max_soluciones=16, reactivo=None):
+        self.rng = np.random.default_rng(semilla)
+        self.instr = instrumentacion
+        self.traza = traza
+        self.reactivo = reactivo
+        self.tam_caja = tam_caja or tamano_caja(tablero_inicial)
+        self.n = self.tam_caja * self.tam_caja
+        self.tablero = np.array(tablero_inicial, dtype=tipo_tablero(self.n))
         self.tablero_original = self.tablero.copy()
         self.celdas_vacias_originales = self.obtener_celdas_vacias()
-        self.tabu_lista = []
-        self.tabu_tamano = 100
-        self.velocidad_ms = velocidad_ms
+        # Memoria tabú por movimiento; un movimiento tabú se admite si mejora la mejor solución
+        self.tabu_tamano = tabu_tamano
+        self.tabu_lista = MemoriaTabu(reactivo.tenencia if reactivo else tabu_tamano, aspiracion=self.aspiracion)
+        self.velocidad_ms = velocidad_ms  # Solo lo usa el visualizador
         self.mejor_solucion = None
         self.mejor_conflictos = float('inf')
-        self.soluciones_encontradas = []
+        self.soluciones_encontradas = HistorialAcotado(max_soluciones)
         self.iteracion_actual = 0
         self.max_iteraciones = 100
+        self.evaluador = None
+        self.verificar = verificar  # Recuento completo tras cada movimiento (depuración)
+        self.eventos = Eventos(observador)
+        if modo not in ("incremental", "lotes"):
+            raise ValueError(f"Modo de evaluación desconocido: {modo}")
+        self.modo = modo
+        self.vecinos = vecinos
+        if modelo not in ("libre", "filas", "cajas"):
+            raise ValueError(f"Modelo de movimiento desconocido: {modelo}")
+        self.modelo = modelo
+        self._pares = None
+        self.evaluaciones = 0  # Vecinos evaluados en total
+        self.limite_alcanzado = False
+        self._actual = None  # Tablero de búsqueda al cortar por límite, para reanudar
 
     def obtener_celdas_vacias(self):
-        return [(i, j) for i in range(9) for j in range(9) if self.tablero[i][j] == 0]
+        return [(i, j) for i in range(self.n) for j in range(self.n) if self.tablero[i][j] == 0]
 
-    def es_valido(self, i, j, num):
-        if num in self.tablero[i]: return False
-        if num in self.tablero[:, j]: return False
-        f, c = 3 * (i // 3), 3 * (j // 3)
-        if num in self.tablero[f:f+3, c:c+3]: return False
-        return True
+    # Propagación de restricciones (únicos desnudos y ocultos, pares desnudos)
+    # antes de la búsqueda; puede resolver el tablero sin llegar a la fase tabú
+    def rellenar_logicamente(self):
+        if self.eventos:
+            self.eventos.emitir("relleno_inicio")
+        propagador = Propagador(self.tablero, self.tam_caja)
+        try:
+            propagador.propagar()
+        except Contradiccion:
+            pass  # Tablero inconsistente: se conservan las deducciones previas
+        for celda, num in propagador.asignaciones:
+            i, j = divmod(celda, self.n)
+            self.tablero[i, j] = num
+            if self.eventos:
+                self.eventos.emitir("relleno", celda=(i, j), num=num)
 
-    def rellenar_logicamente(self, screen, font):
-        self.mostrar_mensaje(screen, font, "Iniciando relleno lógico...", (385, 10))
-        progreso = True
-        while progreso:
-            progreso = False
-            for (i, j) in self.celdas_vacias_originales:
-                if self.tablero[i, j] == 0:
-                    posibles = [n for n in range(1, 10) if self.es_valido(i, j, n)]
-                    if len(posibles) == 1:
-                        self.tablero[i, j] = posibles[0]
-                        progreso = True
-                        self.dibujar_tablero_pygame(screen, font, celda_actual=(i, j))
-                        self.mostrar_mensaje(screen, font, f"Rellenando ({i},{j}) con {posibles[0]}", (385, 10))
-                        pygame.display.flip()
-                        pygame.time.wait(self.velocidad_ms)
-        
-        # Verificar si quedan celdas vacías
-        vacias = self.obtener_celdas_vacias()
-        if vacias:
-            self.mostrar_mensaje(screen, font, "No se pueden rellenar más celdas lógicamente", (385, 40))
-            self.mostrar_mensaje(screen, font, "Se rellenarán los espacios con números aleatorios", (385, 70))
-            pygame.display.flip()
-            pygame.time.wait(self.velocidad_ms * 2)
+        if self.eventos:
+            self.eventos.emitir("relleno_fin", vacias=len(self.obtener_celdas_vacias()))
 
-    def inicializar_tablero(self, screen, font):
+    def inicializar_tablero(self):
+        if self.modelo == "libre":
+            vacias = [(i, j) for (i, j) in self.celdas_vacias_originales if self.tablero[i, j] == 0]
+            for (i, j), num in zip(vacias, self.rng.integers(1, self.n + 1, len(vacias)).tolist()):
+                self.tablero[i, j] = num
+            self._pares = None
+        else:
+            # Cada grupo recibe una permutación de sus dígitos faltantes
+            for grupo in self.grupos_vacios():
+                i, j = grupo[0]
+                if self.modelo == "filas":
+                    unidad = self.tablero[i]
+                else:
+                    t = self.tam_caja
+                    unidad = self.tablero[t * (i // t):t * (i // t) + t, t * (j // t):t * (j // t) + t]
+                faltantes = sorted(set(range(1, self.n + 1)) - set(unidad.flatten().tolist()))
+                faltantes = self.rng.permutation(faltantes).tolist()
+                for (i, j), num in zip(grupo, faltantes):
+                    self.tablero[i, j] = num
+            self._pares = self._construir_pares()
+        if self.eventos:
+            self.eventos.emitir("inicializado")
+
+    # Intercambios posibles (i1, j1, i2, j2) dentro de cada grupo, ya normalizados
+    def _construir_pares(self):
+        pares = []
+        for grupo in self.grupos_vacios():
+            pares += [(grupo[a] + grupo[b]) for a in range(len(grupo)) for b in range(a + 1, len(grupo))]
+        return pares
+
+    # Celdas vacías agrupadas por fila o por caja, según el modelo
+    def grupos_vacios(self):
+        grupos = {}
         for (i, j) in self.celdas_vacias_originales:
-            if self.tablero[i, j] == 0:
-                self.tablero[i, j] = random.randint(1, 9)
-        self.dibujar_tablero_pygame(screen, font)
-        pygame.display.flip()
-        pygame.time.wait(self.velocidad_ms)
+            t = self.tam_caja
+            clave = i if self.modelo == "filas" else t * (i // t) + j // t
+            grupos.setdefault(clave, []).append((i, j))
+        return [sorted(grupo) for grupo in grupos.values()]
+
+    def aspiracion(self, movimiento, conflictos):
+        return conflictos < self.mejor_conflictos
 
     def contar_conflictos(self, tablero=None):
         if tablero is None:
+            if self.evaluador is not None:
+                return self.evaluador.conflictos
             tablero = self.tablero
-        conflictos = 0
-        for i in range(9):
-            conflictos += 9 - len(set(tablero[i, :]))
-            conflictos += 9 - len(set(tablero[:, i]))
-        for f in range(0, 9, 3):
-            for c in range(0, 9, 3):
-                subcuadro = tablero[f:f+3, c:c+3].flatten()
-                conflictos += 9 - len(set(subcuadro))
-        return conflictos
+        return contar_conflictos(tablero, self.tam_caja)
 
-    def resolver_tabu_paso_a_paso(self, screen, font):
+    # Fases 1 y 2 y arranque del evaluador, solo al empezar una búsqueda nueva
+    def _preparar_busqueda(self):
+        instr = self.instr
         # Fase 1: Relleno lógico
-        self.rellenar_logicamente(screen, font)
+        if instr:
+            t = instr.inicio()
+        self.rellenar_logicamente()
         self.celdas_vacias_originales = self.obtener_celdas_vacias()
-        
+
         # Fase 2: Inicialización aleatoria
-        self.inicializar_tablero(screen, font)
-        
+        if instr:
+            t = instr.fin("relleno", t)
+        self.inicializar_tablero()
+        if instr:
+            t = instr.fin("inicializacion", t)
+
         # Fase 3: Búsqueda Tabú
-        self.mostrar_mensaje(screen, font, "Iniciando búsqueda Tabú...", (385, 10))
-        pygame.display.flip()
-        pygame.time.wait(self.velocidad_ms)
-        
+        if self.eventos:
+            self.eventos.emitir("tabu_inicio")
+
+        if instr:
+            t = instr.inicio()
+        self.evaluador = EvaluadorIncremental(self.tablero, self.tam_caja)
+        if instr:
+            instr.fin("evaluador", t)
         self.mejor_solucion = self.tablero.copy()
-        self.mejor_conflictos = self.contar_conflictos()
+        self.mejor_conflictos = self.evaluador.conflictos
         self.soluciones_encontradas.append((self.mejor_solucion.copy(), self.mejor_conflictos))
-        
-        while self.mejor_conflictos > 0 and self.iteracion_actual < self.max_iteraciones:
-            vecinos = []
-            celdas_cambiadas = []  # Lista para guardar las celdas que cambian
-            
-            for _ in range(50):
-                vecino = self.tablero.copy()
-                if len(self.celdas_vacias_originales) < 2:
-                    continue
-                (i1, j1), (i2, j2) = random.sample(self.celdas_vacias_originales, 2)
-                vecino[i1, j1], vecino[i2, j2] = vecino[i2, j2], vecino[i1, j1]
-                if (i1, j1, i2, j2) not in self.tabu_lista:
-                    vecinos.append((vecino, (i1, j1, i2, j2)))
-                    celdas_cambiadas.append((i1, j1))  # Añadir celdas cambiadas
-                    celdas_cambiadas.append((i2, j2))
+        if self.traza:
+            self.traza.mejora(self.iteracion_actual, self.mejor_conflictos, self.mejor_solucion)
+
+    # parada (con is_set()) y los límites cortan la llamada, que puede retomarse
+    # con otra llamada; punto guarda el estado para desde_punto().
+    def resolver(self, parada=None, limite_ms=None, limite_evaluaciones=None, punto=None,
+                 cada_iteraciones=1000):
+        instr = self.instr
+        plazo = None if limite_ms is None else time.perf_counter() + limite_ms / 1000
+        self.limite_alcanzado = False
+        if self._actual is None:
+            self._preparar_busqueda()
+        else:
+            # Reanudar: el evaluador se reconstruye a partir del tablero de búsqueda
+            self.tablero = self._actual
+            self.evaluador = EvaluadorIncremental(self.tablero, self.tam_caja)
 
-            if not vecinos:
+        self._vacias = np.array(self.celdas_vacias_originales).reshape(-1, 2)
+        self._tope_tenencia = None
+        if self._pares is not None:
+            self._pares_arr = np.array(self._pares).reshape(-1, 4)
+            # Con pocos intercambios posibles, una tenencia fija los volvería todos tabú
+            self._tope_tenencia = len(self._pares) // 2
+            tenencia = min(self.tabu_lista.tenencia if self.reactivo else self.tabu_tamano, self._tope_tenencia)
+            if tenencia != self.tabu_lista.tenencia:
+                self.tabu_lista.redimensionar(tenencia)
+        if self.reactivo:
+            self._zobrist = Zobrist(0)
+            self._hash = self._zobrist.hash(self.tablero.ravel().tolist())
+            self._frecuencia = np.zeros((self.n, self.n), dtype=np.int32)
+        elegir = self._elegir_lotes if self.modo == "lotes" else self._elegir_incremental
+        evaluaciones_inicio = self.evaluaciones
+        while self.mejor_conflictos > 0 and self.iteracion_actual < self.max_iteraciones:
+            if len(self.celdas_vacias_originales) < 2 or self._pares == []:
+                break
+            if parada is not None and parada.is_set():
+                break
+            if ((plazo is not None and time.perf_counter() >= plazo)
+                    or (limite_evaluaciones is not None
+                        and self.evaluaciones - evaluaciones_inicio >= limite_evaluaciones)):
+                self.limite_alcanzado = True
+                break
+            if instr:
+                t = instr.inicio()
+            eleccion = elegir()
+            if instr:
+                t = instr.fin("vecindario", t)
+            self.evaluaciones += self.vecinos
+            if eleccion is None:
                 break
 
-            # Evaluar vecinos
-            vecinos_conflictos = [(v, m, self.contar_conflictos(v)) for v, m in vecinos]
-            vecinos_conflictos.sort(key=lambda x: x[2])
-            
-            mejor_vecino, movimiento, conflictos_vecino = vecinos_conflictos[0]
-            
+            movimiento, celdas_cambiadas = eleccion
+            conflictos_vecino = self._aplicar(*movimiento)
+            if self.verificar:
+                self.evaluador.verificar()
+            if instr:
+                t = instr.fin("aplicar", t)
+
             # Actualizar mejor solución
             if conflictos_vecino < self.mejor_conflictos:
-                self.mejor_solucion = mejor_vecino.copy()
+                self.mejor_solucion = self.tablero.copy()
                 self.mejor_conflictos = conflictos_vecino
                 self.soluciones_encontradas.append((self.mejor_solucion.copy(), self.mejor_conflictos))
-                
-                # Mostrar alerta de nueva solución
-                self.dibujar_tablero_pygame(screen, font)
-                
-                # Fondo para el mensaje de alerta
-                alerta_rect = pygame.Rect(385, 240, 320, 110)
-                pygame.draw.rect(screen, (200, 255, 200), alerta_rect)
-                pygame.draw.rect(screen, (0, 180, 0), alerta_rect, 3) 
-                
-                # Texto de la alerta
-                texto_alertas = [
-                    f"¡NUEVA MEJOR SOLUCIÓN ENCONTRADA!",
-                    f"Solución #{len(self.soluciones_encontradas)}",
-                    f"Conflictos reducidos a: {self.mejor_conflictos}",
-                    f"Iteración actual: {self.iteracion_actual}"
-                ]
-                
-                for i, texto in enumerate(texto_alertas):
-                    color = (0, 100, 0) if i == 0 else (0, 0, 0)
-                    texto_surface = font.render(texto, True, color)
-                    screen.blit(texto_surface, (410, 250 + i * 25))
-                
-                pygame.display.flip()
-                pygame.time.wait(self.velocidad_ms * 2)
+                if self.traza:
+                    self.traza.mejora(self.iteracion_actual, self.mejor_conflictos, self.mejor_solucion)
+                if instr:
+                    instr.contar("mejoras")
+                    t = instr.fin("copia", t)
+                if self.eventos:
+                    self.eventos.emitir("mejora", conflictos=self.mejor_conflictos, iteracion=self.iteracion_actual)
 
-            # Actualizar tablero actual y lista tabú
-            self.tablero = mejor_vecino.copy()
-            self.tabu_lista.append(movimiento)
-            if len(self.tabu_lista) > self.tabu_tamano:
-                self.tabu_lista.pop(0)
+            # Actualizar lista tabú (el tablero ya se modificó en su lugar)
+            self.tabu_lista.agregar(movimiento)
+            if self.traza:
+                self.traza.iteracion(self.iteracion_actual, conflictos_vecino, self.mejor_conflictos)
+            if self.reactivo:
+                self._reaccionar(conflictos_vecino)
 
-            # Mostrar información de la iteración
-            self.dibujar_tablero_pygame(screen, font, celdas_cambiadas=celdas_cambiadas)
-            self.mostrar_info_iteracion(screen, font)
-            pygame.display.flip()
-            pygame.time.wait(self.velocidad_ms // 2)
+            if self.eventos:
+                if instr:
+                    t = instr.inicio()
+                self.eventos.emitir("iteracion", iteracion=self.iteracion_actual, movimiento=movimiento,
+                                    celdas_cambiadas=celdas_cambiadas, conflictos=conflictos_vecino)
+                if instr:
+                    instr.fin("eventos", t)  # Incluye el dibujo de los visualizadores
 
             self.iteracion_actual += 1
+            if instr:
+                instr.contar("iteraciones")
+            if punto is not None and self.iteracion_actual % cada_iteraciones == 0:
+                self.guardar_punto(punto)
 
-        # Mostrar resultado final
+        if punto is not None:
+            self.guardar_punto(punto)
+        self._actual = self.tablero
         self.tablero = self.mejor_solucion.copy()
-        self.dibujar_tablero_pygame(screen, font)
-        if self.mejor_conflictos == 0:
-            self.mostrar_mensaje(screen, font, "¡Solución encontrada!", (385, 10), color=(0, 200, 0))
-        else:
-            self.mostrar_mensaje(screen, font, "Solución no óptima encontrada", (385, 10), color=(200, 0, 0))
-        
-        self.mostrar_mensaje(screen, font, f"Total iteraciones: {self.iteracion_actual}", (385, 40))
-        self.mostrar_mensaje(screen, font, f"Conflictos finales: {self.mejor_conflictos}", (385, 70))
-        self.mostrar_mensaje(screen, font, f"Mejores soluciones encontradas: {len(self.soluciones_encontradas)}", (385, 100))
-        pygame.display.flip()
-        pygame.time.wait(self.velocidad_ms * 10)
-
-        return self.mejor_conflictos == 0
+        self.evaluador = None
+        resuelto = self.mejor_conflictos == 0
+        if self.eventos:
+            self.eventos.emitir("fin", resuelto=resuelto)
+        return resuelto
 
-    def mostrar_info_iteracion(self, screen, font):
-        self.mostrar_mensaje(screen, font, f"Búsqueda Tabú en progreso...", (385, 10))
-        self.mostrar_mensaje(screen, font, f"Mejores soluciones encontradas: #{len(self.soluciones_encontradas)}", (385, 40))
-        self.mostrar_mensaje(screen, font, f"Mejor solución encontrada: {self.mejor_conflictos} conflictos", (385, 70))
-        self.mostrar_mensaje(screen, font, f"Iteración: {self.iteracion_actual}/{self.max_iteraciones}", (385, 100))
-        self.mostrar_mensaje(screen, font, f"Conflictos actuales: {self.contar_conflictos()}", (385, 130))
+    def _aplicar(self, i1, j1, i2, j2):
+        if self.reactivo:
+            n = self.n
+            self._hash = self._zobrist.intercambiar(self._hash, i1 * n + j1, int(self.tablero[i1, j1]),
+                                                    i2 * n + j2, int(self.tablero[i2, j2]))
+            self._frecuencia[i1, j1] += 1
+            self._frecuencia[i2, j2] += 1
+        return self.evaluador.aplicar_intercambio(i1, j1, i2, j2)
 
-    def mostrar_mensaje(self, screen, font, texto, posicion, color=(0, 0, 0)):
-        texto_surface = font.render(texto, True, color)
-        screen.blit(texto_surface, posicion)
+    # Tenencia y escapes del programador reactivo tras cada iteración
+    def _reaccionar(self, conflictos):
+        reactivo = self.reactivo
+        tenencia = reactivo.observar(self._hash, self.iteracion_actual)
+        if self._tope_tenencia is not None:
+            tenencia = min(tenencia, self._tope_tenencia)
+        if tenencia != self.tabu_lista.tenencia:
+            self.tabu_lista.redimensionar(tenencia)
+        accion = reactivo.progreso(conflictos, self.iteracion_actual)
+        if accion is None:
+            return
+        if accion == "reiniciar":
+            # Volver a la mejor solución con la memoria tabú vacía
+            self.tablero[...] = self.mejor_solucion
+            self.evaluador.recalcular()
+            self._hash = self._zobrist.hash(self.tablero.ravel().tolist())
+            self.tabu_lista.limpiar()
+        # Diversificar: de 4k intercambios al azar, aplicar los k de celdas menos movidas
+        k = reactivo.tamano_escape(len(self.celdas_vacias_originales))
+        i1, j1, i2, j2 = (indices.tolist() for indices in self._muestrear(4 * k))
+        peso = self._frecuencia[i1, j1] + self._frecuencia[i2, j2]
+        for m in np.argsort(peso, kind="stable")[:k].tolist():
+            self._aplicar(i1[m], j1[m], i2[m], j2[m])
+            self.tabu_lista.agregar((i1[m], j1[m], i2[m], j2[m]))
+        if self.instr:
+            self.instr.contar("reinicios" if accion == "reiniciar" else "diversificaciones")
+        if self.evaluador.conflictos < self.mejor_conflictos:
+            self.mejor_solucion = self.tablero.copy()
+            self.mejor_conflictos = self.evaluador.conflictos
+            self.soluciones_encontradas.append((self.mejor_solucion.copy(), self.mejor_conflictos))
+            if self.traza:
+                self.traza.mejora(self.iteracion_actual, self.mejor_conflictos, self.mejor_solucion)
+        if self.eventos:
+            self.eventos.emitir("escape", accion=accion, iteracion=self.iteracion_actual,
+                                conflictos=self.evaluador.conflictos)
 
-    def dibujar_tablero_pygame(self, screen, font, celda_actual=None, celdas_cambiadas=None):
-        # Fondo blanco
-        screen.fill((255, 255, 255))
-        
-        # Dibujar cuadrícula
-        for i in range(10):
-            ancho = 3 if i % 3 == 0 else 1
-            pygame.draw.line(screen, (0, 0, 0), (10, i * 40 + 10), (370, i * 40 + 10), ancho)
-            pygame.draw.line(screen, (0, 0, 0), (i * 40 + 10, 10), (i * 40 + 10, 370), ancho)
+    # Punto de control: tablero de búsqueda, mejor solución, memoria tabú,
+    # estado del generador y contadores, en un .npz comprimido
+    def guardar_punto(self, ruta):
+        actual = self.tablero if self.evaluador is not None else self._actual
+        if actual is None:
+            raise RuntimeError("No hay búsqueda en curso que guardar; llamar antes a resolver()")
+        puntos_control.guardar(
+            ruta, "sudoku",
+            {
+                "tam_caja": self.tam_caja, "modo": self.modo, "modelo": self.modelo, "vecinos": self.vecinos,
+                "tabu_tamano": self.tabu_tamano, "tenencia": self.tabu_lista.tenencia,
+                "iteracion": self.iteracion_actual, "max_iteraciones": self.max_iteraciones,
+                "evaluaciones": self.evaluaciones, "mejor_conflictos": int(self.mejor_conflictos),
+                "rng": puntos_control.estado_rng(self.rng),
+            },
+            tablero=actual, tablero_original=self.tablero_original, mejor=self.mejor_solucion,
+            vacias=np.array(self.celdas_vacias_originales, dtype=np.int32).reshape(-1, 2),
+            tabu=np.array(list(self.tabu_lista), dtype=np.int32).reshape(-1, 4),
+        )
 
-        # Dibujar números
-        for i in range(9):
-            for j in range(9):
-                num = self.tablero[i, j]
-                if num != 0:
-                    color = (0, 0, 255) if self.tablero_original[i, j] != 0 else (0, 128, 0)
-                    texto = font.render(str(num), True, color)
-                    screen.blit(texto, (j * 40 + 25, i * 40 + 20))
+    # Reconstruye una búsqueda desde un punto de control; resolver() la continúa
+    @classmethod
+    def desde_punto(cls, ruta, observador=None, verificar=False, instrumentacion=None, traza=None):
+        meta, arreglos = puntos_control.cargar(ruta, "sudoku")
+        juego = cls(arreglos["tablero_original"], verificar=verificar, observador=observador,
+                    tabu_tamano=meta["tabu_tamano"], modo=meta["modo"], vecinos=meta["vecinos"],
+                    modelo=meta["modelo"], tam_caja=meta["tam_caja"], instrumentacion=instrumentacion,
+                    traza=traza)
+        juego.rng = puntos_control.rng_desde_estado(meta["rng"])
+        juego.celdas_vacias_originales = [tuple(celda) for celda in arreglos["vacias"].tolist()]
+        if juego.modelo != "libre":
+            juego._pares = juego._construir_pares()
+        juego.tabu_lista.redimensionar(meta["tenencia"])
+        for clave in arreglos["tabu"].tolist():
+            juego.tabu_lista.agregar(tuple(clave))
+        juego.iteracion_actual = meta["iteracion"]
+        juego.max_iteraciones = meta["max_iteraciones"]
+        juego.evaluaciones = meta["evaluaciones"]
+        juego.mejor_solucion = arreglos["mejor"].astype(juego.tablero.dtype)
+        juego.mejor_conflictos = meta["mejor_conflictos"]
+        juego.soluciones_encontradas.append((juego.mejor_solucion.copy(), juego.mejor_conflictos))
+        juego._actual = arreglos["tablero"].astype(juego.tablero.dtype)
+        juego.tablero = juego.mejor_solucion.copy()
+        return juego
 
-        # Resaltar celdas cambiadas (nuevo)
-        if celdas_cambiadas:
-            for i, j in celdas_cambiadas:
-                pygame.draw.rect(screen, (255, 100, 0), (j * 40 + 10, i * 40 + 10, 40, 40), 3)  # Naranja
+    # Muestrea K intercambios de una vez con el generador de la instancia;
+    # devuelve cuatro arreglos de índices con claves ya normalizadas
+    def _muestrear(self, k):
+        if self._pares is not None:
+            return self._pares_arr[self.rng.integers(0, len(self._pares_arr), k)].T
+        vacias = self._vacias
+        n = len(vacias)
+        p1 = self.rng.integers(0, n, k)
+        p2 = self.rng.integers(0, n - 1, k)
+        p2 += p2 >= p1  # Dos celdas distintas
+        # Las celdas vacías están en orden de fila, así que min/max normaliza la clave
+        p1, p2 = np.minimum(p1, p2), np.maximum(p1, p2)
+        return vacias[p1, 0], vacias[p1, 1], vacias[p2, 0], vacias[p2, 1]
 
-        # Resaltar celda actual si se especifica (original)
-        if celdas_cambiadas:
-            # Eliminar duplicados manteniendo el orden
-            celdas_unicas = list(dict.fromkeys(celdas_cambiadas))
-            for i, j in celdas_unicas:
-                pygame.draw.rect(screen, (255, 165, 0), (j * 40 + 10, i * 40 + 10, 40, 40), 3)
+    # Evalúa los vecinos muestreados de uno en uno y elige el mejor no tabú
+    def _elegir_incremental(self):
+        candidatos = []
+        celdas_cambiadas = []  # Lista para guardar las celdas que cambian
+        for i1, j1, i2, j2 in zip(*(indices.tolist() for indices in self._muestrear(self.vecinos))):
+            # Evaluación incremental del intercambio, sin copiar el tablero
+            delta = self.evaluador.delta_intercambio(i1, j1, i2, j2)
+            if not self.tabu_lista.es_tabu((i1, j1, i2, j2), self.evaluador.conflictos + delta):
+                candidatos.append(((i1, j1, i2, j2), delta))
+                celdas_cambiadas.append((i1, j1))  # Añadir celdas cambiadas
+                celdas_cambiadas.append((i2, j2))
+        if self.instr:
+            self.instr.contar("vecinos", self.vecinos)
+            self.instr.contar("evaluaciones", self.vecinos)
+            self.instr.contar("rechazos_tabu", self.vecinos - len(candidatos))
+        if not candidatos:
+            return None
+        # Elegir el mejor vecino (el primero en caso de empate)
+        movimiento, _ = min(candidatos, key=lambda x: x[1])
+        return movimiento, celdas_cambiadas
 
-def main():
-    pygame.init()
-    screen = pygame.display.set_mode((800, 400))
-    pygame.display.set_caption("Resolución de Sudoku con Búsqueda Tabú")
-    font = pygame.font.SysFont("Arial", 16)
-    font_bold = pygame.font.SysFont("Arial", 16, bold=True)
+    # Evalúa los K intercambios muestreados en una sola pasada
+    def _elegir_lotes(self):
+        i1, j1, i2, j2 = self._muestrear(self.vecinos)
+        deltas = self.evaluador.delta_lote(i1, j1, i2, j2)
+        conflictos = self.evaluador.conflictos
+        if self.instr:
+            self.instr.contar("vecinos", self.vecinos)
+            self.instr.contar("evaluaciones", self.vecinos)
+        # En orden de delta, el primer movimiento no tabú es el argmin entre los admisibles
+        for rechazos, k in enumerate(np.argsort(deltas, kind="stable")):
+            movimiento = (int(i1[k]), int(j1[k]), int(i2[k]), int(j2[k]))
+            if not self.tabu_lista.es_tabu(movimiento, conflictos + int(deltas[k])):
+                if self.instr:
+                    self.instr.contar("rechazos_tabu", rechazos)
+                return movimiento, [movimiento[:2], movimiento[2:]]
+        if self.instr:
+            self.instr.contar("rechazos_tabu", self.vecinos)
+        return None
 
-    sudoku = [
-        [5, 0, 7, 6, 0, 0, 0, 3, 4],
-        [0, 0, 9, 0, 0, 4, 0, 0, 0],
-        [3, 0, 6, 2, 0, 5, 0, 9, 0],
-        [6, 0, 2, 0, 0, 0, 0, 1, 0],
-        [0, 3, 8, 0, 0, 6, 0, 4, 7],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-        [0, 9, 0, 0, 0, 0, 0, 7, 8],
-        [7, 0, 3, 4, 0, 0, 5, 6, 0],
-        [0, 0, 0, 0, 0, 0, 0, 0, 0],
-    ]
-
-    velocidad = 500  # Velocidad de visualización en ms
-    juego = SudokuTabu(sudoku, velocidad_ms=velocidad)
-
-    # Dibujar tablero inicial
-    screen.fill((255, 255, 255))
-    juego.dibujar_tablero_pygame(screen, font)
-    juego.mostrar_mensaje(screen, font_bold, "Tablero inicial de Sudoku", (385, 20))
-    pygame.display.flip()
-    pygame.time.wait(velocidad * 2)
-
-    # Resolver el sudoku
-    solucion_encontrada = juego.resolver_tabu_paso_a_paso(screen, font)
-
-    corriendo = True
-    while corriendo:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                corriendo = False
-        
-        if solucion_encontrada:
-            juego.mostrar_mensaje(screen, font, "¡Solución encontrada!", (385, 130), color=(0, 200, 0))
-        else:
-            juego.mostrar_mensaje(screen, font, "Solución no óptima encontrada", (385, 130), color=(200, 0, 0))
-        
-        pygame.display.flip()
-        pygame.time.wait(100)
-
-    pygame.quit()
+    # Compatibilidad: resolver mostrando cada paso en una ventana de pygame
+    def resolver_tabu_paso_a_paso(self, screen, font):
+        from sudoku_visual import VisorSudoku
+        visor = self.eventos.suscribir(VisorSudoku(self, screen, font, self.velocidad_ms))
+        try:
+            return self.resolver()
+        finally:
+            self.eventos.desuscribir(visor)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    from sudoku_visual import main
+    main()
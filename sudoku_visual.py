@@ -0,0 +1,169 @@
+import pygame
+from renderizado import BLANCO, CacheSuperficies, Refresco, RenderTablero
+from sudoku_tabu_search import SudokuTabu, SUDOKU_EJEMPLO
+
+# Zona de mensajes a la derecha del tablero
+PANEL = pygame.Rect(380, 0, 420, 400)
+
+# Visualizador de pygame: observador de los eventos de paso de SudokuTabu.
+# Solo repinta las celdas que cambian y actualiza sus rectángulos; con
+# velocidad_ms=0 no espera entre iteraciones y salta cuadros por encima de fps.
+class VisorSudoku:
+    def __init__(self, juego, screen, font, velocidad_ms=500, fps=60):
+        self.juego = juego
+        self.screen = screen
+        self.font = font
+        self.velocidad_ms = velocidad_ms
+        self.cache = CacheSuperficies()
+        self.refresco = Refresco(fps)
+        self.render = RenderTablero(screen, font, juego.tam_caja, cache=self.cache, refresco=self.refresco)
+
+    def __call__(self, tipo, datos):
+        manejador = getattr(self, "en_" + tipo, None)
+        if manejador is not None:
+            manejador(**datos)
+
+    def en_relleno_inicio(self):
+        self.mostrar_mensaje("Iniciando relleno lógico...", (385, 10))
+
+    def en_relleno(self, celda, num):
+        if not self.velocidad_ms and not self.refresco.toca():
+            return
+        self.dibujar_tablero_pygame(celda_actual=celda)
+        self.mostrar_mensaje(f"Rellenando ({celda[0]},{celda[1]}) con {num}", (385, 10))
+        self.refresco.actualizar()
+        pygame.time.wait(self.velocidad_ms)
+
+    def en_relleno_fin(self, vacias):
+        # Verificar si quedan celdas vacías
+        if vacias:
+            self.mostrar_mensaje("No se pueden rellenar más celdas lógicamente", (385, 40))
+            self.mostrar_mensaje("Se rellenarán los espacios con números aleatorios", (385, 70))
+            self.refresco.actualizar()
+            pygame.time.wait(self.velocidad_ms * 2)
+
+    def en_inicializado(self):
+        self.dibujar_tablero_pygame()
+        self.refresco.actualizar()
+        pygame.time.wait(self.velocidad_ms)
+
+    def en_tabu_inicio(self):
+        self.mostrar_mensaje("Iniciando búsqueda Tabú...", (385, 10))
+        self.refresco.actualizar()
+        pygame.time.wait(self.velocidad_ms)
+
+    def en_mejora(self, conflictos, iteracion):
+        if not self.velocidad_ms and not self.refresco.toca():
+            return
+        # Mostrar alerta de nueva solución
+        self.dibujar_tablero_pygame()
+
+        # Fondo para el mensaje de alerta
+        alerta_rect = pygame.Rect(385, 240, 320, 110)
+        pygame.draw.rect(self.screen, (200, 255, 200), alerta_rect)
+        pygame.draw.rect(self.screen, (0, 180, 0), alerta_rect, 3)
+
+        # Texto de la alerta
+        texto_alertas = [
+            f"¡NUEVA MEJOR SOLUCIÓN ENCONTRADA!",
+            f"Solución #{len(self.juego.soluciones_encontradas)}",
+            f"Conflictos reducidos a: {conflictos}",
+            f"Iteración actual: {iteracion}"
+        ]
+
+        for i, texto in enumerate(texto_alertas):
+            color = (0, 100, 0) if i == 0 else (0, 0, 0)
+            self.screen.blit(self.cache.texto(self.font, texto, color), (410, 250 + i * 25))
+
+        self.refresco.actualizar()
+        pygame.time.wait(self.velocidad_ms * 2)
+
+    def en_iteracion(self, iteracion, movimiento, celdas_cambiadas, conflictos):
+        if not self.velocidad_ms and not self.refresco.toca():
+            return
+        # Mostrar información de la iteración
+        self.dibujar_tablero_pygame(celdas_cambiadas=celdas_cambiadas)
+        self.mostrar_info_iteracion()
+        self.refresco.actualizar()
+        pygame.time.wait(self.velocidad_ms // 2)
+
+    def en_fin(self, resuelto):
+        # Mostrar resultado final
+        juego = self.juego
+        self.dibujar_tablero_pygame()
+        if resuelto:
+            self.mostrar_mensaje("¡Solución encontrada!", (385, 10), color=(0, 200, 0))
+        else:
+            self.mostrar_mensaje("Solución no óptima encontrada", (385, 10), color=(200, 0, 0))
+
+        self.mostrar_mensaje(f"Total iteraciones: {juego.iteracion_actual}", (385, 40))
+        self.mostrar_mensaje(f"Conflictos finales: {juego.mejor_conflictos}", (385, 70))
+        self.mostrar_mensaje(f"Mejores soluciones encontradas: {len(juego.soluciones_encontradas)}", (385, 100))
+        self.refresco.actualizar()
+        pygame.time.wait(self.velocidad_ms * 10)
+
+    def mostrar_info_iteracion(self):
+        juego = self.juego
+        self.mostrar_mensaje(f"Búsqueda Tabú en progreso...", (385, 10))
+        self.mostrar_mensaje(f"Mejores soluciones encontradas: #{len(juego.soluciones_encontradas)}", (385, 40))
+        self.mostrar_mensaje(f"Mejor solución encontrada: {juego.mejor_conflictos} conflictos", (385, 70))
+        self.mostrar_mensaje(f"Iteración: {juego.iteracion_actual}/{juego.max_iteraciones}", (385, 100))
+        self.mostrar_mensaje(f"Conflictos actuales: {juego.contar_conflictos()}", (385, 130))
+
+    def mostrar_mensaje(self, texto, posicion, color=(0, 0, 0), font=None):
+        texto_surface = self.cache.texto(font or self.font, texto, color)
+        self.refresco.marcar(self.screen.blit(texto_surface, posicion))
+
+    # Borrar los mensajes anteriores sin tocar el tablero
+    def limpiar_panel(self):
+        self.screen.fill(BLANCO, PANEL)
+        self.refresco.marcar(PANEL)
+
+    # Repinta solo las celdas cuyo dígito o resaltado cambió y limpia el panel
+    def dibujar_tablero_pygame(self, celda_actual=None, celdas_cambiadas=None):
+        resaltadas = list(celdas_cambiadas or [])
+        if celda_actual is not None:
+            resaltadas.append(celda_actual)
+        self.limpiar_panel()
+        self.render.dibujar(self.juego.tablero, self.juego.tablero_original, resaltadas)
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 400))
+    pygame.display.set_caption("Resolución de Sudoku con Búsqueda Tabú")
+    font = pygame.font.SysFont("Arial", 16)
+    font_bold = pygame.font.SysFont("Arial", 16, bold=True)
+
+    velocidad = 500  # Velocidad de visualización en ms
+    juego = SudokuTabu(SUDOKU_EJEMPLO)
+    visor = VisorSudoku(juego, screen, font, velocidad_ms=velocidad)
+    juego.eventos.suscribir(visor)
+
+    # Dibujar tablero inicial
+    screen.fill((255, 255, 255))
+    visor.dibujar_tablero_pygame()
+    visor.mostrar_mensaje("Tablero inicial de Sudoku", (385, 20), font=font_bold)
+    visor.refresco.actualizar()
+    pygame.time.wait(velocidad * 2)
+
+    # Resolver el sudoku
+    solucion_encontrada = juego.resolver()
+
+    corriendo = True
+    while corriendo:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                corriendo = False
+
+        if solucion_encontrada:
+            visor.mostrar_mensaje("¡Solución encontrada!", (385, 130), color=(0, 200, 0))
+        else:
+            visor.mostrar_mensaje("Solución no óptima encontrada", (385, 130), color=(200, 0, 0))
+
+        visor.refresco.actualizar()
+        pygame.time.wait(100)
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
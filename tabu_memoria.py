@@ -0,0 +1,107 @@
+import random
+
+# Memoria tabú compartida por los tres resolvedores: un conjunto hash para
+# consultar en O(1) y un búfer circular para expulsar en orden FIFO.
+# Se guardan atributos (claves de movimiento o hashes Zobrist), no soluciones
+# completas; clave() traduce lo que se añade a su atributo.
+class MemoriaTabu:
+    def __init__(self, tenencia, clave=None, aspiracion=None):
+        self.tenencia = tenencia
+        self.clave = clave
+        # aspiracion(elemento, valor) -> True permite un elemento aunque sea tabú
+        self.aspiracion = aspiracion
+        self._anillo = [None] * tenencia
+        self._inicio = 0
+        self._tamano = 0
+        self._conteo = {}  # clave -> ocurrencias dentro del anillo
+
+    def _clave(self, elemento):
+        return elemento if self.clave is None else self.clave(elemento)
+
+    def agregar(self, elemento):
+        if self.tenencia <= 0:
+            return
+        clave = self._clave(elemento)
+        if self._tamano == self.tenencia:
+            self._expulsar()
+        self._anillo[(self._inicio + self._tamano) % self.tenencia] = clave
+        self._tamano += 1
+        self._conteo[clave] = self._conteo.get(clave, 0) + 1
+
+    # Alias para que la memoria sustituya directamente a una lista o deque
+    append = agregar
+
+    def _expulsar(self):
+        clave = self._anillo[self._inicio]
+        self._anillo[self._inicio] = None
+        self._inicio = (self._inicio + 1) % self.tenencia
+        self._tamano -= 1
+        restantes = self._conteo[clave] - 1
+        if restantes:
+            self._conteo[clave] = restantes
+        else:
+            del self._conteo[clave]
+
+    def __contains__(self, elemento):
+        return self._clave(elemento) in self._conteo
+
+    def contiene_clave(self, clave):
+        return clave in self._conteo
+
+    # Tabú salvo que el criterio de aspiración lo permita
+    def es_tabu(self, elemento, valor=None):
+        if self._clave(elemento) not in self._conteo:
+            return False
+        return not (self.aspiracion is not None and self.aspiracion(elemento, valor))
+
+    def __len__(self):
+        return self._tamano
+
+    # Claves de la más antigua a la más reciente
+    def __iter__(self):
+        for k in range(self._tamano):
+            yield self._anillo[(self._inicio + k) % self.tenencia]
+
+    def limpiar(self):
+        self._anillo = [None] * self.tenencia
+        self._inicio = 0
+        self._tamano = 0
+        self._conteo.clear()
+
+    # Cambiar la tenencia conservando las claves más recientes
+    def redimensionar(self, tenencia):
+        claves = list(self)[-tenencia:] if tenencia > 0 else []
+        self.tenencia = tenencia
+        self.limpiar()
+        for clave in claves:
+            self._anillo[self._tamano] = clave
+            self._tamano += 1
+            self._conteo[clave] = self._conteo.get(clave, 0) + 1
+
+
+# Hash Zobrist: cada par (posición, valor) recibe 64 bits aleatorios y el hash
+# de un estado es el XOR de los suyos, actualizable en O(1) tras un cambio.
+class Zobrist:
+    def __init__(self, semilla=None):
+        self._rng = random.Random(semilla)
+        self._tabla = {}
+
+    def valor(self, posicion, valor):
+        clave = (posicion, valor)
+        z = self._tabla.get(clave)
+        if z is None:
+            z = self._tabla[clave] = self._rng.getrandbits(64)
+        return z
+
+    def hash(self, estado):
+        h = 0
+        for posicion, valor in enumerate(estado):
+            h ^= self.valor(posicion, valor)
+        return h
+
+    def actualizar(self, h, posicion, anterior, nuevo):
+        return h ^ self.valor(posicion, anterior) ^ self.valor(posicion, nuevo)
+
+    # Hash tras intercambiar los valores de dos posiciones
+    def intercambiar(self, h, p1, v1, p2, v2):
+        return self.actualizar(self.actualizar(h, p1, v1, v2), p2, v2, v1)
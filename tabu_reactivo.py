@@ -0,0 +1,98 @@
+import math
+from collections import OrderedDict
+
+# Búsqueda tabú reactiva: la tenencia se ajusta sola según los ciclos que se
+# detectan con los hashes de los estados visitados. Volver a un estado visto
+# hace poco alarga la tenencia; una racha sin repeticiones la acorta. Si la
+# mejor solución no mejora en `estancamiento` iteraciones (o un estado se
+# repite demasiadas veces) se pide un escape: primero "diversificar" (el
+# resolvedor aplica movimientos poco usados según su memoria de frecuencias)
+# y, tras `reiniciar_tras` escapes seguidos sin mejora, "reiniciar" (volver a
+# la mejor solución y perturbarla).
+#
+# El programador no sabe nada del problema: cada resolvedor le pasa el hash
+# de su estado y su valor en cada iteración y aplica la tenencia y los
+# escapes a su manera (ver `reactivo` en SudokuTabu, horarios_tabu.busqueda_tabu
+# y laberinto_motor.busqueda_tabu). Un programador se usa en una sola búsqueda.
+class TabuReactivo:
+    def __init__(self, tenencia=10, minimo=1, maximo=None, aumento=1.2, reduccion=0.9, ventana=None,
+                 estancamiento=500, reiniciar_tras=2, repeticiones_escape=3, movimientos_escape=None,
+                 max_estados=100000):
+        self.tenencia = tenencia
+        self.minimo = minimo
+        self.maximo = maximo or 10 * tenencia
+        self.aumento = aumento
+        self.reduccion = reduccion
+        # Una repetición cuenta como ciclo si ocurre a menos de `ventana` iteraciones
+        self.ventana = ventana
+        self.estancamiento = estancamiento
+        self.reiniciar_tras = reiniciar_tras
+        self.repeticiones_escape = repeticiones_escape
+        self.movimientos_escape = movimientos_escape
+        self.max_estados = max_estados
+        self._vistos = OrderedDict()  # hash -> [última iteración, veces visto], con expulsión LRU
+        self._ciclo_medio = None
+        self._ultimo_cambio = 0
+        self._atrapado = False
+        self.mejor = math.inf
+        self._ultima_mejora = 0
+        self._escapes = 0
+        self.estadisticas = {"repeticiones": 0, "aumentos": 0, "reducciones": 0,
+                             "diversificaciones": 0, "reinicios": 0}
+
+    # Registra el estado de la iteración y devuelve la tenencia a usar
+    def observar(self, hash_estado, iteracion):
+        visto = self._vistos.get(hash_estado)
+        if visto is None:
+            self._vistos[hash_estado] = [iteracion, 1]
+            if len(self._vistos) > self.max_estados:
+                self._vistos.popitem(last=False)
+        else:
+            ciclo = iteracion - visto[0]
+            visto[0] = iteracion
+            visto[1] += 1
+            self._vistos.move_to_end(hash_estado)
+            if ciclo <= (self.ventana or 2 * self.maximo):
+                self.estadisticas["repeticiones"] += 1
+                self._ciclo_medio = ciclo if self._ciclo_medio is None else 0.9 * self._ciclo_medio + 0.1 * ciclo
+                nueva = min(self.maximo, max(self.tenencia + 1, math.ceil(self.tenencia * self.aumento)))
+                if nueva != self.tenencia:
+                    self.tenencia = nueva
+                    self.estadisticas["aumentos"] += 1
+                self._ultimo_cambio = iteracion
+                if visto[1] >= self.repeticiones_escape:
+                    self._atrapado = True
+                return self.tenencia
+        # Sin ciclos durante más que el ciclo medio: acortar la tenencia
+        calma = self._ciclo_medio or 2 * self.tenencia
+        if iteracion - self._ultimo_cambio > calma and self.tenencia > self.minimo:
+            self.tenencia = max(self.minimo, min(self.tenencia - 1, math.floor(self.tenencia * self.reduccion)))
+            self.estadisticas["reducciones"] += 1
+            self._ultimo_cambio = iteracion
+        return self.tenencia
+
+    # Registra el valor (menor es mejor) y devuelve None, "diversificar" o "reiniciar"
+    def progreso(self, valor, iteracion):
+        if valor < self.mejor:
+            self.mejor = valor
+            self._ultima_mejora = iteracion
+            self._escapes = 0
+            return None
+        if not self._atrapado and iteracion - self._ultima_mejora < self.estancamiento:
+            return None
+        self._atrapado = False
+        self._ultima_mejora = iteracion
+        self._vistos.clear()
+        self._escapes += 1
+        if self._escapes >= self.reiniciar_tras:
+            self._escapes = 0
+            self.estadisticas["reinicios"] += 1
+            return "reiniciar"
+        self.estadisticas["diversificaciones"] += 1
+        return "diversificar"
+
+    # Movimientos aleatorios de un escape para un problema de n elementos móviles
+    def tamano_escape(self, n):
+        if self.movimientos_escape is not None:
+            return self.movimientos_escape
+        return max(2, n // 10)
@@ -0,0 +1,189 @@
+import argparse
+import json
+import struct
+import sys
+from collections import deque
+import numpy as np
+
+# Historial con memoria acotada y trazas en disco. Los resolvedores guardan en
+# memoria solo las últimas mejores soluciones y una serie de conflictos de
+# tamaño fijo; el registro completo (estadísticas por iteración y cada mejora
+# como diferencia respecto a la mejor anterior) se escribe a medida que ocurre
+# en una traza JSONL o binaria.
+
+# Últimas `maximo` mejores soluciones (solucion, conflictos); len() cuenta
+# todas las registradas, también las ya descartadas
+class HistorialAcotado:
+    def __init__(self, maximo=16):
+        self.recientes = deque(maxlen=maximo)
+        self.total = 0
+
+    def append(self, elemento):
+        self.recientes.append(elemento)
+        self.total += 1
+
+    def __len__(self):
+        return self.total
+
+    def __iter__(self):
+        return iter(self.recientes)
+
+    def __getitem__(self, k):
+        return self.recientes[k]
+
+
+# Serie de valores por iteración que nunca supera `maximo` puntos: al llenarse
+# se queda con uno de cada dos y duplica el paso, así que siempre cubre la
+# corrida entera con resolución decreciente. len() es el número de valores
+# añadidos; al iterar se obtienen los conservados (iteraciones 0, paso, 2·paso...).
+class SerieAcotada:
+    def __init__(self, maximo=10000, valores=(), paso=1, total=0):
+        self.maximo = max(2, maximo)
+        self.valores = list(valores)
+        self.paso = paso
+        self.total = total
+
+    def append(self, valor):
+        if self.total % self.paso == 0:
+            self.valores.append(valor)
+            if len(self.valores) > self.maximo:
+                self.valores = self.valores[::2]
+                self.paso *= 2
+        self.total += 1
+
+    def __len__(self):
+        return self.total
+
+    def __iter__(self):
+        return iter(self.valores)
+
+    # Iteración de cada valor conservado, para graficar
+    def iteraciones(self):
+        return range(0, len(self.valores) * self.paso, self.paso)
+
+
+# Destino de traza común: iteracion() registra una de cada `cada` iteraciones
+# y mejora() guarda la nueva mejor solución (un arreglo cualquiera, se aplana)
+# como las posiciones que cambiaron respecto a la anterior
+class _Traza:
+    def __init__(self, archivo, cada=1):
+        self.cada = max(1, cada)
+        self._propio = isinstance(archivo, str)
+        self.archivo = open(archivo, self._modo) if self._propio else archivo
+        self._anterior = None
+
+    def iteracion(self, iteracion, conflictos, mejor):
+        if iteracion % self.cada == 0:
+            self._escribir_iteracion(int(iteracion), int(conflictos), int(mejor))
+
+    def mejora(self, iteracion, conflictos, solucion):
+        solucion = np.asarray(solucion).ravel().astype(np.int32)
+        if self._anterior is None or self._anterior.size != solucion.size:
+            self._anterior = np.zeros_like(solucion)
+        posiciones = np.flatnonzero(solucion != self._anterior).astype(np.uint32)
+        self._escribir_mejora(int(iteracion), int(conflictos), solucion.size, posiciones, solucion[posiciones])
+        self._anterior = solucion
+
+    def cerrar(self):
+        if self._propio:
+            self.archivo.close()
+        else:
+            self.archivo.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+# Una línea JSON por registro
+class TrazaJSONL(_Traza):
+    _modo = "w"
+
+    def _escribir_iteracion(self, iteracion, conflictos, mejor):
+        self.archivo.write(json.dumps({"tipo": "iteracion", "iteracion": iteracion, "conflictos": conflictos,
+                                       "mejor": mejor}) + "\n")
+
+    def _escribir_mejora(self, iteracion, conflictos, tamano, posiciones, valores):
+        self.archivo.write(json.dumps({"tipo": "mejora", "iteracion": iteracion, "conflictos": conflictos,
+                                       "tamano": tamano, "posiciones": posiciones.tolist(),
+                                       "valores": valores.tolist()}) + "\n")
+
+
+# Formato binario: cabecera MAGICO y registros de tamaño fijo con struct;
+# una mejora va seguida de sus posiciones (uint32) y valores (int32)
+MAGICO = b"TRZ1"
+_ITERACION = struct.Struct("<BIii")  # tipo, iteración, conflictos, mejor
+_MEJORA = struct.Struct("<BIiII")  # tipo, iteración, conflictos, tamaño, cambios
+_TIPO_ITERACION, _TIPO_MEJORA = 0, 1
+
+class TrazaBinaria(_Traza):
+    _modo = "wb"
+
+    def __init__(self, archivo, cada=1):
+        super().__init__(archivo, cada)
+        self.archivo.write(MAGICO)
+
+    def _escribir_iteracion(self, iteracion, conflictos, mejor):
+        self.archivo.write(_ITERACION.pack(_TIPO_ITERACION, iteracion, conflictos, mejor))
+
+    def _escribir_mejora(self, iteracion, conflictos, tamano, posiciones, valores):
+        self.archivo.write(_MEJORA.pack(_TIPO_MEJORA, iteracion, conflictos, tamano, len(posiciones)))
+        self.archivo.write(posiciones.astype("<u4").tobytes())
+        self.archivo.write(valores.astype("<i4").tobytes())
+
+
+# .jsonl da una traza de texto; cualquier otra extensión, la binaria
+def abrir_traza(ruta, cada=1):
+    if ruta.endswith(".jsonl"):
+        return TrazaJSONL(ruta, cada)
+    return TrazaBinaria(ruta, cada)
+
+# Registros de una traza de cualquiera de los dos formatos, como diccionarios
+def leer_traza(ruta):
+    with open(ruta, "rb") as archivo:
+        if archivo.read(len(MAGICO)) != MAGICO:
+            archivo.seek(0)
+            for linea in archivo:
+                if linea.strip():
+                    yield json.loads(linea)
+            return
+        while True:
+            tipo = archivo.read(1)
+            if not tipo:
+                return
+            if tipo[0] == _TIPO_ITERACION:
+                _, iteracion, conflictos, mejor = _ITERACION.unpack(tipo + archivo.read(_ITERACION.size - 1))
+                yield {"tipo": "iteracion", "iteracion": iteracion, "conflictos": conflictos, "mejor": mejor}
+            else:
+                _, iteracion, conflictos, tamano, cambios = _MEJORA.unpack(tipo + archivo.read(_MEJORA.size - 1))
+                posiciones = np.frombuffer(archivo.read(4 * cambios), dtype="<u4")
+                valores = np.frombuffer(archivo.read(4 * cambios), dtype="<i4")
+                yield {"tipo": "mejora", "iteracion": iteracion, "conflictos": conflictos, "tamano": tamano,
+                       "posiciones": posiciones.tolist(), "valores": valores.tolist()}
+
+# Reconstruye cada mejor solución aplicando las diferencias en orden;
+# genera (iteración, conflictos, solución aplanada)
+def soluciones(ruta):
+    actual = None
+    for registro in leer_traza(ruta):
+        if registro["tipo"] != "mejora":
+            continue
+        if actual is None or actual.size != registro["tamano"]:
+            actual = np.zeros(registro["tamano"], dtype=np.int32)
+        actual[registro["posiciones"]] = registro["valores"]
+        yield registro["iteracion"], registro["conflictos"], actual.copy()
+
+def main():
+    parser = argparse.ArgumentParser(description="Volcar una traza (JSONL o binaria) como JSONL")
+    parser.add_argument("traza")
+    parser.add_argument("--solo-mejoras", action="store_true")
+    args = parser.parse_args()
+    for registro in leer_traza(args.traza):
+        if args.solo_mejoras and registro["tipo"] != "mejora":
+            continue
+        sys.stdout.write(json.dumps(registro) + "\n")
+
+if __name__ == "__main__":
+    main()